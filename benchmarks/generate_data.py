@@ -0,0 +1,173 @@
+"""Deterministic synthetic tracker data, from a few thousand to a million employees.
+
+    python -m benchmarks.generate_data --employees 100000 --db bench.db
+"""
+import argparse
+import time
+
+import numpy as np
+import pandas as pd
+
+import schema
+from indexes import RoleIndex
+from storage import TABLES, Storage
+
+# Dates are laid out around this day so a given seed always yields the same tables
+REFERENCE_DATE = pd.Timestamp('2025-01-01')
+
+# Catalog sizes stay fixed; per-employee rows scale with the workforce
+TRAININGS = 40
+UNIVERSAL_TRAININGS = 3
+SKILLS = 25
+EXTRA_ASSIGNMENTS_PER_EMPLOYEE = 1.5
+CERTIFICATIONS_PER_EMPLOYEE = 1.2
+SKILLS_PER_EMPLOYEE = 4
+
+# Share of employees, the most recently added, whose mandatory trainings are
+# not assigned yet, so auto-assignment has real work to do
+UNASSIGNED_SHARE = 0.01
+
+FIRST_NAMES = ['James', 'Mary', 'John', 'Patricia', 'Robert', 'Jennifer', 'Michael', 'Linda', 'David',
+               'Elizabeth', 'William', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica', 'Thomas', 'Sarah']
+LAST_NAMES = ['Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis', 'Rodriguez',
+              'Martinez', 'Hernandez', 'Lopez', 'Wilson', 'Anderson', 'Thomas', 'Taylor', 'Moore', 'Lee']
+CERT_NAMES = ['First Aid', 'CPR', 'Forklift License', 'OSHA 10', 'OSHA 30', 'Hazmat Handling',
+              'Fire Safety', 'PMP', 'Six Sigma Green Belt', 'ISO 9001 Auditor']
+CERT_ORGANIZATIONS = ['Red Cross', 'OSHA', 'PMI', 'ASQ', 'NFPA', 'Industry Council']
+
+
+def _days(rng, low, high, size):
+    return pd.to_timedelta(rng.integers(low, high, size), unit='D')
+
+
+def _role_lists(rng, count, universal):
+    """required_for_roles entries: the first `universal` are 'All', the rest one or two roles"""
+    lists = ['All'] * universal
+    for _ in range(count - universal):
+        lists.append(','.join(rng.choice(schema.ROLES, size=rng.integers(1, 3), replace=False)))
+    return lists
+
+
+def generate(employees, seed=0):
+    """Every tracker table for a workforce of the given size, as typed DataFrames"""
+    rng = np.random.default_rng(seed)
+    n = employees
+    employee_ids = np.arange(1, n + 1)
+
+    first = rng.choice(FIRST_NAMES, n)
+    last = rng.choice(LAST_NAMES, n)
+    employee_df = pd.DataFrame({
+        'employee_id': employee_ids,
+        'name': pd.Series(first) + ' ' + pd.Series(last),
+        'role': rng.choice(schema.ROLES, n, p=[.08, .07, .2, .3, .05, .1, .15, .05]),
+        'department': rng.choice(schema.DEPARTMENTS, n),
+        'email': pd.Series(first).str.lower() + '.' + pd.Series(last).str.lower() + employee_ids.astype(str) + '@company.com',
+        'hire_date': REFERENCE_DATE - _days(rng, 30, 365 * 15, n),
+        'status': rng.choice(schema.EMPLOYEE_STATUSES, n, p=[.93, .07]),
+        'phone': pd.Series(rng.integers(1000000, 9999999, n)).astype(str).str.replace(r'^(\d{3})', r'\1-', regex=True),
+    })
+
+    training_df = pd.DataFrame({
+        'training_id': np.arange(1, TRAININGS + 1),
+        'training_name': [f"Training Module {i}" for i in range(1, TRAININGS + 1)],
+        'description': [f"Course material for module {i}" for i in range(1, TRAININGS + 1)],
+        'duration_hours': rng.integers(1, 17, TRAININGS),
+        'required_for_roles': _role_lists(rng, TRAININGS, UNIVERSAL_TRAININGS),
+        'frequency': rng.choice(schema.FREQUENCIES, TRAININGS),
+        'compliance_type': rng.choice(schema.COMPLIANCE_TYPES, TRAININGS),
+    })
+
+    # Mandatory trainings for each role, except for the newest hires, plus some elective ones
+    index = RoleIndex(training_df['training_id'], training_df['required_for_roles'])
+    mandatory_emp, mandatory_training = index.required_pairs(employee_ids, employee_df['role'])
+    assigned = mandatory_emp <= n - max(1, int(n * UNASSIGNED_SHARE))
+    mandatory_emp, mandatory_training = mandatory_emp[assigned], mandatory_training[assigned]
+    extra = int(n * EXTRA_ASSIGNMENTS_PER_EMPLOYEE)
+    pairs = pd.DataFrame({
+        'employee_id': np.concatenate([mandatory_emp, rng.integers(1, n + 1, extra)]),
+        'training_id': np.concatenate([mandatory_training, rng.integers(1, TRAININGS + 1, extra)]),
+    }).drop_duplicates(ignore_index=True)
+    m = len(pairs)
+    assigned = REFERENCE_DATE - _days(rng, 0, 540, m)
+    due = assigned + _days(rng, 30, 120, m)
+    status = rng.choice(schema.ASSIGNMENT_STATUSES, m, p=[.2, .2, .5, .1])
+    completed = status == 'Completed'
+    completion = (assigned + _days(rng, 1, 120, m)).where(completed, pd.NaT)
+    assignment_df = pairs.assign(
+        assignment_id=np.arange(1, m + 1),
+        assigned_date=assigned,
+        due_date=due,
+        completion_date=completion,
+        status=status,
+        score=np.where(completed, rng.integers(60, 101, m), np.nan),
+    )[['assignment_id', 'employee_id', 'training_id', 'assigned_date', 'due_date',
+       'completion_date', 'status', 'score']]
+
+    c = int(n * CERTIFICATIONS_PER_EMPLOYEE)
+    issued = REFERENCE_DATE - _days(rng, 0, 365 * 3, c)
+    cert_df = pd.DataFrame({
+        'cert_id': np.arange(1, c + 1),
+        'employee_id': rng.integers(1, n + 1, c),
+        'cert_name': rng.choice(CERT_NAMES, c),
+        'issue_date': issued,
+        'expiry_date': issued + _days(rng, 365, 365 * 3, c),
+        'status': rng.choice(schema.CERT_STATUSES, c, p=[.85, .1, .05]),
+        'issuing_organization': rng.choice(CERT_ORGANIZATIONS, c),
+    })
+
+    skill_df = pd.DataFrame({
+        'skill_id': np.arange(1, SKILLS + 1),
+        'skill_name': [f"Skill {i}" for i in range(1, SKILLS + 1)],
+        'required_for_roles': _role_lists(rng, SKILLS, 2),
+        'proficiency_levels': ','.join(schema.PROFICIENCY_LEVELS),
+    })
+
+    s = n * SKILLS_PER_EMPLOYEE
+    ratings = pd.DataFrame({
+        'employee_id': np.repeat(employee_ids, SKILLS_PER_EMPLOYEE),
+        'skill_id': rng.integers(1, SKILLS + 1, s),
+    }).drop_duplicates(ignore_index=True)
+    r = len(ratings)
+    employee_skill_df = ratings.assign(
+        current_level=rng.choice(schema.PROFICIENCY_LEVELS, r, p=[.25, .35, .28, .12]),
+        required_level=rng.choice(schema.PROFICIENCY_LEVELS, r, p=[.1, .35, .4, .15]),
+        last_assessed=REFERENCE_DATE - _days(rng, 0, 720, r),
+    )
+
+    tables = {
+        'employees': employee_df,
+        'certifications': cert_df,
+        'trainings': training_df,
+        'training_assignments': assignment_df,
+        'skills_matrix': skill_df,
+        'employee_skills': employee_skill_df,
+    }
+    return {table: schema.coerce(table, df) for table, df in tables.items()}
+
+
+def write_database(path, tables):
+    """Create a tracker database at `path` holding exactly these tables"""
+    storage = Storage(path, seed=False)
+    for table in TABLES:
+        storage.insert(table, tables[table])
+    # Fold the WAL into the main file so the database can be copied as one file
+    storage.connection().execute("PRAGMA wal_checkpoint(TRUNCATE)")
+    return storage
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generate a synthetic tracker database")
+    parser.add_argument('--employees', type=int, default=10_000)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--db', required=True, help="database file to create")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    tables = generate(args.employees, args.seed)
+    write_database(args.db, tables)
+    counts = ', '.join(f"{table}={len(df):,}" for table, df in tables.items())
+    print(f"Wrote {args.db} in {time.perf_counter() - start:.1f}s: {counts}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,235 @@
+"""Time the tracker's helpers and pages on generated data at several scales.
+
+    python -m benchmarks.run_benchmarks [--scales 1000 10000 100000] [--output results.json]
+
+Each scale gets a freshly generated database and two worker processes on
+copies of it: one measures wall time, the other peak traced memory (MiB),
+so tracing never skews the timings and every process starts with cold
+caches.
+"""
+import argparse
+import json
+import os
+import platform
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(REPO, 'app.py')
+RESULTS_DIR = os.path.join(REPO, 'benchmarks', 'results')
+
+SCALES = [1_000, 10_000, 100_000]
+
+# Best of this many runs for timings; memory is traced on a single run
+REPEAT = 3
+
+# Employees the per-employee helpers are called for at each scale
+EMPLOYEE_SAMPLE = 20
+
+# Seconds a single page run may take before AppTest gives up
+PAGE_TIMEOUT = 600
+
+
+def measure(func, trace_memory, setup=None, repeat=REPEAT):
+    """Best wall time in seconds of `repeat` calls to func(), or its peak traced memory in MiB"""
+    samples = []
+    for _ in range(1 if trace_memory else repeat):
+        if setup is not None:
+            setup()
+        if trace_memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            func()
+            samples.append((tracemalloc.get_traced_memory()[1] - base) / 2**20)
+        else:
+            start = time.perf_counter()
+            func()
+            samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def helper_results(tracker, trace_memory, sample=EMPLOYEE_SAMPLE):
+    """Measure the app helpers; per-employee helpers report the mean per call over a sample"""
+    ids = tracker.st.session_state.employees['employee_id']
+    ids = ids.iloc[np.linspace(0, len(ids) - 1, min(sample, len(ids))).astype(int)].tolist()
+
+    def per_employee(helper, setup=None):
+        value = measure(lambda: [helper(employee_id) for employee_id in ids], trace_memory, setup)
+        return value if trace_memory else value / len(ids)
+
+    results = {
+        'get_expiration_alerts': measure(tracker.get_expiration_alerts, trace_memory),
+        'calculate_compliance_scores': measure(tracker.calculate_compliance_scores, trace_memory,
+                                               setup=tracker.results.clear),
+        'calculate_compliance_score': per_employee(tracker.calculate_compliance_score, setup=tracker.results.clear),
+        'generate_transcript': per_employee(tracker.generate_transcript),
+        'analyze_skills_gap': per_employee(tracker.analyze_skills_gap),
+        'department_compliance': measure(tracker.department_compliance, trace_memory, setup=tracker.results.clear),
+        'compliance_by_type': measure(tracker.compliance_by_type, trace_memory, setup=tracker.results.clear),
+        'training_hours_by_employee': measure(tracker.training_hours_by_employee, trace_memory,
+                                              setup=tracker.results.clear),
+    }
+
+    # Auto-assignment changes the data, so it is timed once, for employees still missing mandatory trainings
+    missing = tracker.store.missing_mandatory_trainings(tracker.st.session_state.employees)
+    new_hires = missing['employee_id'].drop_duplicates().iloc[:sample].tolist()
+    assert new_hires, "the generated data has no unassigned mandatory trainings"
+
+    def auto_assign():
+        added = [tracker.auto_assign_mandatory_trainings(employee_id) for employee_id in new_hires]
+        assert all(added), "auto-assignment found nothing to assign"
+
+    value = measure(auto_assign, trace_memory, repeat=1)
+    results['auto_assign_mandatory_trainings'] = value if trace_memory else value / len(new_hires)
+    return results
+
+
+def _helper_script(trace_memory):
+    import streamlit as st
+
+    import tracker
+    from benchmarks.run_benchmarks import helper_results
+
+    tracker.start_session()
+    st.session_state.benchmark = helper_results(tracker, trace_memory)
+
+
+def page_results(trace_memory):
+    """Measure app start-up, then each page's first (cold) and repeated (warm) render"""
+    from streamlit.testing.v1 import AppTest
+
+    at = AppTest.from_file(APP, default_timeout=PAGE_TIMEOUT)
+    results = {'startup': measure(at.run, trace_memory, repeat=1)}
+    pages = {}
+    for page in at.sidebar.radio[0].options:
+        at.sidebar.radio[0].set_value(page)
+        cold = measure(at.run, trace_memory, repeat=1)
+        pages[page] = {'cold': cold, 'warm': measure(at.run, trace_memory)}
+        if at.exception:
+            pages[page]['error'] = at.exception[0].value
+    results['pages'] = pages
+    return results
+
+
+def run_worker(output, trace_memory):
+    """Measure pages and helpers against TRACKER_DB_PATH and write the results to `output`"""
+    from streamlit.testing.v1 import AppTest
+
+    if trace_memory:
+        tracemalloc.start()
+    results = page_results(trace_memory)
+
+    at = AppTest.from_function(_helper_script, args=(trace_memory,), default_timeout=PAGE_TIMEOUT)
+    at.run()
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    results['helpers'] = at.session_state.benchmark
+
+    with open(output, 'w') as f:
+        json.dump(results, f)
+
+
+def _spawn_worker(db, output, trace_memory):
+    env = dict(os.environ, TRACKER_DB_PATH=db)
+    command = [sys.executable, '-m', 'benchmarks.run_benchmarks', '--worker', output]
+    if trace_memory:
+        command.append('--trace-memory')
+    subprocess.run(command, cwd=REPO, env=env, check=True,
+                   stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    with open(output) as f:
+        return json.load(f)
+
+
+def _combine(timings, memory):
+    """{'seconds': ..., 'peak_mib': ...} leaves from matching timing and memory trees"""
+    if isinstance(timings, dict):
+        return {key: _combine(value, memory.get(key, {})) for key, value in timings.items()}
+    if isinstance(timings, str):
+        return timings
+    return {'seconds': round(timings, 5), 'peak_mib': round(memory, 2) if isinstance(memory, float) else None}
+
+
+def run_scale(employees, seed, workdir):
+    """Generate one scale's database and measure it in a timing and a memory worker"""
+    from benchmarks.generate_data import generate, write_database
+
+    start = time.perf_counter()
+    tables = generate(employees, seed)
+    base = os.path.join(workdir, f"bench_{employees}.db")
+    write_database(base, tables)
+    generated = time.perf_counter() - start
+
+    measured = {}
+    for trace_memory in (False, True):
+        db = os.path.join(workdir, f"bench_{employees}_{'memory' if trace_memory else 'time'}.db")
+        shutil.copyfile(base, db)
+        measured[trace_memory] = _spawn_worker(db, db + '.json', trace_memory)
+
+    return {
+        'employees': employees,
+        'rows': {table: len(df) for table, df in tables.items()},
+        'generate_seconds': round(generated, 2),
+        **_combine(measured[False], measured[True]),
+    }
+
+
+def _print_scale(result):
+    print(f"\n{result['employees']:,} employees ({result['rows']['training_assignments']:,} assignments)")
+    print(f"  {'startup':<40}{result['startup']['seconds']:>10.3f}s{result['startup']['peak_mib']:>10.1f} MiB")
+    for name, value in result['helpers'].items():
+        print(f"  {name:<40}{value['seconds']:>10.4f}s{value['peak_mib']:>10.1f} MiB")
+    for page, value in result['pages'].items():
+        cold, warm = value['cold'], value['warm']
+        print(f"  {page:<40}{cold['seconds']:>10.3f}s{cold['peak_mib']:>10.1f} MiB  warm {warm['seconds']:.3f}s"
+              + (f"  ERROR {value['error']}" if 'error' in value else ''))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the tracker on synthetic data")
+    parser.add_argument('--scales', type=int, nargs='+', default=SCALES, help="employee counts to measure")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--output', help="results file (default: benchmarks/results/<timestamp>.json)")
+    parser.add_argument('--worker', metavar='OUTPUT', help=argparse.SUPPRESS)
+    parser.add_argument('--trace-memory', action='store_true', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        run_worker(args.worker, args.trace_memory)
+        return 0
+
+    import streamlit
+
+    report = {
+        'created': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'pandas': pd.__version__,
+        'streamlit': streamlit.__version__,
+        'seed': args.seed,
+        'scales': [],
+    }
+    with tempfile.TemporaryDirectory() as workdir:
+        for employees in args.scales:
+            result = run_scale(employees, args.seed, workdir)
+            report['scales'].append(result)
+            _print_scale(result)
+
+    output = args.output
+    if output is None:
+        os.makedirs(RESULTS_DIR, exist_ok=True)
+        output = os.path.join(RESULTS_DIR, f"{datetime.now():%Y%m%d-%H%M%S}.json")
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    print(f"\nResults written to {output}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,105 @@
+"""Time to first render of the app in fresh processes, as paid by a newly started server.
+
+    python -m benchmarks.startup [--runs 5] [--employees 10000]
+
+Every run starts a new interpreter, renders the default page, then opens
+each other page once, so module imports and data loading are always cold.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(REPO, 'app.py')
+
+# Modules whose import is deferred until a page needs them
+LAZY_MODULES = ['plotly', 'xlsxwriter', 'openpyxl']
+
+RUNS = 5
+
+
+def measure_startup():
+    """One cold start: framework import, first render, then each page's first render"""
+    start = time.perf_counter()
+    from streamlit.testing.v1 import AppTest
+    framework = time.perf_counter() - start
+
+    at = AppTest.from_file(APP, default_timeout=600)
+    start = time.perf_counter()
+    at.run()
+    first_render = time.perf_counter() - start
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    loaded = [module for module in LAZY_MODULES if module in sys.modules]
+
+    pages = {}
+    radio = at.sidebar.radio[0]
+    for page in radio.options[1:]:
+        radio.set_value(page)
+        start = time.perf_counter()
+        at.run()
+        pages[page] = time.perf_counter() - start
+        radio = at.sidebar.radio[0]
+
+    return {'framework_import': framework, 'first_render': first_render,
+            'loaded_at_first_render': loaded, 'page_first_render': pages}
+
+
+def _run_once(db):
+    env = dict(os.environ, TRACKER_DB_PATH=db)
+    with tempfile.NamedTemporaryFile(suffix='.json') as output:
+        subprocess.run([sys.executable, '-m', 'benchmarks.startup', '--worker', output.name],
+                       cwd=REPO, env=env, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        return json.load(open(output.name))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Measure the app's cold-start time to first render")
+    parser.add_argument('--runs', type=int, default=RUNS)
+    parser.add_argument('--employees', type=int, help="use a generated database of this size instead of the demo data")
+    parser.add_argument('--output', help="also write the results to this JSON file")
+    parser.add_argument('--worker', metavar='OUTPUT', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        with open(args.worker, 'w') as f:
+            json.dump(measure_startup(), f)
+        return 0
+
+    with tempfile.TemporaryDirectory() as workdir:
+        db = os.path.join(workdir, 'startup.db')
+        if args.employees:
+            from benchmarks.generate_data import generate, write_database
+            write_database(db, generate(args.employees))
+        runs = [_run_once(db) for _ in range(args.runs)]
+
+    report = {
+        'runs': args.runs,
+        'employees': args.employees,
+        'framework_import': statistics.median(run['framework_import'] for run in runs),
+        'first_render': statistics.median(run['first_render'] for run in runs),
+        'loaded_at_first_render': runs[0]['loaded_at_first_render'],
+        'page_first_render': {page: statistics.median(run['page_first_render'][page] for run in runs)
+                              for page in runs[0]['page_first_render']},
+    }
+
+    print(f"Median of {args.runs} cold starts")
+    print(f"  {'framework import':<32}{report['framework_import']:>8.3f}s")
+    print(f"  {'first render (default page)':<32}{report['first_render']:>8.3f}s")
+    print(f"  {'lazy modules loaded by then':<32}{', '.join(report['loaded_at_first_render']) or 'none':>8}")
+    for page, seconds in report['page_first_render'].items():
+        print(f"  {page:<32}{seconds:>8.3f}s")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
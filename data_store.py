@@ -0,0 +1,383 @@
+"""Process-wide in-memory tables shared by every Streamlit session"""
+import threading
+
+import numpy as np
+import pandas as pd
+
+import schema
+from indexes import KeyIndex, LevelMatrix, PairIndex, RoleIndex
+from storage import TABLES
+
+# Tables with a single-column primary key, which get a KeyIndex
+KEY_COLUMNS = {table: keys[0] for table, keys in TABLES.items() if len(keys) == 1}
+
+# Catalogs whose required_for_roles column gets a RoleIndex
+ROLE_CATALOGS = ['trainings', 'skills_matrix']
+
+# Denormalized view of training_assignments: the columns copied onto each
+# assignment from the employee and training it refers to
+FACTS = 'assignment_facts'
+FACT_COLUMNS = {
+    'employees': ['name', 'department', 'role', 'email'],
+    'trainings': ['training_name', 'compliance_type', 'duration_hours'],
+}
+
+# employee_skills level columns mirrored in employee x skill LevelMatrixes
+SKILL_LEVELS = ['current_level', 'required_level']
+
+# Gap statuses of an assessed skill, by the sign of required - current
+GAP_STATUSES = {-1: 'Exceeds', 0: 'Meets', 1: 'Needs Development'}
+
+
+class DataStore:
+    """Shared, versioned table snapshots backed by the SQLite storage.
+
+    Every session reads the same DataFrame objects instead of holding its own
+    copy. Writes go through `append` and `update`, which persist to storage and
+    then publish a new DataFrame under a lock (copy-on-write), so a session
+    that is mid-rerun keeps reading a consistent snapshot. Each write bumps the
+    table's version and the global `version`, which sessions compare against
+    to know when to pick up the new snapshots.
+
+    The store also maintains `assignment_facts`, the assignments joined to
+    the FACT_COLUMNS of their employee and training. It is built once and
+    patched by every write that touches those columns, so pages read it
+    instead of merging the tables on each rerun.
+
+    Skill levels are mirrored in dense employee x skill matrices, one per
+    SKILL_LEVELS column, laid out by the employees and skills_matrix row
+    positions, so team-wide gap analysis is a NumPy reduction over rows.
+
+    Writes made through another process, such as the reconcile CLI, are
+    noticed through the per-table write counts kept in storage: `snapshot`
+    reloads any table whose count moved without this store writing it.
+    """
+
+    def __init__(self, storage):
+        self.storage = storage
+        self._lock = threading.RLock()
+        self._storage_versions = storage.table_versions()
+        self._tables = {table: storage.read_table(table) for table in TABLES}
+        self._build_derived()
+        self.versions = {table: 0 for table in self._tables}
+        self.version = 0
+        self._lookups = {}
+
+    def _build_derived(self):
+        """Build the indexes, the assignment view and the skill matrices from the base tables"""
+        self._key_indexes = {
+            table: KeyIndex(self._tables[table][column]) for table, column in KEY_COLUMNS.items()
+        }
+        assignments = self._tables['training_assignments']
+        self._assignment_pairs = PairIndex(assignments['employee_id'], assignments['training_id'])
+        self._role_indexes = {table: self._build_role_index(table) for table in ROLE_CATALOGS}
+        self._tables[FACTS] = self._fact_rows(assignments)
+        self._skill_levels = {
+            column: LevelMatrix(len(self._tables['employees']), len(self._tables['skills_matrix']))
+            for column in SKILL_LEVELS
+        }
+        self._set_skill_levels(self._tables['employee_skills'])
+
+    def table(self, name):
+        """Current snapshot of a table"""
+        return self._tables[name]
+
+    def row(self, table, key):
+        """Row of a table by primary key, found through its KeyIndex"""
+        return self._tables[table].iloc[self._key_indexes[table].position(key)]
+
+    def value(self, table, key, column):
+        """Single cell of a table by primary key"""
+        return self._tables[table][column].iat[self._key_indexes[table].position(key)]
+
+    def lookup(self, table, column):
+        """{primary key: value} dict of one column, rebuilt only when the table's version changes"""
+        with self._lock:
+            version, mapping = self._lookups.get((table, column), (None, None))
+            if version != self.versions[table]:
+                df = self._tables[table]
+                mapping = dict(zip(df[KEY_COLUMNS[table]].tolist(), df[column].tolist()))
+                self._lookups[(table, column)] = (self.versions[table], mapping)
+            return mapping
+
+    def has_key(self, table, key):
+        """Whether a primary key exists in a table"""
+        return key in self._key_indexes[table]
+
+    def mandatory(self, table, role):
+        """Keys of the catalog items (trainings or skills) a role requires"""
+        return self._role_indexes[table].keys_for(role)
+
+    def missing_mandatory_trainings(self, employees):
+        """(employee_id, training_id) pairs the employees' roles require but that are not assigned yet.
+
+        `employees` needs employee_id and role columns. The whole workforce is
+        expanded against the role index and anti-joined with the assignment
+        pair index in one pass.
+        """
+        with self._lock:
+            employee_ids, training_ids = self._role_indexes['trainings'].required_pairs(
+                employees['employee_id'], employees['role']
+            )
+            assigned = self._assignment_pairs.contains(employee_ids, training_ids)
+        return pd.DataFrame({'employee_id': employee_ids[~assigned], 'training_id': training_ids[~assigned]})
+
+    def skill_gaps(self, employee_ids):
+        """Per-skill levels of a group of employees and the count of their assessments by gap status.
+
+        Returns a frame with skill_id, skill_name, avg_current, avg_required,
+        avg_gap and employee_count for every skill assessed in the group,
+        and a Series counting the group's assessments per GAP_STATUSES value.
+        """
+        with self._lock:
+            rows = self._key_indexes['employees'].positions(employee_ids)
+            rows = rows[rows >= 0]
+            current, required = (self._skill_levels[column].take(rows) for column in SKILL_LEVELS)
+            skills = self._tables['skills_matrix']
+
+        assessed = current > 0
+        counts = assessed.sum(axis=0)
+        gap = np.where(assessed, required.astype(np.int16) - current, 0)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            summary = pd.DataFrame({
+                'skill_id': skills['skill_id'].to_numpy(),
+                'skill_name': skills['skill_name'].to_numpy(),
+                'avg_current': current.sum(axis=0, dtype=np.int64) / counts,
+                'avg_required': np.where(assessed, required, 0).sum(axis=0, dtype=np.int64) / counts,
+                'avg_gap': gap.sum(axis=0, dtype=np.int64) / counts,
+                'employee_count': counts,
+            })[counts > 0].reset_index(drop=True)
+        signs = np.sign(gap[assessed])
+        statuses = pd.Series({label: int((signs == sign).sum()) for sign, label in GAP_STATUSES.items()})
+        return summary, statuses
+
+    def refresh(self):
+        """Reload the tables another process has written since this store last saw them; returns their names"""
+        with self._lock:
+            versions = self.storage.table_versions()
+            stale = [table for table in TABLES if versions.get(table, 0) != self._storage_versions.get(table, 0)]
+            if stale:
+                self._storage_versions = versions
+                for table in stale:
+                    self._tables[table] = self.storage.read_table(table)
+                self._build_derived()
+                for table in stale + [FACTS]:
+                    self._publish(table, self._tables[table])
+            return stale
+
+    def _track(self, table, storage_version):
+        """Record this store's own write; a gap means another process wrote too, left for `refresh`"""
+        if storage_version is not None and storage_version == self._storage_versions.get(table, 0) + 1:
+            self._storage_versions[table] = storage_version
+
+    def snapshot(self):
+        """Current snapshots of every table, the global version and each table's version"""
+        with self._lock:
+            self.refresh()
+            return self.version, dict(self.versions), dict(self._tables)
+
+    def _publish(self, table, df):
+        self._tables[table] = df
+        self.versions[table] += 1
+        self.version += 1
+
+    def _build_role_index(self, table):
+        df = self._tables[table]
+        return RoleIndex(df[KEY_COLUMNS[table]], df['required_for_roles'])
+
+    def _fact_rows(self, assignments):
+        """Assignment rows with their employee and training columns added"""
+        facts = assignments
+        for table, columns in FACT_COLUMNS.items():
+            key = KEY_COLUMNS[table]
+            facts = facts.merge(self._tables[table][[key] + columns], on=key, how='left')
+        return facts
+
+    def _set_skill_levels(self, records):
+        """Copy employee_skills rows into the level matrices, skipping unknown employees or skills"""
+        rows = self._key_indexes['employees'].positions(records['employee_id'])
+        columns = self._key_indexes['skills_matrix'].positions(records['skill_id'])
+        known = (rows >= 0) & (columns >= 0)
+        for column in SKILL_LEVELS:
+            levels = schema.proficiency_codes(records[column])
+            self._skill_levels[column].set(rows[known], columns[known], levels[known])
+
+    def _resize_skill_levels(self):
+        shape = len(self._tables['employees']), len(self._tables['skills_matrix'])
+        for matrix in self._skill_levels.values():
+            matrix.resize(*shape)
+
+    @staticmethod
+    def _set_cells(df, rows, values):
+        """Copy of a frame with the given rows set to new values, extending categories as needed"""
+        df = df.copy()
+        for column, value in values.items():
+            if (isinstance(df[column].dtype, pd.CategoricalDtype) and value is not None
+                    and value not in df[column].cat.categories):
+                df[column] = df[column].cat.add_categories([value])
+            df.loc[rows, column] = value
+        return df
+
+    @staticmethod
+    def _set_rows(df, rows, records):
+        """Copy of a frame with the given rows overwritten by the records, row for row"""
+        df, records = schema.align_categories(df.copy(), records.copy(deep=False))
+        for column in records.columns:
+            df.loc[rows, column] = records[column].to_numpy()
+        return df
+
+    def _update_facts(self, table, keys, values, rows):
+        """Patch the assignment view after an edit to rows of a table"""
+        if table == 'training_assignments':
+            self._publish(FACTS, self._set_cells(self._tables[FACTS], rows, values))
+        elif table in FACT_COLUMNS:
+            changed = {column: value for column, value in values.items() if column in FACT_COLUMNS[table]}
+            if changed:
+                facts = self._tables[FACTS]
+                key = KEY_COLUMNS[table]
+                fact_rows = facts.index[facts[key].isin(keys[key]).to_numpy()]
+                if len(fact_rows):
+                    self._publish(FACTS, self._set_cells(facts, fact_rows, changed))
+
+    def append(self, table, records):
+        """Persist new rows and publish the extended table"""
+        records = schema.coerce(table, records)
+        with self._lock:
+            self._track(table, self.storage.insert(table, records))
+            self._append_rows(table, records)
+
+    def _append_rows(self, table, records):
+        """Publish typed rows already written to storage at the end of a table"""
+        with self._lock:
+            existing, records = schema.align_categories(self._tables[table].copy(deep=False), records)
+            self._publish(table, pd.concat([existing, records], ignore_index=True))
+            if table in self._key_indexes:
+                self._key_indexes[table].extend(records[KEY_COLUMNS[table]], len(existing))
+            if table in self._role_indexes:
+                self._role_indexes[table] = self._build_role_index(table)
+            if table in ('employees', 'skills_matrix'):
+                self._resize_skill_levels()
+            elif table == 'employee_skills':
+                self._set_skill_levels(records)
+            if table == 'training_assignments':
+                self._assignment_pairs.add(records['employee_id'], records['training_id'])
+                facts, new_facts = schema.align_categories(
+                    self._tables[FACTS].copy(deep=False), self._fact_rows(records)
+                )
+                self._publish(FACTS, pd.concat([facts, new_facts], ignore_index=True))
+
+    def upsert(self, table, records):
+        """Persist records keyed on the table's primary key, overwriting existing rows and appending new ones.
+
+        One join against the table's key columns splits the batch into
+        updates, written into a single copy of the table, and inserts,
+        appended in a single concat. Later duplicates of a key win. Returns
+        the number of rows added and the number updated.
+        """
+        keys = TABLES[table]
+        records = schema.coerce(table, records).drop_duplicates(keys, keep='last', ignore_index=True)
+        with self._lock:
+            df = self._tables[table]
+            rows = records[keys].merge(df[keys].reset_index(names='row'), on=keys, how='left')['row']
+            found = rows.notna().to_numpy()
+            self._track(table, self.storage.upsert(table, records))
+
+            updates = records[found]
+            if not updates.empty:
+                rows = rows.to_numpy()[found].astype(np.int64)
+                self._publish(table, self._set_rows(df, rows, updates.drop(columns=keys)))
+                if table == 'training_assignments' or table in FACT_COLUMNS:
+                    self._publish(FACTS, self._fact_rows(self._tables['training_assignments']))
+                if table in self._role_indexes and 'required_for_roles' in updates:
+                    self._role_indexes[table] = self._build_role_index(table)
+                if table == 'employee_skills':
+                    self._set_skill_levels(updates)
+
+            inserts = records[~found]
+            if not inserts.empty:
+                self._append_rows(table, inserts)
+        return len(inserts), len(updates)
+
+    def reserve_ids(self, table, count=1):
+        """Block of `count` fresh primary keys for a table, reserved in storage"""
+        start = self.storage.reserve_ids(table, count)
+        return np.arange(start, start + count)
+
+    def append_new(self, table, records):
+        """Append records under a block of fresh primary keys; returns the records with their keys"""
+        records = records.assign(**{KEY_COLUMNS[table]: self.reserve_ids(table, len(records))})
+        self.append(table, records)
+        return records
+
+    def assigned(self, employee_ids, training_ids):
+        """Boolean array telling which (employee_id, training_id) pairs are already assigned"""
+        with self._lock:
+            return self._assignment_pairs.contains(employee_ids, training_ids)
+
+    def update(self, table, keys, values):
+        """Persist an edit to one row and publish the edited table; raises KeyError for an unknown key"""
+        keys = {column: schema.coerce_value(table, column, value) for column, value in keys.items()}
+        values = {column: schema.coerce_value(table, column, value) for column, value in values.items()}
+        with self._lock:
+            # Find the row before writing, so an unknown key changes neither storage nor the tables
+            df = self._tables[table]
+            if table in self._key_indexes:
+                idx = self._key_indexes[table].position(keys[KEY_COLUMNS[table]])
+            else:
+                mask = pd.Series(True, index=df.index)
+                for column, value in keys.items():
+                    mask &= df[column] == value
+                matches = df.index[mask.to_numpy()]
+                if matches.empty:
+                    raise KeyError(tuple(keys.values()))
+                idx = matches[0]
+
+            self._track(table, self.storage.update(table, keys, values))
+            self._publish(table, self._set_cells(df, [idx], values))
+            self._update_facts(table, {column: [value] for column, value in keys.items()}, values, [idx])
+            if table in self._role_indexes and 'required_for_roles' in values:
+                self._role_indexes[table] = self._build_role_index(table)
+            if table == 'employee_skills' and not values.keys().isdisjoint(SKILL_LEVELS):
+                self._set_skill_levels(self._tables[table].iloc[[idx]])
+
+    def update_many(self, table, keys, values):
+        """Persist the same edit to many rows, given by primary key, and publish the table once.
+
+        Raises KeyError, before anything is written, when a key is unknown.
+        """
+        key = KEY_COLUMNS[table]
+        keys = [int(k) for k in keys]
+        if not keys:
+            return
+        values = {column: schema.coerce_value(table, column, value) for column, value in values.items()}
+        with self._lock:
+            rows = [self._key_indexes[table].position(k) for k in keys]
+            self._track(table, self.storage.update_many(table, key, keys, values))
+            self._publish(table, self._set_cells(self._tables[table], rows, values))
+            self._update_facts(table, {key: keys}, values, rows)
+            if table in self._role_indexes and 'required_for_roles' in values:
+                self._role_indexes[table] = self._build_role_index(table)
+
+    def assign_trainings(self, pairs, assigned_date, due_date):
+        """Create 'Not Started' assignments for (employee_id, training_id) pairs not assigned yet.
+
+        The candidates are anti-joined against the assignment pair index and
+        the remaining rows are appended in one operation. Returns the number
+        of assignments added and the number of candidate rows skipped.
+        """
+        candidates = pairs[['employee_id', 'training_id']].drop_duplicates()
+        with self._lock:
+            exists = self._assignment_pairs.contains(candidates['employee_id'], candidates['training_id'])
+            new = candidates[~exists]
+            if not new.empty:
+                self.append('training_assignments', pd.DataFrame({
+                    'assignment_id': self.reserve_ids('training_assignments', len(new)),
+                    'employee_id': new['employee_id'].to_numpy(),
+                    'training_id': new['training_id'].to_numpy(),
+                    'assigned_date': pd.Timestamp(assigned_date),
+                    'due_date': pd.Timestamp(due_date),
+                    'completion_date': pd.NaT,
+                    'status': 'Not Started',
+                    'score': np.nan
+                }))
+        return len(new), len(pairs) - len(new)
@@ -0,0 +1,125 @@
+"""Chunked report export: join, format and serialize one slice of rows at a time"""
+import importlib.util
+import io
+import tempfile
+import zlib
+
+import pandas as pd
+
+import schema
+
+# Fact rows joined and serialized per chunk
+CHUNK_ROWS = 50_000
+
+# Rows per Excel worksheet, header included; longer sheets continue on a new one
+EXCEL_MAX_ROWS = 1_048_576
+EXCEL_MAX_SHEET_NAME = 31
+
+
+def iter_report_chunks(facts, joins=(), derive=None, chunk_rows=CHUNK_ROWS):
+    """Yield display-ready slices of a fact table joined to its lookup tables.
+
+    `joins` is a sequence of (table, key) pairs inner-joined onto each slice
+    in turn, and `derive` an optional function adding computed columns. Only
+    one slice of the joined report exists at a time. An empty fact table
+    still yields one empty frame so the column headers are known.
+    """
+    for start in range(0, max(len(facts), 1), chunk_rows):
+        chunk = facts.iloc[start:start + chunk_rows]
+        for table, key in joins:
+            chunk = chunk.merge(table, on=key)
+        if derive is not None:
+            chunk = derive(chunk)
+        yield schema.for_display(chunk)
+
+
+def iter_csv(chunks, encoding='utf-8'):
+    """Serialize frames to CSV bytes one chunk at a time, with a single header row"""
+    for i, chunk in enumerate(chunks):
+        yield chunk.to_csv(index=False, header=i == 0).encode(encoding)
+
+
+def iter_gzip(byte_chunks, level=6):
+    """Gzip-compress a stream of byte chunks incrementally"""
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for data in byte_chunks:
+        compressed = compressor.compress(data)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def csv_export(chunks, compress=False):
+    """CSV bytes of a chunked report, optionally gzipped.
+
+    Streamlit hands a download to the browser as one bytes object held in
+    memory, so the file itself cannot be streamed. Each chunk is appended to
+    a single growing buffer as soon as it is serialized and then dropped, so
+    peak memory is the finished file plus one joined chunk and its CSV
+    text, however many rows the report has.
+    """
+    stream = iter_csv(chunks)
+    if compress:
+        stream = iter_gzip(stream)
+    output = io.BytesIO()
+    for data in stream:
+        output.write(data)
+    return output.getvalue()
+
+
+def _cell_rows(chunk):
+    """Rows of a frame as plain Python values, with missing values as None"""
+    return chunk.astype(object).where(chunk.notna(), None).to_numpy().tolist()
+
+
+def excel_available():
+    """Whether xlsxwriter is installed, checked without importing it"""
+    return importlib.util.find_spec('xlsxwriter') is not None
+
+
+def excel_export(sheets, total_rows=None, progress=None):
+    """Bytes of an .xlsx workbook written row by row through a temporary file.
+
+    `sheets` is a sequence of (sheet_name, chunks) pairs. xlsxwriter runs in
+    constant-memory mode, flushing each row to disk once the next one starts,
+    so only the current chunk is held in memory. Sheets longer than Excel's
+    row limit continue on 'Name (2)', 'Name (3)', ... When `progress` is
+    given it is called with the fraction of `total_rows` written so far.
+    Raises ImportError when xlsxwriter is not installed.
+    """
+    import xlsxwriter
+
+    with tempfile.TemporaryFile() as output:
+        _write_workbook(xlsxwriter.Workbook(output, {'constant_memory': True}), sheets, total_rows, progress)
+        output.seek(0)
+        return output.read()
+
+
+def _write_workbook(workbook, sheets, total_rows, progress):
+    """Stream (sheet_name, chunks) pairs into a constant-memory workbook and close it"""
+    header_format = workbook.add_format({'bold': True})
+    written = 0
+
+    for sheet_name, chunks in sheets:
+        part, worksheet, row = 1, None, EXCEL_MAX_ROWS
+        for chunk in chunks:
+            header = [str(column) for column in chunk.columns]
+            for values in _cell_rows(chunk) or [None]:
+                if row == EXCEL_MAX_ROWS:
+                    name = sheet_name if part == 1 else f"{sheet_name[:EXCEL_MAX_SHEET_NAME - 6]} ({part})"
+                    worksheet = workbook.add_worksheet(name)
+                    worksheet.write_row(0, 0, header, header_format)
+                    part, row = part + 1, 1
+                if values is not None:
+                    worksheet.write_row(row, 0, values)
+                    row += 1
+            written += len(chunk)
+            if progress is not None and total_rows:
+                progress(min(written / total_rows, 1.0))
+
+    workbook.close()
+
+
+def preview(chunks):
+    """First chunk of a report, for showing on screen"""
+    return next(iter(chunks), pd.DataFrame())
@@ -0,0 +1,226 @@
+"""Bulk import of employees, certifications and training assignments from CSV or Excel files"""
+import numpy as np
+import pandas as pd
+
+import schema
+from indexes import PairIndex
+
+# Rows read and validated per chunk
+IMPORT_CHUNK_ROWS = 10_000
+
+# Columns each import accepts: required ones must be present and non-empty,
+# optional ones fall back to their default when missing or blank
+IMPORT_SPECS = {
+    'employees': {
+        'required': ['name', 'email', 'role', 'department', 'hire_date'],
+        'optional': {'status': 'Active', 'phone': 'N/A'},
+    },
+    'certifications': {
+        'required': ['employee_id', 'cert_name', 'issuing_organization', 'issue_date', 'expiry_date'],
+        'optional': {'status': 'Active'},
+    },
+    'training_assignments': {
+        'required': ['employee_id', 'training_id', 'due_date'],
+        'optional': {'assigned_date': None, 'completion_date': None, 'status': 'Not Started', 'score': None},
+    },
+}
+
+# Values accepted for enumerated columns
+IMPORT_CHOICES = {
+    'employees': {'status': schema.EMPLOYEE_STATUSES, 'role': schema.ROLES, 'department': schema.DEPARTMENTS},
+    'certifications': {'status': schema.CERT_STATUSES},
+    'training_assignments': {'status': schema.ASSIGNMENT_STATUSES},
+}
+
+# Key columns that must refer to an existing row of another table
+IMPORT_REFERENCES = {
+    'certifications': {'employee_id': 'employees'},
+    'training_assignments': {'employee_id': 'employees', 'training_id': 'trainings'},
+}
+
+
+def read_chunks(file, file_name, chunk_rows=IMPORT_CHUNK_ROWS):
+    """Yield the rows of an uploaded CSV or XLSX file as frames of strings.
+
+    Excel files are streamed with openpyxl's read-only mode and raise
+    ImportError when openpyxl is not installed.
+    """
+    if file_name.lower().endswith('.xlsx'):
+        yield from _read_xlsx_chunks(file, chunk_rows)
+    else:
+        yield from pd.read_csv(file, dtype=str, keep_default_na=False, chunksize=chunk_rows)
+
+
+def _read_xlsx_chunks(file, chunk_rows):
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(file, read_only=True, data_only=True)
+    try:
+        rows = workbook.worksheets[0].iter_rows(values_only=True)
+        header = [str(cell) if cell is not None else '' for cell in next(rows, ())]
+        batch = []
+        for row in rows:
+            batch.append(['' if cell is None else str(cell) for cell in row])
+            if len(batch) == chunk_rows:
+                yield pd.DataFrame(batch, columns=header)
+                batch = []
+        if batch or not header:
+            yield pd.DataFrame(batch, columns=header)
+    finally:
+        workbook.close()
+
+
+def normalize_columns(chunk):
+    """Lower-case, underscore-separated column names, e.g. 'Hire Date' -> 'hire_date'"""
+    chunk = chunk.copy()
+    chunk.columns = [str(c).strip().lower().replace(' ', '_') for c in chunk.columns]
+    return chunk
+
+
+def _parse_keys(values):
+    """Integer keys from 'E001' or '1' style text; NaN where unparseable"""
+    digits = values.str.replace(r'^[A-Za-z]+', '', regex=True)
+    return pd.to_numeric(digits, errors='coerce')
+
+
+def _parse_dates(values):
+    """ISO dates (YYYY-MM-DD, with an optional time part); NaT where unparseable"""
+    return pd.to_datetime(values.where(values != ''), errors='coerce', format='ISO8601')
+
+
+class ChunkValidator:
+    """Vectorized validation of import chunks for one table.
+
+    Keeps the state that spans chunks, such as the emails and assignment
+    pairs already seen in the file, so duplicates are caught file-wide.
+    """
+
+    def __init__(self, store, table):
+        if table not in IMPORT_SPECS:
+            raise ValueError(f"Cannot import into {table!r}")
+        self.store = store
+        self.table = table
+        self.spec = IMPORT_SPECS[table]
+        self._seen = set()
+        if table == 'employees':
+            self._existing_emails = set(store.table('employees')['email'].dropna().str.lower())
+
+    def check_columns(self, columns):
+        """Raise ValueError naming any required column the file lacks"""
+        missing = [c for c in self.spec['required'] if c not in columns]
+        if missing:
+            raise ValueError(f"Missing required columns: {', '.join(missing)}")
+
+    def validate(self, chunk, first_row):
+        """Split a normalized chunk into typed valid records and a per-row error report.
+
+        `first_row` is the file line number of the chunk's first data row.
+        """
+        columns = self.spec['required'] + list(self.spec['optional'])
+        chunk = chunk.reindex(columns=columns, fill_value='')
+        chunk = chunk.fillna('').astype(str).apply(lambda col: col.str.strip())
+        chunk.index = np.arange(first_row, first_row + len(chunk))
+        errors = []
+
+        def reject(mask, column, message):
+            mask = pd.Series(mask, index=chunk.index)
+            if mask.any():
+                errors.append(pd.DataFrame({'row': chunk.index[mask.to_numpy()], 'column': column, 'error': message}))
+
+        for column in self.spec['required']:
+            reject(chunk[column] == '', column, 'Required value is missing')
+
+        for column, default in self.spec['optional'].items():
+            chunk[column] = chunk[column].where(chunk[column] != '', default)
+
+        types = schema.COLUMN_TYPES[self.table]
+        records = pd.DataFrame(index=chunk.index)
+        for column in columns:
+            kind = types.get(column)
+            values = chunk[column]
+            if kind == schema.ID:
+                records[column] = _parse_keys(values.fillna(''))
+                reject(values.notna() & (values != '') & records[column].isna(), column, 'Invalid ID')
+            elif kind == schema.DATE:
+                records[column] = _parse_dates(values.fillna(''))
+                reject(values.notna() & (values != '') & records[column].isna(), column, 'Invalid date, expected YYYY-MM-DD')
+            elif column == 'score':
+                records[column] = pd.to_numeric(values, errors='coerce')
+                reject(values.notna() & records[column].isna(), column, 'Score must be a number')
+            else:
+                records[column] = values
+
+        # Blank required values are already reported as missing
+        for column, choices in IMPORT_CHOICES.get(self.table, {}).items():
+            values = records[column]
+            reject(values.notna() & (values != '') & ~values.isin(choices), column, f"Must be one of: {', '.join(choices)}")
+
+        for column, table in IMPORT_REFERENCES.get(self.table, {}).items():
+            keys = records[column]
+            known = keys.isin(self.store.table(table)[column])
+            reject(keys.notna() & ~known, column, f"Unknown {column}")
+
+        if self.table == 'employees':
+            self._check_emails(records, reject)
+        elif self.table == 'training_assignments':
+            self._check_pairs(records, reject)
+
+        if errors:
+            errors = pd.concat(errors, ignore_index=True)
+            records = records.drop(index=errors['row'].unique())
+        else:
+            errors = pd.DataFrame(columns=['row', 'column', 'error'])
+
+        for column in columns:
+            if types.get(column) == schema.ID:
+                records[column] = records[column].astype('int64')
+        return records, errors
+
+    def _check_emails(self, records, reject):
+        emails = records['email'].str.lower()
+        present = emails != ''
+        reject(emails.isin(self._existing_emails), 'email', 'An employee with this email already exists')
+        reject(present & (emails.duplicated() | emails.isin(self._seen)), 'email', 'Duplicate email in file')
+        self._seen.update(emails[present])
+
+    def _check_pairs(self, records, reject):
+        valid = records['employee_id'].notna() & records['training_id'].notna()
+        employee_ids = records['employee_id'].fillna(0).astype('int64')
+        training_ids = records['training_id'].fillna(0).astype('int64')
+        reject(valid & self.store.assigned(employee_ids, training_ids), 'training_id',
+               'Training already assigned to this employee')
+        pairs = pd.Series(PairIndex.encode(employee_ids, training_ids), index=records.index)
+        reject(valid & (pairs.duplicated() | pairs.isin(self._seen)), 'training_id', 'Duplicate assignment in file')
+        self._seen.update(pairs[valid])
+
+
+def import_file(store, table, file, file_name, allow_partial=False, chunk_rows=IMPORT_CHUNK_ROWS):
+    """Validate an uploaded file chunk by chunk and append its records in one operation.
+
+    New keys are allocated as one block. Rows with errors are never
+    imported; unless `allow_partial` is set, any error cancels the whole
+    import. Returns the imported records (empty if nothing was imported)
+    and an error report with the file row number, column and message.
+    Raises ValueError when a required column is missing.
+    """
+    validator = ChunkValidator(store, table)
+    valid, errors = [], []
+    first_row = 2  # line 1 is the header
+
+    for chunk in read_chunks(file, file_name, chunk_rows):
+        chunk = normalize_columns(chunk)
+        validator.check_columns(chunk.columns)
+        records, chunk_errors = validator.validate(chunk, first_row)
+        valid.append(records)
+        errors.append(chunk_errors)
+        first_row += len(chunk)
+
+    errors = pd.concat(errors).sort_values('row', kind='stable').reset_index(drop=True) if errors else \
+        pd.DataFrame(columns=['row', 'column', 'error'])
+    records = pd.concat(valid) if valid else pd.DataFrame()
+
+    if records.empty or (len(errors) and not allow_partial):
+        return records.iloc[:0], errors
+    if table == 'training_assignments':
+        records['assigned_date'] = records['assigned_date'].fillna(pd.Timestamp.now().normalize())
+    return store.append_new(table, records.reset_index(drop=True)), errors
@@ -0,0 +1,142 @@
+"""Hash indexes maintained alongside the shared tables"""
+import numpy as np
+import pandas as pd
+
+
+class KeyIndex:
+    """Maps a table's integer primary key to its row position.
+
+    Tables are append-only and keep a RangeIndex, so a row's position never
+    changes once written: inserts extend the index and edits leave it as is.
+    """
+
+    def __init__(self, keys):
+        self._positions = {}
+        self.extend(keys, 0)
+
+    def extend(self, keys, start):
+        """Register keys appended at row positions start, start + 1, ..."""
+        self._positions.update(zip(keys.tolist(), range(start, start + len(keys))))
+
+    def position(self, key):
+        """Row position of a key; raises KeyError for unknown keys"""
+        return self._positions[key]
+
+    def positions(self, keys):
+        """Row positions of many keys as an int64 array, -1 for unknown keys"""
+        keys = np.asarray(keys).tolist()
+        return np.fromiter((self._positions.get(key, -1) for key in keys), dtype=np.int64, count=len(keys))
+
+    def __contains__(self, key):
+        return key in self._positions
+
+    def __len__(self):
+        return len(self._positions)
+
+
+class PairIndex:
+    """Set of (left, right) integer key pairs, such as (employee_id, training_id).
+
+    Each pair is packed into one int64 so membership checks for a whole batch
+    of candidates are a single pass over the batch.
+    """
+
+    def __init__(self, left, right):
+        self._codes = set()
+        self.add(left, right)
+
+    @staticmethod
+    def encode(left, right):
+        """Pack two integer key columns into one int64 code per row"""
+        return (np.asarray(left, dtype=np.int64) << 32) | np.asarray(right, dtype=np.int64)
+
+    def add(self, left, right):
+        """Register new pairs"""
+        self._codes.update(self.encode(left, right).tolist())
+
+    def contains(self, left, right):
+        """Boolean array telling which candidate pairs are already registered"""
+        codes = self.encode(left, right).tolist()
+        return np.fromiter((code in self._codes for code in codes), dtype=bool, count=len(codes))
+
+    def __len__(self):
+        return len(self._codes)
+
+
+class RoleIndex:
+    """Exact role -> catalog keys index parsed from comma-separated role lists.
+
+    Built from a catalog's `required_for_roles` column, where each entry
+    names roles exactly and 'All' marks items every role needs. Keys come
+    back in catalog order.
+    """
+
+    EVERYONE = 'all'
+
+    def __init__(self, keys, role_lists):
+        self._keys = np.asarray(keys)
+        self._universal = np.zeros(len(self._keys), dtype=bool)
+        self._masks = {}
+        for position, roles in enumerate(role_lists):
+            if not isinstance(roles, str):
+                continue
+            for role in roles.split(','):
+                role = role.strip()
+                if not role:
+                    continue
+                if role.casefold() == self.EVERYONE:
+                    self._universal[position] = True
+                else:
+                    self._masks.setdefault(role, np.zeros(len(self._keys), dtype=bool))[position] = True
+
+    def keys_for(self, role):
+        """Keys required for a role, including those required for everyone"""
+        mask = self._masks.get(role)
+        return self._keys[self._universal if mask is None else self._universal | mask]
+
+    def required_pairs(self, owners, roles):
+        """Every (owner, key) pair required by the owners' roles, as two aligned arrays.
+
+        Works one distinct role at a time, so the cost is one vectorized
+        repeat/tile per role rather than a lookup per owner.
+        """
+        owners = np.asarray(owners)
+        roles = pd.Series(roles, copy=False).astype(object).to_numpy()
+        left, right = [np.empty(0, dtype=owners.dtype)], [self._keys[:0]]
+        for role in pd.unique(roles):
+            keys = self.keys_for(role)
+            members = owners[roles == role]
+            left.append(np.repeat(members, len(keys)))
+            right.append(np.tile(keys, len(members)))
+        return np.concatenate(left), np.concatenate(right)
+
+
+class LevelMatrix:
+    """Dense grid of small ordinal levels, such as employee x skill proficiency.
+
+    Rows and columns are the row positions of two tables, so their KeyIndexes
+    map keys to cells and the levels of a group of rows are reduced with
+    NumPy in one pass. Levels are int8 with 0 meaning "no level recorded".
+    """
+
+    def __init__(self, rows, columns):
+        self.levels = np.zeros((rows, columns), dtype=np.int8)
+
+    @property
+    def shape(self):
+        return self.levels.shape
+
+    def resize(self, rows, columns):
+        """Grow to rows x columns; new cells have no level"""
+        grown = np.zeros((rows, columns), dtype=np.int8)
+        old_rows, old_columns = self.levels.shape
+        grown[:old_rows, :old_columns] = self.levels
+        self.levels = grown
+
+    def set(self, rows, columns, levels):
+        """Write levels at the given (row, column) positions; later duplicates win"""
+        self.levels[np.asarray(rows), np.asarray(columns)] = levels
+
+    def take(self, rows):
+        """Copy of the levels in the given rows"""
+        return self.levels[np.asarray(rows)]
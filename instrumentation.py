@@ -0,0 +1,127 @@
+"""Opt-in timing of page sections and helper calls, with rolling percentiles and a JSON-lines log"""
+import contextlib
+import functools
+import json
+import threading
+import time
+from collections import defaultdict, deque
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+
+# Timings kept per section or helper for the rolling percentiles
+TIMING_WINDOW = 500
+
+# Most recent individual records kept for the diagnostics page
+RECENT_RECORDS = 200
+
+
+def result_rows(value):
+    """Rows in a DataFrame/Series result, or in every frame of a tuple result; None otherwise"""
+    if isinstance(value, (pd.DataFrame, pd.Series)):
+        return len(value)
+    if isinstance(value, tuple):
+        sizes = [len(v) for v in value if isinstance(v, (pd.DataFrame, pd.Series))]
+        return sum(sizes) if sizes else None
+    return None
+
+
+class _Section:
+    """Context manager timing one run of a page section; helpers called inside are attributed to it"""
+
+    def __init__(self, timings, name):
+        self._timings = timings
+        self.name = name
+
+    def __enter__(self):
+        local = self._timings._local
+        self._outer = getattr(local, 'section', None)
+        local.section = self.name
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._timings.record(self.name, time.perf_counter() - self._start, kind='section')
+        self._timings._local.section = self._outer
+        return False
+
+
+class Timings:
+    """Rolling timings of page sections and helpers, shared by all sessions.
+
+    Nothing is measured while `enabled` is false: sections and timed helpers
+    cost one attribute check. When `log_path` is set every
+    record is also appended to it as one JSON object per line.
+    """
+
+    def __init__(self, enabled=False, log_path=None, window=TIMING_WINDOW):
+        self.enabled = enabled
+        self.log_path = log_path
+        self.window = window
+        self._samples = defaultdict(lambda: deque(maxlen=self.window))
+        self._recent = deque(maxlen=RECENT_RECORDS)
+        self._kinds = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def section(self, name):
+        """Context manager timing a page section"""
+        if not self.enabled:
+            return contextlib.nullcontext()
+        return _Section(self, name)
+
+    def timed(self, func):
+        """Decorator recording each call's duration and result size"""
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.enabled:
+                return func(*args, **kwargs)
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            self.record(func.__name__, time.perf_counter() - start, result_rows(result), kind='helper')
+            return result
+        return wrapper
+
+    def record(self, name, seconds, rows=None, kind='helper'):
+        entry = {
+            'time': datetime.now().isoformat(timespec='milliseconds'),
+            'kind': kind,
+            'name': name,
+            'section': getattr(self._local, 'section', None),
+            'ms': round(seconds * 1000, 3),
+            'rows': rows,
+        }
+        with self._lock:
+            self._samples[name].append((seconds, rows))
+            self._kinds[name] = kind
+            self._recent.append(entry)
+            if self.log_path:
+                with open(self.log_path, 'a') as log:
+                    log.write(json.dumps(entry) + "\n")
+
+    def summary(self):
+        """One row per section or helper: calls in the window, percentiles and max in ms, last result rows"""
+        with self._lock:
+            samples = {name: list(values) for name, values in self._samples.items()}
+            kinds = dict(self._kinds)
+        rows = []
+        for name, values in samples.items():
+            ms = np.array([seconds for seconds, _ in values]) * 1000
+            p50, p95, p99 = np.percentile(ms, [50, 95, 99])
+            rows.append({'kind': kinds[name], 'name': name, 'calls': len(ms), 'p50_ms': p50, 'p95_ms': p95,
+                         'p99_ms': p99, 'max_ms': ms.max(), 'rows': values[-1][1]})
+        columns = ['kind', 'name', 'calls', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'rows']
+        summary = pd.DataFrame(rows, columns=columns).astype({'calls': 'int64', 'rows': 'Int64'})
+        return summary.sort_values('p95_ms', ascending=False, ignore_index=True)
+
+    def recent(self):
+        """The latest individual records, newest first"""
+        with self._lock:
+            return pd.DataFrame(list(reversed(self._recent)), columns=['time', 'kind', 'name', 'section', 'ms', 'rows'])
+
+    def clear(self):
+        with self._lock:
+            self._samples.clear()
+            self._kinds.clear()
+            self._recent.clear()
@@ -0,0 +1,265 @@
+"""Renewal-reminder digests delivered concurrently over pooled SMTP connections.
+
+For local testing, run an SMTP sink such as `python -m aiosmtpd -n -l localhost:8025`
+and leave TRACKER_SMTP_HOST / TRACKER_SMTP_PORT at their defaults.
+"""
+import asyncio
+import os
+import smtplib
+import time
+from email.message import EmailMessage
+
+import pandas as pd
+
+import schema
+
+# SMTP relay
+SMTP_HOST = os.environ.get('TRACKER_SMTP_HOST', 'localhost')
+SMTP_PORT = int(os.environ.get('TRACKER_SMTP_PORT', '8025'))
+SMTP_USER = os.environ.get('TRACKER_SMTP_USER')
+SMTP_PASSWORD = os.environ.get('TRACKER_SMTP_PASSWORD')
+SMTP_STARTTLS = os.environ.get('TRACKER_SMTP_STARTTLS') == '1'
+SENDER = os.environ.get('TRACKER_SMTP_FROM', 'compliance@company.com')
+
+# Delivery tuning: open connections, messages per second, attempts per message
+SMTP_CONNECTIONS = int(os.environ.get('TRACKER_SMTP_CONNECTIONS', '8'))
+SEND_RATE = float(os.environ.get('TRACKER_SMTP_RATE', '100'))
+SEND_ATTEMPTS = 3
+RETRY_DELAY = 1.0
+SMTP_TIMEOUT = 30
+
+# Delivered reminders are written to the log in batches of this size
+LOG_BATCH = 500
+
+# Alert buckets, in the order they appear in a digest
+BUCKETS = {
+    'expired': 'Expired',
+    'expiring_30': 'Expiring within 30 days',
+    'expiring_90': 'Expiring within 90 days',
+}
+
+
+class DeliveryError(Exception):
+    """The SMTP relay could not be reached"""
+
+
+def pending_reminders(alerts, employees, sent):
+    """Certification alerts not reminded yet, joined to active employees with an email address.
+
+    `alerts` maps a BUCKETS key to the certifications in that bucket, with a
+    days_until_expiry column; `sent` holds the (cert_id, bucket) pairs from
+    the reminder log.
+    """
+    rows = pd.concat([df.assign(bucket=bucket) for bucket, df in alerts.items()], ignore_index=True)
+    if not sent.empty:
+        keys = pd.MultiIndex.from_frame(rows[['cert_id', 'bucket']].astype({'cert_id': 'int64'}))
+        rows = rows[~keys.isin(pd.MultiIndex.from_frame(sent[['cert_id', 'bucket']].astype({'cert_id': 'int64'})))]
+    rows = rows.merge(employees[['employee_id', 'name', 'email', 'status']].rename(columns={'status': 'employee_status'}),
+                      on='employee_id')
+    active = (rows['employee_status'] == 'Active') & rows['email'].notna() & (rows['email'] != '')
+    return rows[active].reset_index(drop=True)
+
+
+def compose_digest(name, email, rows):
+    """One email listing every pending certification alert of an employee, grouped by bucket"""
+    lines = [f"Hello {name},", "", "The following certifications need your attention:"]
+    for bucket, label in BUCKETS.items():
+        certs = rows[rows['bucket'] == bucket]
+        if certs.empty:
+            continue
+        lines += ["", label]
+        for cert in certs.itertuples(index=False):
+            when = schema.format_date(cert.expiry_date)
+            status = f"expired on {when}" if bucket == 'expired' else f"expires on {when} ({cert.days_until_expiry} days left)"
+            lines.append(f"  - {cert.cert_name} ({cert.issuing_organization}) {status}")
+    lines += ["", "Please arrange renewal with the issuing organization.", "", "Compliance & Training Tracker"]
+
+    message = EmailMessage()
+    message['From'] = SENDER
+    message['To'] = email
+    message['Subject'] = f"Certification renewal reminder: {len(rows)} item{'s' if len(rows) != 1 else ''}"
+    message.set_content("\n".join(lines))
+    return message
+
+
+class RateLimiter:
+    """Token bucket allowing `rate` acquisitions per second across all senders"""
+
+    def __init__(self, rate):
+        self.rate = rate
+        self.capacity = max(1.0, rate)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class SMTPPool:
+    """Up to `size` SMTP connections, opened on first use and reused between messages"""
+
+    def __init__(self, size, host, port, user=None, password=None, starttls=False):
+        self.host, self.port = host, port
+        self.user, self.password, self.starttls = user, password, starttls
+        self._idle = asyncio.Queue()
+        for _ in range(size):
+            self._idle.put_nowait(None)
+
+    def _connect(self):
+        conn = smtplib.SMTP(self.host, self.port, timeout=SMTP_TIMEOUT)
+        if self.starttls:
+            conn.starttls()
+        if self.user:
+            conn.login(self.user, self.password)
+        return conn
+
+    async def acquire(self):
+        """An open connection; the slot is handed back if connecting fails"""
+        conn = await self._idle.get()
+        if conn is None:
+            try:
+                conn = await asyncio.to_thread(self._connect)
+            except BaseException:
+                self._idle.put_nowait(None)
+                raise
+        return conn
+
+    def release(self, conn):
+        self._idle.put_nowait(conn)
+
+    def discard(self, conn):
+        """Drop a broken connection, freeing its slot for a new one"""
+        try:
+            conn.close()
+        finally:
+            self._idle.put_nowait(None)
+
+    async def close(self):
+        while not self._idle.empty():
+            conn = self._idle.get_nowait()
+            if conn is not None:
+                try:
+                    await asyncio.to_thread(conn.quit)
+                except (smtplib.SMTPException, OSError):
+                    conn.close()
+
+
+async def _deliver(pool, limiter, message):
+    """Send one message with retries; returns None on success or the final error"""
+    delay = RETRY_DELAY
+    for attempt in range(1, SEND_ATTEMPTS + 1):
+        await limiter.acquire()
+        try:
+            conn = await pool.acquire()
+        except smtplib.SMTPAuthenticationError as exc:
+            raise DeliveryError(f"SMTP server {pool.host}:{pool.port} rejected the login: {exc}") from exc
+        except OSError as exc:
+            if attempt == SEND_ATTEMPTS:
+                raise DeliveryError(f"Cannot connect to SMTP server {pool.host}:{pool.port}: {exc}") from exc
+        else:
+            try:
+                await asyncio.to_thread(conn.send_message, message)
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as exc:
+                pool.release(conn)
+                if attempt == SEND_ATTEMPTS or not 400 <= getattr(exc, 'smtp_code', 500) < 500:
+                    return str(exc)
+            except (smtplib.SMTPException, OSError) as exc:
+                pool.discard(conn)
+                if attempt == SEND_ATTEMPTS:
+                    return str(exc)
+            else:
+                pool.release(conn)
+                return None
+        await asyncio.sleep(delay)
+        delay *= 2
+
+
+async def send_digests(digests, on_sent, progress=None, host=SMTP_HOST, port=SMTP_PORT,
+                       connections=SMTP_CONNECTIONS, rate=SEND_RATE, log_batch=LOG_BATCH):
+    """Send (key, message) digests with one worker per pooled connection.
+
+    Keys of delivered digests are handed to `on_sent(keys)` in batches of
+    `log_batch`, on a thread so recording them does not stall the sends.
+    Returns a list of (key, error) for digests that failed after all
+    attempts. Raises DeliveryError when the relay cannot be reached or
+    rejects the login; the other workers stop taking new digests but finish
+    the ones in flight, and everything delivered is still passed to
+    `on_sent` before the error propagates.
+    """
+    pool = SMTPPool(connections, host, port, SMTP_USER, SMTP_PASSWORD, SMTP_STARTTLS)
+    limiter = RateLimiter(rate)
+    queue = asyncio.Queue()
+    for digest in digests:
+        queue.put_nowait(digest)
+    total, done, failures, sent = queue.qsize(), 0, [], []
+    abort = asyncio.Event()
+
+    async def flush():
+        batch = sent[:]
+        sent.clear()
+        if batch:
+            await asyncio.to_thread(on_sent, batch)
+
+    async def worker():
+        nonlocal done
+        while not queue.empty() and not abort.is_set():
+            key, message = queue.get_nowait()
+            try:
+                error = await _deliver(pool, limiter, message)
+            except BaseException:
+                abort.set()
+                raise
+            if error is None:
+                sent.append(key)
+                if len(sent) >= log_batch:
+                    await flush()
+            else:
+                failures.append((key, error))
+            done += 1
+            if progress is not None:
+                progress(done / total)
+
+    try:
+        outcomes = await asyncio.gather(
+            *(worker() for _ in range(max(1, min(connections, total)))), return_exceptions=True
+        )
+    finally:
+        try:
+            await flush()
+        finally:
+            await pool.close()
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+    return failures
+
+
+def send_renewal_reminders(storage, alerts, employees, progress=None, **smtp):
+    """Send one digest per employee covering every alert not reminded yet and log what was delivered.
+
+    Returns the number of digests sent, the certification alerts they
+    covered, and the (employee_id, error) pairs of failed digests.
+    """
+    pending = pending_reminders(alerts, employees, storage.sent_reminders())
+    groups = dict(tuple(pending.groupby('employee_id', sort=False)))
+    digests = [
+        (employee_id, compose_digest(rows['name'].iat[0], rows['email'].iat[0], rows))
+        for employee_id, rows in groups.items()
+    ]
+
+    def on_sent(employee_ids):
+        storage.log_reminders(pd.concat([groups[employee_id] for employee_id in employee_ids]))
+
+    failures = asyncio.run(send_digests(digests, on_sent, progress=progress, **smtp))
+    failed = {employee_id for employee_id, _ in failures}
+    covered = sum(len(rows) for employee_id, rows in groups.items() if employee_id not in failed)
+    return {'sent': len(digests) - len(failures), 'alerts': covered, 'failed': failures}
@@ -0,0 +1,130 @@
+"""Minimal PDF writer for text-and-rules documents, using only the standard library.
+
+Pages use the built-in Helvetica fonts, which every PDF reader provides, so
+nothing is embedded and documents stay a few kilobytes. Coordinates are in
+points measured from the top-left corner of the page.
+"""
+import zlib
+
+# Page sizes in points (width, height)
+LETTER = (612, 792)
+A4 = (595, 842)
+
+FONTS = {False: 'Helvetica', True: 'Helvetica-Bold'}
+
+# Glyph widths of the printable ASCII range (32..126) in 1/1000 em, from the Adobe AFM files
+_WIDTHS = {
+    False: [
+        278, 278, 355, 556, 556, 889, 667, 191, 333, 333, 389, 584, 278, 333, 278, 278,
+        556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 278, 278, 584, 584, 584, 556,
+        1015, 667, 667, 722, 722, 667, 611, 778, 722, 278, 500, 667, 556, 833, 722, 778,
+        667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 278, 278, 278, 469, 556,
+        333, 556, 556, 500, 556, 556, 278, 556, 556, 222, 222, 500, 222, 833, 556, 556,
+        556, 556, 333, 500, 278, 556, 500, 722, 500, 500, 500, 334, 260, 334, 584,
+    ],
+    True: [
+        278, 333, 474, 556, 556, 889, 722, 238, 333, 333, 389, 584, 278, 333, 278, 278,
+        556, 556, 556, 556, 556, 556, 556, 556, 556, 556, 333, 333, 584, 584, 584, 611,
+        975, 722, 722, 722, 722, 667, 611, 778, 722, 278, 556, 722, 611, 833, 722, 778,
+        667, 778, 722, 667, 611, 722, 667, 944, 667, 667, 611, 333, 278, 333, 584, 556,
+        333, 556, 611, 556, 611, 556, 333, 611, 611, 278, 278, 556, 278, 889, 611, 611,
+        611, 611, 389, 556, 333, 611, 556, 778, 556, 556, 500, 389, 280, 389, 584,
+    ],
+}
+_DEFAULT_WIDTH = 556
+
+
+def text_width(text, size, bold=False):
+    """Width of a line of text in points"""
+    widths = _WIDTHS[bold]
+    return size * sum(widths[code - 32] if 32 <= code < 127 else _DEFAULT_WIDTH for code in map(ord, text)) / 1000
+
+
+def fit_text(text, width, size, bold=False):
+    """The text, cut short with '...' when wider than `width` points"""
+    if text_width(text, size, bold) <= width:
+        return text
+    while text and text_width(text + '...', size, bold) > width:
+        text = text[:-1]
+    return text + '...'
+
+
+def _literal(text):
+    """A PDF string literal in WinAnsi encoding; characters outside it become '?'"""
+    data = text.encode('cp1252', errors='replace')
+    return b'(' + data.replace(b'\\', b'\\\\').replace(b'(', b'\\(').replace(b')', b'\\)') + b')'
+
+
+class PDFDocument:
+    """Pages of positioned text, lines and filled rectangles, serialized with `to_bytes`"""
+
+    def __init__(self, title=None, page_size=LETTER):
+        self.title = title
+        self.width, self.height = page_size
+        self._pages = []
+
+    @property
+    def page_count(self):
+        return len(self._pages)
+
+    def add_page(self):
+        """Start a new page; drawing calls go to the last page unless given another"""
+        self._pages.append([])
+
+    def _ops(self, page):
+        return self._pages[-1 if page is None else page]
+
+    def text(self, x, y, text, size=10, bold=False, page=None):
+        """Draw one line of text with its baseline at (x, y)"""
+        font = b'/F2' if bold else b'/F1'
+        self._ops(page).append(
+            b'BT %s %g Tf %.2f %.2f Td %s Tj ET' % (font, size, x, self.height - y, _literal(str(text)))
+        )
+
+    def line(self, x1, y1, x2, y2, width=0.5, gray=0.0, page=None):
+        self._ops(page).append(
+            b'%.2f w %.2f G %.2f %.2f m %.2f %.2f l S' % (width, gray, x1, self.height - y1, x2, self.height - y2)
+        )
+
+    def rect(self, x, y, width, height, gray=0.9, page=None):
+        """Fill a rectangle whose top-left corner is (x, y)"""
+        self._ops(page).append(
+            b'%.2f g %.2f %.2f %.2f %.2f re f 0 g' % (gray, x, self.height - y - height, width, height)
+        )
+
+    def to_bytes(self):
+        """The document as a PDF file, with each page's content stream deflated"""
+        objects = [
+            b'<< /Type /Catalog /Pages 2 0 R >>',
+            None,  # page tree, written once the page objects are numbered
+            b'<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>' % FONTS[False].encode(),
+            b'<< /Type /Font /Subtype /Type1 /BaseFont /%s /Encoding /WinAnsiEncoding >>' % FONTS[True].encode(),
+        ]
+        kids = []
+        for ops in self._pages or [[]]:
+            content = zlib.compress(b'\n'.join(ops))
+            objects.append(b'<< /Length %d /Filter /FlateDecode >>\nstream\n%s\nendstream' % (len(content), content))
+            objects.append(
+                b'<< /Type /Page /Parent 2 0 R /MediaBox [0 0 %g %g] /Resources << /Font << /F1 3 0 R /F2 4 0 R >> >> '
+                b'/Contents %d 0 R >>' % (self.width, self.height, len(objects))
+            )
+            kids.append(b'%d 0 R' % len(objects))
+        objects[1] = b'<< /Type /Pages /Kids [%s] /Count %d >>' % (b' '.join(kids), len(kids))
+        info = None
+        if self.title:
+            objects.append(b'<< /Title %s /Producer (Compliance & Training Tracker) >>' % _literal(self.title))
+            info = len(objects)
+
+        output = bytearray(b'%PDF-1.4\n%\xe2\xe3\xcf\xd3\n')
+        offsets = []
+        for number, body in enumerate(objects, start=1):
+            offsets.append(len(output))
+            output += b'%d 0 obj\n%s\nendobj\n' % (number, body)
+        xref = len(output)
+        output += b'xref\n0 %d\n0000000000 65535 f \n' % (len(objects) + 1)
+        output += b''.join(b'%010d 00000 n \n' % offset for offset in offsets)
+        output += b'trailer\n<< /Size %d /Root 1 0 R%s >>\n' % (
+            len(objects) + 1, b' /Info %d 0 R' % info if info else b''
+        )
+        output += b'startxref\n%d\n%%%%EOF\n' % xref
+        return bytes(output)
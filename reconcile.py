@@ -0,0 +1,68 @@
+"""Bring assignment and certification statuses in line with their due and expiry dates.
+
+Run headless, e.g. from cron, with:
+
+    python reconcile.py [--db compliance_tracker.db] [--date YYYY-MM-DD] [--dry-run]
+"""
+import argparse
+import os
+import sys
+
+import pandas as pd
+
+# (table, key column, date column, statuses that lapse, status they lapse to)
+RULES = [
+    ('training_assignments', 'assignment_id', 'due_date', ['Not Started', 'In Progress'], 'Overdue'),
+    ('certifications', 'cert_id', 'expiry_date', ['Active'], 'Expired'),
+]
+
+
+def lapsed(df, date_column, statuses, today):
+    """Mask of rows in one of `statuses` whose date is before `today`"""
+    return (df['status'].isin(statuses) & (df[date_column] < today)).to_numpy()
+
+
+def find_changes(tables, today=None):
+    """Status changes due as of `today`, one frame per table with key, date, old and new status"""
+    today = pd.Timestamp(today).normalize() if today is not None else pd.Timestamp.now().normalize()
+    changes = {}
+    for table, key, date_column, statuses, new_status in RULES:
+        df = tables[table]
+        rows = df.loc[lapsed(df, date_column, statuses, today), [key, date_column, 'status']]
+        changes[table] = rows.rename(columns={'status': 'old_status'}).assign(new_status=new_status)
+    return changes
+
+
+def reconcile(store, today=None, dry_run=False):
+    """Apply every due status change to the store in one bulk update per table"""
+    changes = find_changes({table: store.table(table) for table, *_ in RULES}, today)
+    if not dry_run:
+        for table, key, _, _, new_status in RULES:
+            store.update_many(table, changes[table][key], {'status': new_status})
+    return changes
+
+
+def main(argv=None):
+    from data_store import DataStore
+    from storage import DEFAULT_DB_PATH, Storage
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--db', default=DEFAULT_DB_PATH, help="tracker database (default: %(default)s)")
+    parser.add_argument('--date', help="reconcile as of this date instead of today (YYYY-MM-DD)")
+    parser.add_argument('--dry-run', action='store_true', help="report changes without writing them")
+    parser.add_argument('--verbose', action='store_true', help="list every changed row")
+    args = parser.parse_args(argv)
+    if not os.path.isfile(args.db):
+        parser.error(f"database not found: {args.db}")
+
+    changes = reconcile(DataStore(Storage(args.db, seed=False)), today=args.date, dry_run=args.dry_run)
+    for table, rows in changes.items():
+        verb = 'would change' if args.dry_run else 'changed'
+        print(f"{table}: {verb} {len(rows)} statuses")
+        if args.verbose and not rows.empty:
+            print(rows.to_string(index=False))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
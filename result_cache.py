@@ -0,0 +1,60 @@
+"""Least-recently-used cache for results derived from versioned tables"""
+import functools
+import threading
+from collections import OrderedDict
+
+
+class ResultCache:
+    """Results of helper functions keyed by their arguments and the versions of the tables they read.
+
+    Every write bumps its table's version, so an entry computed from older
+    data is never returned again; it simply ages out of the LRU order.
+    `versions` is called with a tuple of table names and returns their
+    current versions. Cached results are shared by all sessions and must be
+    treated as read-only.
+    """
+
+    def __init__(self, versions, maxsize=256):
+        self._versions = versions
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, compute):
+        """Cached value for key, calling compute() and storing its result on a miss"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        result = compute()
+        with self._lock:
+            self._entries[key] = result
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return result
+
+    def cached(self, *tables):
+        """Decorator caching a function's result until one of `tables` changes"""
+        def decorator(func):
+            @functools.wraps(func)
+            def wrapper(*args):
+                key = (func.__qualname__, args, self._versions(tables))
+                return self.get(key, lambda: func(*args))
+            return wrapper
+        return decorator
+
+    def stats(self):
+        """Hit and miss counters and current size"""
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'size': len(self._entries), 'maxsize': self.maxsize}
+
+    def clear(self):
+        """Drop every entry and reset the counters"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
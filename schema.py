@@ -0,0 +1,204 @@
+"""Column types for every tracker table and helpers to apply them"""
+from datetime import date, datetime
+
+import pandas as pd
+
+# Enumerations offered by the forms
+ROLES = ['Manager', 'Safety Officer', 'Forklift Operator', 'Warehouse Worker',
+         'HR Specialist', 'Supervisor', 'Technician', 'Administrator']
+DEPARTMENTS = ['Operations', 'Warehouse', 'Management', 'HR', 'Logistics',
+               'Maintenance', 'Quality Control', 'Administration']
+EMPLOYEE_STATUSES = ['Active', 'Inactive']
+CERT_STATUSES = ['Active', 'Expired', 'Suspended']
+ASSIGNMENT_STATUSES = ['Not Started', 'In Progress', 'Completed', 'Overdue']
+FREQUENCIES = ['Once', 'Annual', 'Semi-Annual', 'Quarterly', 'Monthly']
+COMPLIANCE_TYPES = ['OSHA', 'Legal', 'Professional', 'Internal', 'Industry Standard']
+PROFICIENCY_LEVELS = ['Beginner', 'Intermediate', 'Advanced', 'Expert']
+
+# Column kinds
+ID = 'id'
+DATE = 'date'
+PROFICIENCY = pd.CategoricalDtype(PROFICIENCY_LEVELS, ordered=True)
+
+# Integer keys are shown with these prefixes, e.g. employee 1 -> 'E001'
+ID_PREFIXES = {
+    'employee_id': 'E',
+    'cert_id': 'C',
+    'training_id': 'T',
+    'assignment_id': 'A',
+    'skill_id': 'S',
+}
+
+# Columns not listed keep the dtype pandas infers (free text)
+COLUMN_TYPES = {
+    'employees': {
+        'employee_id': ID,
+        'role': pd.CategoricalDtype(ROLES),
+        'department': pd.CategoricalDtype(DEPARTMENTS),
+        'hire_date': DATE,
+        'status': pd.CategoricalDtype(EMPLOYEE_STATUSES),
+    },
+    'certifications': {
+        'cert_id': ID,
+        'employee_id': ID,
+        'issue_date': DATE,
+        'expiry_date': DATE,
+        'status': pd.CategoricalDtype(CERT_STATUSES),
+    },
+    'trainings': {
+        'training_id': ID,
+        'duration_hours': 'int32',
+        'frequency': pd.CategoricalDtype(FREQUENCIES),
+        'compliance_type': pd.CategoricalDtype(COMPLIANCE_TYPES),
+    },
+    'training_assignments': {
+        'assignment_id': ID,
+        'employee_id': ID,
+        'training_id': ID,
+        'assigned_date': DATE,
+        'due_date': DATE,
+        'completion_date': DATE,
+        'status': pd.CategoricalDtype(ASSIGNMENT_STATUSES),
+        'score': 'float32',
+    },
+    'skills_matrix': {
+        'skill_id': ID,
+    },
+    'employee_skills': {
+        'employee_id': ID,
+        'skill_id': ID,
+        'current_level': PROFICIENCY,
+        'required_level': PROFICIENCY,
+        'last_assessed': DATE,
+    },
+}
+
+ID_DTYPE = 'int32'
+# One resolution for every date column, whether parsed from text or built from Timestamps/NaT
+DATE_DTYPE = 'datetime64[us]'
+DATE_FORMAT = '%Y-%m-%d'
+
+
+def parse_ids(values):
+    """Convert keys such as 'E001' or 1 into integers"""
+    values = pd.Series(values)
+    if pd.api.types.is_integer_dtype(values):
+        return values.astype(ID_DTYPE)
+    digits = values.astype(str).str.replace(r'^[A-Za-z]+', '', regex=True)
+    return pd.to_numeric(digits).astype(ID_DTYPE)
+
+
+def format_id(column, value):
+    """Display form of a single integer key, e.g. format_id('employee_id', 1) -> 'E001'"""
+    return f"{ID_PREFIXES[column]}{int(value):03d}"
+
+
+def format_ids(column, values):
+    """Display form of a series of integer keys"""
+    return ID_PREFIXES[column] + values.astype('int64').astype(str).str.zfill(3)
+
+
+def format_date(value):
+    """Display form of a single date, empty for missing values"""
+    return '' if pd.isna(value) else pd.Timestamp(value).strftime(DATE_FORMAT)
+
+
+def _categorical(series, dtype):
+    """Cast to a categorical, extending unordered enums with unseen values"""
+    if not dtype.ordered:
+        known = set(dtype.categories)
+        extra = [v for v in pd.unique(series.dropna().astype(str)) if v not in known]
+        if extra:
+            dtype = pd.CategoricalDtype(list(dtype.categories) + extra)
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        series = series.astype(object)
+    return series.astype(dtype)
+
+
+def coerce(table, df):
+    """Apply the table's column types to a DataFrame loaded from storage, seeds or forms"""
+    df = df.copy()
+    for column, kind in COLUMN_TYPES[table].items():
+        if column not in df.columns:
+            continue
+        if kind == ID:
+            df[column] = parse_ids(df[column]).to_numpy()
+        elif kind == DATE:
+            df[column] = pd.to_datetime(df[column], errors='coerce').astype(DATE_DTYPE)
+        elif isinstance(kind, pd.CategoricalDtype):
+            df[column] = _categorical(df[column], kind)
+        else:
+            df[column] = df[column].astype(kind)
+    return df
+
+
+def align_categories(existing, records):
+    """Give matching categorical columns of two frames the same categories so concat keeps them"""
+    for column in existing.columns.intersection(records.columns):
+        left, right = existing[column], records[column]
+        if isinstance(left.dtype, pd.CategoricalDtype) and isinstance(right.dtype, pd.CategoricalDtype):
+            missing = [c for c in right.cat.categories if c not in left.cat.categories]
+            if missing:
+                existing[column] = left.cat.add_categories(missing)
+            records[column] = right.cat.set_categories(existing[column].cat.categories)
+    return existing, records
+
+
+def coerce_value(table, column, value):
+    """Apply a column's type to a single value written through an edit"""
+    kind = COLUMN_TYPES[table].get(column)
+    if value is None:
+        return pd.NaT if kind == DATE else value
+    if kind == ID:
+        return int(parse_ids([value]).iloc[0])
+    if kind == DATE:
+        return pd.Timestamp(value)
+    return value
+
+
+def to_storage(table, df):
+    """Plain Python/ISO-text form of a typed frame for writing to SQLite"""
+    df = df.copy()
+    for column, kind in COLUMN_TYPES[table].items():
+        if column not in df.columns:
+            continue
+        if kind == DATE:
+            dates = pd.to_datetime(df[column], errors='coerce')
+            df[column] = dates.dt.strftime(DATE_FORMAT).astype(object).where(dates.notna(), None)
+        elif isinstance(kind, pd.CategoricalDtype):
+            df[column] = df[column].astype(object).where(df[column].notna(), None)
+    return df
+
+
+def to_sql_value(value):
+    """Convert a single typed value into something sqlite3 can bind"""
+    if value is None or (not isinstance(value, str) and pd.isna(value)):
+        return None
+    if isinstance(value, (datetime, date)):
+        return value.strftime(DATE_FORMAT)
+    if hasattr(value, 'item'):
+        return value.item()
+    return value
+
+
+def proficiency_number(levels):
+    """Beginner..Expert as 1..4, missing levels as NaN"""
+    codes = pd.Series(levels, copy=False).astype(PROFICIENCY).cat.codes
+    return codes.where(codes >= 0).astype('float32') + 1
+
+
+def proficiency_codes(levels):
+    """Beginner..Expert as int8 1..4, missing levels as 0"""
+    codes = pd.Series(levels, copy=False).astype(PROFICIENCY).cat.codes
+    return (codes + 1).astype('int8').to_numpy()
+
+
+def for_display(df):
+    """Copy of a frame with keys shown as 'E001' and dates as 'YYYY-MM-DD'"""
+    df = df.copy()
+    for column in df.columns:
+        if column in ID_PREFIXES and pd.api.types.is_integer_dtype(df[column]):
+            df[column] = format_ids(column, df[column])
+        elif pd.api.types.is_datetime64_any_dtype(df[column]):
+            df[column] = df[column].dt.strftime(DATE_FORMAT).astype(object).where(df[column].notna(), None)
+    return df
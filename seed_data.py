@@ -0,0 +1,58 @@
+"""Seed data used to initialize an empty tracker database"""
+
+SEED_DATA = {
+    'employees': {
+        'employee_id': ['E001', 'E002', 'E003', 'E004', 'E005', 'E006', 'E007', 'E008'],
+        'name': ['John Smith', 'Sarah Johnson', 'Mike Wilson', 'Emily Brown', 'David Lee', 'Lisa Anderson', 'Tom Davis', 'Anna Martinez'],
+        'role': ['Safety Officer', 'Forklift Operator', 'Manager', 'HR Specialist', 'Forklift Operator', 'Safety Officer', 'Manager', 'Warehouse Worker'],
+        'department': ['Operations', 'Warehouse', 'Management', 'HR', 'Warehouse', 'Operations', 'Management', 'Warehouse'],
+        'email': ['john.smith@company.com', 'sarah.j@company.com', 'mike.w@company.com', 'emily.b@company.com', 
+                 'david.l@company.com', 'lisa.a@company.com', 'tom.d@company.com', 'anna.m@company.com'],
+        'hire_date': ['2020-01-15', '2019-06-01', '2018-03-20', '2021-05-10', '2020-12-15', '2019-02-28', '2017-07-15', '2021-04-01'],
+        'status': ['Active', 'Active', 'Active', 'Active', 'Active', 'Active', 'Active', 'Active'],
+        'phone': ['555-0101', '555-0102', '555-0103', '555-0104', '555-0105', '555-0106', '555-0107', '555-0108']
+    },
+    'certifications': {
+        'cert_id': ['C001', 'C002', 'C003', 'C004', 'C005', 'C006', 'C007', 'C008'],
+        'employee_id': ['E001', 'E002', 'E003', 'E001', 'E005', 'E006', 'E002', 'E004'],
+        'cert_name': ['OSHA 30', 'Forklift License', 'Leadership Cert', 'First Aid', 'Forklift License', 'OSHA 30', 'Safety Training', 'HR Compliance'],
+        'issue_date': ['2023-01-15', '2023-06-01', '2023-03-20', '2023-05-10', '2022-12-15', '2023-02-28', '2023-07-15', '2023-04-01'],
+        'expiry_date': ['2024-01-15', '2024-06-01', '2026-03-20', '2025-05-10', '2023-12-15', '2024-02-28', '2024-07-15', '2025-04-01'],
+        'status': ['Active', 'Active', 'Active', 'Active', 'Expired', 'Active', 'Active', 'Active'],
+        'issuing_organization': ['OSHA', 'State DOT', 'Leadership Academy', 'Red Cross', 'State DOT', 'OSHA', 'Safety Institute', 'SHRM']
+    },
+    'trainings': {
+        'training_id': ['T001', 'T002', 'T003', 'T004', 'T005'],
+        'training_name': ['Workplace Safety', 'Data Privacy & Security', 'Leadership Development', 'Anti-Harassment', 'Emergency Response'],
+        'description': ['Basic workplace safety procedures', 'GDPR and data protection', 'Management skills', 'Workplace conduct', 'Emergency protocols'],
+        'duration_hours': [4, 2, 8, 3, 4],
+        'required_for_roles': ['All', 'All', 'Manager', 'All', 'Safety Officer,Forklift Operator'],
+        'frequency': ['Annual', 'Annual', 'Once', 'Annual', 'Semi-Annual'],
+        'compliance_type': ['OSHA', 'Legal', 'Professional', 'Legal', 'OSHA']
+    },
+    'training_assignments': {
+        'assignment_id': ['A001', 'A002', 'A003', 'A004', 'A005', 'A006', 'A007', 'A008'],
+        'employee_id': ['E001', 'E002', 'E003', 'E004', 'E001', 'E005', 'E006', 'E007'],
+        'training_id': ['T001', 'T001', 'T003', 'T002', 'T005', 'T001', 'T005', 'T003'],
+        'assigned_date': ['2024-01-01', '2024-01-01', '2024-01-15', '2024-01-10', '2024-01-05', '2024-01-12', '2024-01-08', '2024-01-20'],
+        'due_date': ['2024-03-01', '2024-03-01', '2024-04-15', '2024-03-10', '2024-03-05', '2024-03-12', '2024-03-08', '2024-04-20'],
+        'completion_date': ['2024-02-15', None, '2024-02-20', '2024-02-28', None, None, '2024-02-25', None],
+        'status': ['Completed', 'In Progress', 'Completed', 'Completed', 'Overdue', 'In Progress', 'Completed', 'Not Started'],
+        'score': [95.0, None, 88.0, 92.0, None, None, 90.0, None]
+    },
+    'skills_matrix': {
+        'skill_id': ['S001', 'S002', 'S003', 'S004', 'S005'],
+        'skill_name': ['Safety Protocols', 'Equipment Operation', 'Leadership', 'Compliance Knowledge', 'Emergency Response'],
+        'required_for_roles': ['All', 'Forklift Operator', 'Manager', 'HR Specialist,Safety Officer', 'Safety Officer'],
+        'proficiency_levels': ['Beginner,Intermediate,Advanced,Expert', 'Beginner,Intermediate,Advanced,Expert', 
+                              'Beginner,Intermediate,Advanced,Expert', 'Beginner,Intermediate,Advanced,Expert',
+                              'Beginner,Intermediate,Advanced,Expert']
+    },
+    'employee_skills': {
+        'employee_id': ['E001', 'E001', 'E002', 'E003', 'E004', 'E005', 'E006', 'E007'],
+        'skill_id': ['S001', 'S005', 'S002', 'S003', 'S004', 'S002', 'S001', 'S003'],
+        'current_level': ['Expert', 'Advanced', 'Advanced', 'Advanced', 'Expert', 'Intermediate', 'Advanced', 'Expert'],
+        'required_level': ['Advanced', 'Advanced', 'Advanced', 'Expert', 'Advanced', 'Advanced', 'Advanced', 'Advanced'],
+        'last_assessed': ['2024-01-15', '2024-01-15', '2024-01-20', '2024-01-10', '2024-01-18', '2024-01-22', '2024-01-12', '2024-01-25']
+    },
+}
@@ -0,0 +1,386 @@
+"""SQLite storage backend for the Compliance & Training Tracker"""
+import os
+import sqlite3
+import threading
+
+import pandas as pd
+
+import schema
+from seed_data import SEED_DATA
+
+DEFAULT_DB_PATH = os.environ.get('TRACKER_DB_PATH', 'compliance_tracker.db')
+
+# Table name -> primary key columns, in the order the tables are created and seeded
+TABLES = {
+    'employees': ['employee_id'],
+    'certifications': ['cert_id'],
+    'trainings': ['training_id'],
+    'training_assignments': ['assignment_id'],
+    'skills_matrix': ['skill_id'],
+    'employee_skills': ['employee_id', 'skill_id'],
+}
+
+TABLES_SQL = """
+CREATE TABLE IF NOT EXISTS employees (
+    employee_id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    role TEXT,
+    department TEXT,
+    email TEXT,
+    hire_date TEXT,
+    status TEXT,
+    phone TEXT
+);
+
+CREATE TABLE IF NOT EXISTS certifications (
+    cert_id INTEGER PRIMARY KEY,
+    employee_id INTEGER NOT NULL,
+    cert_name TEXT,
+    issue_date TEXT,
+    expiry_date TEXT,
+    status TEXT,
+    issuing_organization TEXT
+);
+
+CREATE TABLE IF NOT EXISTS trainings (
+    training_id INTEGER PRIMARY KEY,
+    training_name TEXT NOT NULL,
+    description TEXT,
+    duration_hours INTEGER,
+    required_for_roles TEXT,
+    frequency TEXT,
+    compliance_type TEXT
+);
+
+CREATE TABLE IF NOT EXISTS training_assignments (
+    assignment_id INTEGER PRIMARY KEY,
+    employee_id INTEGER NOT NULL,
+    training_id INTEGER NOT NULL,
+    assigned_date TEXT,
+    due_date TEXT,
+    completion_date TEXT,
+    status TEXT,
+    score REAL
+);
+
+CREATE TABLE IF NOT EXISTS skills_matrix (
+    skill_id INTEGER PRIMARY KEY,
+    skill_name TEXT NOT NULL,
+    required_for_roles TEXT,
+    proficiency_levels TEXT
+);
+
+CREATE TABLE IF NOT EXISTS employee_skills (
+    employee_id INTEGER NOT NULL,
+    skill_id INTEGER NOT NULL,
+    current_level TEXT,
+    required_level TEXT,
+    last_assessed TEXT,
+    PRIMARY KEY (employee_id, skill_id)
+);
+
+CREATE TABLE IF NOT EXISTS reminder_log (
+    cert_id INTEGER NOT NULL,
+    bucket TEXT NOT NULL,
+    employee_id INTEGER NOT NULL,
+    email TEXT,
+    sent_at TEXT NOT NULL,
+    PRIMARY KEY (cert_id, bucket)
+);
+
+CREATE TABLE IF NOT EXISTS sequences (
+    name TEXT PRIMARY KEY,
+    next_id INTEGER NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS table_versions (
+    name TEXT PRIMARY KEY,
+    version INTEGER NOT NULL
+);
+"""
+
+INDEXES_SQL = """
+CREATE INDEX IF NOT EXISTS idx_employees_department ON employees (department);
+CREATE INDEX IF NOT EXISTS idx_employees_status ON employees (status);
+CREATE INDEX IF NOT EXISTS idx_certifications_employee ON certifications (employee_id);
+CREATE INDEX IF NOT EXISTS idx_certifications_expiry ON certifications (expiry_date);
+CREATE INDEX IF NOT EXISTS idx_certifications_status ON certifications (status);
+CREATE INDEX IF NOT EXISTS idx_assignments_employee ON training_assignments (employee_id);
+CREATE INDEX IF NOT EXISTS idx_assignments_training ON training_assignments (training_id);
+CREATE INDEX IF NOT EXISTS idx_assignments_status ON training_assignments (status);
+CREATE INDEX IF NOT EXISTS idx_assignments_due ON training_assignments (due_date);
+CREATE INDEX IF NOT EXISTS idx_employee_skills_skill ON employee_skills (skill_id);
+"""
+
+# Columns the employee directory can be sorted by
+EMPLOYEE_SORT_COLUMNS = ['name', 'employee_id', 'department', 'role', 'hire_date', 'status']
+
+# PRAGMA user_version of a database created with the current TABLES_SQL
+SCHEMA_VERSION = 1
+
+
+def _placeholders(values):
+    """Build a '?, ?, ?' placeholder list for an IN clause"""
+    return ', '.join('?' for _ in values)
+
+
+class Storage:
+    """Embedded SQLite database holding every tracker table"""
+
+    def __init__(self, path=DEFAULT_DB_PATH, seed=True):
+        self.path = path
+        self._local = threading.local()
+        self._write_lock = threading.Lock()
+
+        with self._write_lock, self.connection() as conn:
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            has_tables = conn.execute(
+                "SELECT COUNT(*) FROM sqlite_master WHERE type = 'table' AND name = 'employees'"
+            ).fetchone()[0]
+            if has_tables and version < 1:
+                self._migrate_integer_keys(conn)
+            conn.executescript(TABLES_SQL)
+            conn.executescript(INDEXES_SQL)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            if seed and conn.execute("SELECT COUNT(*) FROM employees").fetchone()[0] == 0:
+                self._seed(conn)
+
+    def connection(self):
+        """Get the calling thread's connection, opening it on first use"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def _seed(self, conn):
+        """Populate an empty database with the demo data"""
+        for table in TABLES:
+            seed = schema.coerce(table, pd.DataFrame(SEED_DATA[table]))
+            schema.to_storage(table, seed).to_sql(table, conn, if_exists='append', index=False)
+
+    def _migrate_integer_keys(self, conn):
+        """Rebuild tables created with text keys such as 'E001' using integer keys"""
+        for table in TABLES:
+            conn.execute(f"ALTER TABLE {table} RENAME TO {table}_text_keys")
+        conn.executescript(TABLES_SQL)
+        for table in TABLES:
+            columns = [row[1] for row in conn.execute(f"PRAGMA table_info({table})")]
+            select = ', '.join(
+                f"CAST(substr({column}, 2) AS INTEGER)" if column in schema.ID_PREFIXES else column
+                for column in columns
+            )
+            conn.execute(
+                f"INSERT INTO {table} ({', '.join(columns)}) "
+                f"SELECT {select} FROM {table}_text_keys ORDER BY rowid"
+            )
+            conn.execute(f"DROP TABLE {table}_text_keys")
+
+    # Reads
+    def query(self, sql, params=()):
+        """Run a SELECT and return the result as a DataFrame"""
+        return pd.read_sql_query(sql, self.connection(), params=list(params))
+
+    def scalar(self, sql, params=()):
+        """Run a SELECT returning a single value"""
+        row = self.connection().execute(sql, list(params)).fetchone()
+        return row[0] if row else None
+
+    def read_table(self, table):
+        """Load a whole table in insertion order with its schema types applied"""
+        return schema.coerce(table, self.query(f"SELECT * FROM {table} ORDER BY rowid"))
+
+    # Writes; each returns the table's new version, or None when nothing was written
+    @staticmethod
+    def _bump_version(conn, table):
+        """Count a write to a table so other processes sharing the database can notice it"""
+        return conn.execute(
+            "INSERT INTO table_versions (name, version) VALUES (?, 1) "
+            "ON CONFLICT (name) DO UPDATE SET version = version + 1 RETURNING version",
+            (table,)
+        ).fetchone()[0]
+
+    def table_versions(self):
+        """{table: number of writes so far}, for tables written since versions were kept"""
+        return dict(self.connection().execute("SELECT name, version FROM table_versions").fetchall())
+
+    def insert(self, table, rows):
+        """Append a DataFrame of new rows to a table, in the same transaction as its version bump"""
+        if rows.empty:
+            return None
+        rows = schema.to_storage(table, rows)
+        columns = list(rows.columns)
+        # Not DataFrame.to_sql: pandas commits its own transaction before the version is bumped
+        with self._write_lock, self.connection() as conn:
+            conn.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({_placeholders(columns)})",
+                [[schema.to_sql_value(value) for value in row] for row in rows.itertuples(index=False)]
+            )
+            return self._bump_version(conn, table)
+
+    def upsert(self, table, rows):
+        """Insert rows, overwriting the other columns of rows whose primary key exists, in one transaction"""
+        if rows.empty:
+            return None
+        keys = TABLES[table]
+        rows = schema.to_storage(table, rows)
+        columns = list(rows.columns)
+        assignments = ', '.join(f"{column} = excluded.{column}" for column in columns if column not in keys)
+        with self._write_lock, self.connection() as conn:
+            conn.executemany(
+                f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({_placeholders(columns)}) "
+                f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {assignments}",
+                [[schema.to_sql_value(value) for value in row] for row in rows.itertuples(index=False)]
+            )
+            return self._bump_version(conn, table)
+
+    def reserve_ids(self, table, count=1):
+        """Reserve `count` consecutive new primary keys for a table and return the first.
+
+        The table's sequence is advanced in one statement, so a key is never
+        handed out twice, even across processes, nor reused after a delete.
+        It never falls behind the table's largest key.
+        """
+        key_column = TABLES[table][0]
+        with self._write_lock, self.connection() as conn:
+            conn.execute("INSERT OR IGNORE INTO sequences (name, next_id) VALUES (?, 1)", (table,))
+            next_id = conn.execute(
+                f"UPDATE sequences SET next_id = MAX(next_id, (SELECT COALESCE(MAX({key_column}), 0) + 1 FROM {table})) + ? "
+                "WHERE name = ? RETURNING next_id",
+                (int(count), table)
+            ).fetchone()[0]
+        return next_id - count
+
+    def update(self, table, keys, values):
+        """Update the columns in `values` for the row identified by `keys`"""
+        assignments = ', '.join(f"{column} = ?" for column in values)
+        conditions = ' AND '.join(f"{column} = ?" for column in keys)
+        params = [schema.to_sql_value(v) for v in values.values()] + [schema.to_sql_value(v) for v in keys.values()]
+        with self._write_lock, self.connection() as conn:
+            conn.execute(f"UPDATE {table} SET {assignments} WHERE {conditions}", params)
+            return self._bump_version(conn, table)
+
+    def update_many(self, table, key_column, keys, values):
+        """Set the same `values` on every row whose `key_column` is in `keys`, in one transaction"""
+        assignments = ', '.join(f"{column} = ?" for column in values)
+        params = [schema.to_sql_value(v) for v in values.values()]
+        with self._write_lock, self.connection() as conn:
+            conn.executemany(
+                f"UPDATE {table} SET {assignments} WHERE {key_column} = ?",
+                [params + [int(key)] for key in keys]
+            )
+            return self._bump_version(conn, table)
+
+    # Renewal reminder delivery log
+    def sent_reminders(self):
+        """(cert_id, bucket) pairs a renewal reminder has already been delivered for"""
+        return self.query("SELECT cert_id, bucket FROM reminder_log")
+
+    def log_reminders(self, rows):
+        """Record delivered reminders from a frame of cert_id, bucket, employee_id and email"""
+        if rows.empty:
+            return
+        sent_at = pd.Timestamp.now().isoformat(timespec='seconds')
+        with self._write_lock, self.connection() as conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO reminder_log (cert_id, bucket, employee_id, email, sent_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                [(int(cert_id), bucket, int(employee_id), email, sent_at)
+                 for cert_id, bucket, employee_id, email in rows[['cert_id', 'bucket', 'employee_id', 'email']].itertuples(index=False)]
+            )
+
+    # Aggregates pushed down to SQL
+    def assignment_status_counts(self):
+        """Number of training assignments per status, largest first"""
+        counts = self.query(
+            "SELECT status, COUNT(*) AS count FROM training_assignments "
+            "GROUP BY status ORDER BY count DESC"
+        )
+        return counts.set_index('status')['count']
+
+    def count_assignments(self, statuses):
+        """Number of training assignments in any of the given statuses"""
+        statuses = list(statuses)
+        return self.scalar(
+            f"SELECT COUNT(*) FROM training_assignments WHERE status IN ({_placeholders(statuses)})",
+            statuses
+        )
+
+    def employee_stats(self):
+        """Headcount, active headcount and number of departments and roles"""
+        row = self.connection().execute(
+            "SELECT COUNT(*), SUM(status = 'Active'), COUNT(DISTINCT department), COUNT(DISTINCT role) "
+            "FROM employees"
+        ).fetchone()
+        return {
+            'total': row[0],
+            'active': row[1] or 0,
+            'departments': row[2],
+            'roles': row[3],
+        }
+
+    @staticmethod
+    def _employee_filter(departments=None, roles=None, status=None):
+        """WHERE clause and parameters for the directory filters; None means no filter"""
+        conditions, params = [], []
+        if departments:
+            conditions.append(f"department IN ({_placeholders(departments)})")
+            params.extend(departments)
+        if roles:
+            conditions.append(f"role IN ({_placeholders(roles)})")
+            params.extend(roles)
+        if status:
+            conditions.append("status = ?")
+            params.append(status)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        return where, params
+
+    def filter_employees(self, departments=None, roles=None, status=None):
+        """Employees matching the directory filters; None means no filter"""
+        where, params = self._employee_filter(departments, roles, status)
+        return schema.coerce('employees', self.query(f"SELECT * FROM employees {where} ORDER BY rowid", params))
+
+    def count_employees(self, departments=None, roles=None, status=None):
+        """Number of employees matching the directory filters"""
+        where, params = self._employee_filter(departments, roles, status)
+        return self.scalar(f"SELECT COUNT(*) FROM employees {where}", params)
+
+    def employee_page(self, departments=None, roles=None, status=None,
+                      sort_by='name', descending=False, limit=25, offset=0):
+        """One page of the filtered employee directory, sorted in SQL"""
+        if sort_by not in EMPLOYEE_SORT_COLUMNS:
+            raise ValueError(f"Cannot sort employees by {sort_by!r}")
+        where, params = self._employee_filter(departments, roles, status)
+        direction = 'DESC' if descending else 'ASC'
+        return schema.coerce('employees', self.query(
+            f"SELECT * FROM employees {where} "
+            f"ORDER BY {sort_by} {direction}, employee_id {direction} LIMIT ? OFFSET ?",
+            params + [limit, offset]
+        ))
+
+    def employee_metrics(self, employee_ids):
+        """Compliance score, assignment count and active certifications for the given employees"""
+        employee_ids = [int(e) for e in employee_ids]
+        metrics = pd.DataFrame(index=pd.Index(employee_ids, name='employee_id'))
+        if not employee_ids:
+            return metrics.assign(compliance_score=[], total_trainings=[], active_certs=[])
+
+        in_clause = _placeholders(employee_ids)
+        assignments = self.query(
+            f"SELECT employee_id, COUNT(*) AS total, SUM(status = 'Completed') AS completed "
+            f"FROM training_assignments WHERE employee_id IN ({in_clause}) GROUP BY employee_id",
+            employee_ids
+        ).set_index('employee_id')
+        certs = self.query(
+            f"SELECT employee_id, COUNT(*) AS active_certs FROM certifications "
+            f"WHERE status = 'Active' AND employee_id IN ({in_clause}) GROUP BY employee_id",
+            employee_ids
+        ).set_index('employee_id')
+
+        scores = (assignments['completed'] / assignments['total'] * 100).round(1)
+        metrics['compliance_score'] = scores.reindex(metrics.index).fillna(0)
+        metrics['total_trainings'] = assignments['total'].reindex(metrics.index).fillna(0).astype(int)
+        metrics['active_certs'] = certs['active_certs'].reindex(metrics.index).fillna(0).astype(int)
+        return metrics
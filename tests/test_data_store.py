@@ -0,0 +1,190 @@
+"""Incrementally maintained DataStore structures against a rebuild from the database"""
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_store import FACTS, KEY_COLUMNS, SKILL_LEVELS, DataStore
+from storage import TABLES, Storage
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DataStore(Storage(str(tmp_path / 'tracker.db')))
+
+
+def assert_matches_rebuild(store):
+    """Every table, index and matrix of `store` equals those of a store loaded fresh from its database"""
+    fresh = DataStore(Storage(store.storage.path, seed=False))
+    for table in list(TABLES) + [FACTS]:
+        pd.testing.assert_frame_equal(store.table(table), fresh.table(table), check_categorical=False)
+
+    for table, column in KEY_COLUMNS.items():
+        keys = fresh.table(table)[column]
+        np.testing.assert_array_equal(store._key_indexes[table].positions(keys), np.arange(len(keys)))
+        assert len(store._key_indexes[table]) == len(keys)
+
+    assignments = fresh.table('training_assignments')
+    assert store.assigned(assignments['employee_id'], assignments['training_id']).all()
+    assert len(store._assignment_pairs) == len(fresh._assignment_pairs)
+
+    for column in SKILL_LEVELS:
+        np.testing.assert_array_equal(store._skill_levels[column].levels, fresh._skill_levels[column].levels)
+
+
+def new_employee(store, name='Pat Doe', role='Manager'):
+    return store.append_new('employees', pd.DataFrame({
+        'name': [name], 'role': [role], 'department': ['Operations'], 'email': ['pat.doe@company.com'],
+        'hire_date': ['2024-05-01'], 'status': ['Active'], 'phone': ['555-0199'],
+    }))['employee_id'].iat[0]
+
+
+def test_employee_rename_patches_facts(store):
+    store.update('employees', {'employee_id': 1}, {'name': 'Jonathan Smith', 'department': 'Safety'})
+    facts = store.table(FACTS)
+    assert (facts.loc[facts['employee_id'] == 1, 'name'] == 'Jonathan Smith').all()
+    assert_matches_rebuild(store)
+
+
+def test_training_rename_patches_facts(store):
+    store.update_many('trainings', [1, 2], {'training_name': 'Safety Basics', 'compliance_type': 'Internal'})
+    facts = store.table(FACTS)
+    assert (facts.loc[facts['training_id'].isin([1, 2]), 'training_name'] == 'Safety Basics').all()
+    assert_matches_rebuild(store)
+
+
+def test_append_employee_and_skills(store):
+    employee_id = new_employee(store)
+    store.append('employee_skills', pd.DataFrame({
+        'employee_id': [employee_id, employee_id], 'skill_id': [1, 3],
+        'current_level': ['Beginner', 'Advanced'], 'required_level': ['Advanced', 'Advanced'],
+        'last_assessed': ['2024-06-01', '2024-06-01'],
+    }))
+    assert store.has_key('employees', employee_id)
+    assert_matches_rebuild(store)
+
+
+def test_assign_trainings_extends_pairs_and_facts(store):
+    employee_id = new_employee(store)
+    pairs = store.missing_mandatory_trainings(store.table('employees'))
+    added, skipped = store.assign_trainings(pairs, '2024-06-01', '2024-07-01')
+    assert added == len(pairs) > 0 and skipped == 0
+    assert store.missing_mandatory_trainings(store.table('employees')).empty
+    assert (store.table(FACTS)['employee_id'] == employee_id).any()
+    assert store.assign_trainings(pairs, '2024-06-01', '2024-07-01') == (0, len(pairs))
+    assert_matches_rebuild(store)
+
+
+def test_update_assignment_and_skill_level(store):
+    store.update('training_assignments', {'assignment_id': 2},
+                 {'status': 'Completed', 'completion_date': '2024-02-20', 'score': 88.0})
+    store.update('employee_skills', {'employee_id': 1, 'skill_id': 1}, {'current_level': 'Beginner'})
+    assert_matches_rebuild(store)
+
+
+def test_upsert_updates_and_inserts(store):
+    employees = store.table('employees')
+    records = employees[employees['employee_id'].isin([1, 2])].assign(
+        name=['Jon Smith', 'Sara Johnson'], role=['Manager', 'Manager']
+    )
+    records = pd.concat([records, employees.iloc[[0]].assign(employee_id=100, name='New Hire')])
+    assert store.upsert('employees', records) == (1, 2)
+    assert store.value('employees', 100, 'name') == 'New Hire'
+    assert_matches_rebuild(store)
+
+    assignments = store.table('training_assignments').iloc[[0]]
+    store.upsert('training_assignments', pd.concat([
+        assignments.assign(status='Overdue', completion_date=pd.NaT, score=np.nan),
+        assignments.assign(assignment_id=200, employee_id=100, training_id=3),
+    ]))
+    assert store.assigned([100], [3])[0]
+    assert_matches_rebuild(store)
+
+
+def test_upsert_duplicate_keys_last_wins(store):
+    skills = pd.DataFrame({
+        'employee_id': [1, 1, 2, 2], 'skill_id': [1, 1, 4, 4],
+        'current_level': ['Beginner', 'Intermediate', 'Beginner', 'Expert'],
+        'required_level': ['Advanced'] * 4, 'last_assessed': ['2024-06-01'] * 4,
+    })
+    # (1, 1) is a seeded assessment, (2, 4) a new one
+    assert store.upsert('employee_skills', skills) == (1, 1)
+
+    table = store.table('employee_skills').set_index(['employee_id', 'skill_id'])
+    assert table.loc[(1, 1), 'current_level'] == 'Intermediate'
+    assert table.loc[(2, 4), 'current_level'] == 'Expert'
+    assert_matches_rebuild(store)
+
+
+def test_reserve_ids_after_manual_insert(store):
+    first = store.reserve_ids('employees', 2)
+    np.testing.assert_array_equal(first, [9, 10])
+    with store.storage.connection() as conn:
+        conn.execute("INSERT INTO employees (employee_id, name) VALUES (500, 'Manual Entry')")
+    assert store.reserve_ids('employees')[0] == 501
+    assert store.storage.reserve_ids('employees', 3) == 502
+    assert store.reserve_ids('employees')[0] == 505
+
+
+def test_reserve_ids_not_reused_after_delete(store):
+    employee_id = new_employee(store)
+    assert employee_id == 9
+    with store.storage.connection() as conn:
+        conn.execute("DELETE FROM employees WHERE employee_id >= 8")
+    assert store.storage.reserve_ids('employees') == 10
+    assert Storage(store.storage.path, seed=False).reserve_ids('employees', 2) == 11
+
+
+def test_concurrent_reservations_do_not_overlap(store):
+    def reserve(count):
+        # A Storage per thread, so reservations race through separate connections and SQLite's locking
+        storage = Storage(store.storage.path, seed=False)
+        return [range(first, first + count) for first in (storage.reserve_ids('trainings', count) for _ in range(20))]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        blocks = [block for blocks in pool.map(reserve, [1, 2, 3, 5]) for block in blocks]
+    ids = [key for block in blocks for key in block]
+    assert len(ids) == len(set(ids)) == 20 * (1 + 2 + 3 + 5)
+    assert min(ids) > store.table('trainings')['training_id'].max()
+
+def test_refresh_picks_up_external_writes(store):
+    other = Storage(store.storage.path)
+    other.update('trainings', {'training_id': 1}, {'training_name': 'Renamed Elsewhere'})
+    store.update('employees', {'employee_id': 1}, {'name': 'Local Edit'})
+    assert store.refresh() == ['trainings']
+    assert store.value('trainings', 1, 'training_name') == 'Renamed Elsewhere'
+    assert store.refresh() == []
+    assert_matches_rebuild(store)
+
+
+@pytest.mark.parametrize('table, keys, values', [
+    ('employees', {'employee_id': 999}, {'name': 'Nobody'}),
+    ('employee_skills', {'employee_id': 1, 'skill_id': 99}, {'current_level': 'Expert'}),
+])
+def test_update_unknown_key_writes_nothing(store, table, keys, values):
+    versions = store.storage.table_versions()
+    with pytest.raises(KeyError):
+        store.update(table, keys, values)
+    assert store.storage.table_versions() == versions and store.versions[table] == 0
+    assert_matches_rebuild(store)
+
+
+def test_update_many_unknown_key_writes_nothing(store):
+    versions = store.storage.table_versions()
+    with pytest.raises(KeyError):
+        store.update_many('employees', [1, 999], {'status': 'Inactive'})
+    assert store.storage.table_versions() == versions and store.versions['employees'] == 0
+    assert (store.table('employees')['status'] == 'Active').all()
+    assert_matches_rebuild(store)
+
+
+def test_insert_rolls_back_with_failed_version_bump(store, monkeypatch):
+    def fail(conn, table):
+        raise sqlite3.OperationalError("disk I/O error")
+
+    monkeypatch.setattr(Storage, '_bump_version', staticmethod(fail))
+    with pytest.raises(sqlite3.OperationalError):
+        store.storage.insert('trainings', store.table('trainings').iloc[[0]].assign(training_id=99))
+    assert store.storage.scalar("SELECT COUNT(*) FROM trainings WHERE training_id = 99") == 0
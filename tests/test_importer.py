@@ -0,0 +1,129 @@
+"""Chunked bulk import: validation across chunks and all-or-nothing appends"""
+import io
+
+import pandas as pd
+import pytest
+
+import importer
+from data_store import DataStore
+from storage import Storage
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DataStore(Storage(str(tmp_path / 'tracker.db')))
+
+
+def employee_rows(count, **overrides):
+    rows = pd.DataFrame({
+        'Name': [f"Person {i}" for i in range(count)],
+        'Email': [f"person{i}@company.com" for i in range(count)],
+        'Role': 'Manager',
+        'Department': 'Operations',
+        'Hire Date': '2024-03-01',
+        'Status': '',
+    })
+    for column, values in overrides.items():
+        rows[column] = values
+    return rows
+
+
+def csv_file(rows):
+    return io.BytesIO(rows.to_csv(index=False).encode())
+
+
+def import_csv(store, table, rows, **kwargs):
+    return importer.import_file(store, table, csv_file(rows), f"{table}.csv", **kwargs)
+
+
+def errors_by_row(errors):
+    return {(row, column): error for row, column, error in errors.itertuples(index=False)}
+
+
+def test_csv_and_xlsx_give_the_same_records(tmp_path, store):
+    pytest.importorskip('openpyxl')
+    rows = employee_rows(5)
+    workbook = io.BytesIO()
+    rows.to_excel(workbook, index=False, engine='openpyxl')
+    workbook.seek(0)
+
+    from_csv, csv_errors = import_csv(store, 'employees', rows, chunk_rows=2)
+    other = DataStore(Storage(str(tmp_path / 'other.db')))
+    from_xlsx, xlsx_errors = importer.import_file(other, 'employees', workbook, 'Employees.XLSX', chunk_rows=2)
+
+    assert csv_errors.empty and xlsx_errors.empty and len(from_csv) == 5
+    pd.testing.assert_frame_equal(from_csv, from_xlsx)
+    assert (from_csv['status'] == 'Active').all() and (from_csv['phone'] == 'N/A').all()
+    assert store.table('employees')['email'].isin(rows['Email']).sum() == 5
+
+
+def test_duplicate_emails_across_chunks(store):
+    emails = ['a@company.com', 'b@company.com', 'c@company.com', 'A@Company.com', 'john.smith@company.com']
+    imported, errors = import_csv(store, 'employees', employee_rows(5, Email=emails), allow_partial=True, chunk_rows=2)
+
+    # File rows start at line 2; the repeat of line 2 sits in the second chunk
+    assert errors_by_row(errors) == {
+        (5, 'email'): 'Duplicate email in file',
+        (6, 'email'): 'An employee with this email already exists',
+    }
+    assert imported['email'].tolist() == emails[:3]
+
+
+def test_duplicate_and_existing_pairs_across_chunks(store):
+    rows = pd.DataFrame({
+        'employee_id': ['E002', 'E003', 'E005', 'E2', 'E001'],
+        'training_id': ['T002', 'T002', 'T002', 'T2', 'T001'],
+        'due_date': '2024-09-01',
+    })
+    imported, errors = import_csv(store, 'training_assignments', rows, allow_partial=True, chunk_rows=2)
+
+    assert errors_by_row(errors) == {
+        (5, 'training_id'): 'Duplicate assignment in file',
+        (6, 'training_id'): 'Training already assigned to this employee',
+    }
+    assert imported['employee_id'].tolist() == [2, 3, 5]
+    assert store.assigned([2, 3, 5], [2, 2, 2]).all()
+
+
+def test_unknown_foreign_keys(store):
+    rows = pd.DataFrame({
+        'employee_id': ['E001', 'E999'],
+        'training_id': ['T099', 'T001'],
+        'due_date': '2024-09-01',
+    })
+    imported, errors = import_csv(store, 'training_assignments', rows, allow_partial=True)
+
+    assert errors_by_row(errors) == {
+        (2, 'training_id'): 'Unknown training_id',
+        (3, 'employee_id'): 'Unknown employee_id',
+    }
+    assert imported.empty
+
+
+def test_bad_enum_values(store):
+    rows = employee_rows(4, Role=['Manager', 'Astronaut', 'Manager', 'Manager'],
+                         Department=['Operations', 'Operations', 'Moon Base', 'Operations'],
+                         Status=['', 'Active', 'Active', 'Retired'])
+    imported, errors = import_csv(store, 'employees', rows, allow_partial=True)
+
+    assert set(errors_by_row(errors)) == {(3, 'role'), (4, 'department'), (5, 'status')}
+    assert errors['error'].str.startswith('Must be one of: ').all()
+    assert imported['name'].tolist() == ['Person 0']
+
+
+def test_any_error_imports_nothing(store):
+    versions = store.storage.table_versions()
+    employees = store.table('employees')
+    rows = employee_rows(3, **{'Hire Date': ['2024-03-01', 'not a date', '2024-03-01']})
+    imported, errors = import_csv(store, 'employees', rows, chunk_rows=1)
+
+    assert imported.empty
+    assert errors_by_row(errors) == {(3, 'hire_date'): 'Invalid date, expected YYYY-MM-DD'}
+    assert store.table('employees') is employees
+    assert store.storage.table_versions() == versions
+    assert store.storage.scalar("SELECT COUNT(*) FROM employees") == len(employees)
+
+
+def test_missing_required_column(store):
+    with pytest.raises(ValueError, match="Missing required columns: hire_date"):
+        import_csv(store, 'employees', employee_rows(2).drop(columns='Hire Date'))
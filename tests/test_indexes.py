@@ -0,0 +1,33 @@
+"""Role lookups of required catalog items"""
+import numpy as np
+
+from indexes import RoleIndex
+
+
+def role_index():
+    return RoleIndex([1, 2, 3, 4, 5], [
+        'Manager', 'Senior Manager, Safety Officer', 'ALL', ' Manager ,Forklift Operator', None,
+    ])
+
+
+def test_roles_match_exactly():
+    index = role_index()
+    np.testing.assert_array_equal(index.keys_for('Manager'), [1, 3, 4])
+    np.testing.assert_array_equal(index.keys_for('Senior Manager'), [2, 3])
+    np.testing.assert_array_equal(index.keys_for('manager'), [3])
+    np.testing.assert_array_equal(index.keys_for('Safety'), [3])
+
+
+def test_all_matches_every_role_in_any_case():
+    index = RoleIndex([1, 2, 3], ['All', 'all', 'Manager, aLL'])
+    for role in ['Manager', 'Warehouse Worker', 'Role Nobody Has']:
+        np.testing.assert_array_equal(index.keys_for(role), [1, 2, 3])
+
+
+def test_required_pairs_per_owner():
+    employees, trainings = role_index().required_pairs(
+        [10, 11, 12], ['Manager', 'Senior Manager', 'Warehouse Worker']
+    )
+    assert sorted(zip(employees.tolist(), trainings.tolist())) == [
+        (10, 1), (10, 3), (10, 4), (11, 2), (11, 3), (12, 3),
+    ]
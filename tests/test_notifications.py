@@ -0,0 +1,159 @@
+"""Renewal-reminder delivery against a local aiosmtpd sink"""
+import asyncio
+import socket
+import time
+from email import message_from_bytes
+
+import pytest
+
+import notifications
+from storage import Storage
+
+controller = pytest.importorskip('aiosmtpd.controller')
+smtp = pytest.importorskip('aiosmtpd.smtp')
+
+
+class Sink:
+    """SMTP handler keeping accepted messages; can defer DATA with 4xx, refuse recipients and slow down"""
+
+    def __init__(self):
+        self.messages = []
+        self.attempts = 0
+        self.defer = 0
+        self.refuse = set()
+        self.delay = 0.0
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options):
+        if address in self.refuse:
+            return '550 No such user'
+        envelope.rcpt_tos.append(address)
+        return '250 OK'
+
+    async def handle_DATA(self, server, session, envelope):
+        self.attempts += 1
+        await asyncio.sleep(self.delay)
+        if self.defer:
+            self.defer -= 1
+            return '451 Try again later'
+        self.messages.append(message_from_bytes(envelope.content))
+        return '250 OK'
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_sink(**kwargs):
+    sink = Sink()
+    server = controller.Controller(sink, hostname='127.0.0.1', port=free_port(), **kwargs)
+    server.start()
+    return sink, server
+
+
+@pytest.fixture
+def relay():
+    sink, server = start_sink()
+    yield sink, server
+    server.stop()
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return Storage(str(tmp_path / 'tracker.db'))
+
+
+@pytest.fixture(autouse=True)
+def fast_retries(monkeypatch):
+    monkeypatch.setattr(notifications, 'RETRY_DELAY', 0.01)
+
+
+def alerts(storage):
+    """Every seeded certification in a bucket; employee 1 has two, so some digests cover several"""
+    certs = storage.read_table('certifications')
+    return {
+        'expired': certs.iloc[:4].assign(days_until_expiry=-10),
+        'expiring_30': certs.iloc[4:].assign(days_until_expiry=20),
+    }
+
+
+def send(storage, port, **kwargs):
+    return notifications.send_renewal_reminders(
+        storage, alerts(storage), storage.read_table('employees'), host='127.0.0.1', port=port, **kwargs
+    )
+
+
+def test_one_digest_per_employee_and_logged(storage, relay):
+    sink, server = relay
+    result = send(storage, server.port)
+    certs = storage.read_table('certifications')
+
+    assert result == {'sent': certs['employee_id'].nunique(), 'alerts': len(certs), 'failed': []}
+    recipients = [message['To'] for message in sink.messages]
+    assert len(recipients) == len(set(recipients)) == result['sent']
+    assert len(storage.sent_reminders()) == len(certs)
+
+    assert send(storage, server.port) == {'sent': 0, 'alerts': 0, 'failed': []}
+    assert len(sink.messages) == result['sent']
+
+
+def test_retries_4xx_replies(storage, relay):
+    sink, server = relay
+    sink.defer = 2
+    result = send(storage, server.port, connections=1)
+    assert result['failed'] == [] and result['sent'] == len(sink.messages)
+    assert sink.attempts == result['sent'] + 2
+
+
+def test_partial_failure_logs_only_delivered(storage, relay):
+    sink, server = relay
+    sink.refuse = {'john.smith@company.com'}
+    result = send(storage, server.port)
+
+    assert [employee_id for employee_id, _ in result['failed']] == [1]
+    logged = storage.query("SELECT DISTINCT employee_id FROM reminder_log")['employee_id']
+    assert 1 not in set(logged) and len(logged) == result['sent']
+
+
+def test_unreachable_relay_raises(storage):
+    with pytest.raises(notifications.DeliveryError):
+        send(storage, free_port())
+    assert storage.sent_reminders().empty
+
+
+def test_abort_keeps_in_flight_deliveries_logged(storage, relay, monkeypatch):
+    sink, server = relay
+    sink.delay = 0.2
+    connect = notifications.SMTPPool._connect
+    opened = []
+
+    def first_connection_only(pool):
+        if opened:
+            raise ConnectionRefusedError("relay full")
+        opened.append(True)
+        return connect(pool)
+
+    monkeypatch.setattr(notifications.SMTPPool, '_connect', first_connection_only)
+    with pytest.raises(notifications.DeliveryError):
+        send(storage, server.port, connections=2)
+
+    delivered = {message['To'] for message in sink.messages}
+    logged = set(storage.query("SELECT DISTINCT email FROM reminder_log")['email'])
+    assert delivered and logged == delivered
+
+
+def test_rejected_login_is_not_retried(storage, monkeypatch):
+    monkeypatch.setattr(notifications, 'RETRY_DELAY', 5.0)
+    monkeypatch.setattr(notifications, 'SMTP_USER', 'tracker')
+    monkeypatch.setattr(notifications, 'SMTP_PASSWORD', 'wrong')
+    _, server = start_sink(
+        authenticator=lambda *args: smtp.AuthResult(success=False, handled=False), auth_require_tls=False
+    )
+    try:
+        started = time.monotonic()
+        with pytest.raises(notifications.DeliveryError, match="rejected the login"):
+            send(storage, server.port)
+        assert time.monotonic() - started < notifications.RETRY_DELAY
+    finally:
+        server.stop()
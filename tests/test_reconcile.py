@@ -0,0 +1,77 @@
+"""Status reconciliation against due and expiry dates, in-process and from the CLI"""
+import pandas as pd
+import pytest
+
+import reconcile
+from data_store import DataStore
+from storage import Storage
+
+# Seeded data as of this date: assignment 2 (In Progress, due 2024-03-01) is past due while
+# assignment 6 is due that very day; certifications 1 and 6 have expired, 5 already is Expired
+AS_OF = '2024-03-12'
+
+
+@pytest.fixture
+def store(tmp_path):
+    return DataStore(Storage(str(tmp_path / 'tracker.db')))
+
+
+def statuses(storage, table, key):
+    return storage.read_table(table).set_index(key)['status'].astype(str).to_dict()
+
+
+def test_find_changes_lapsed_and_overdue(store):
+    changes = reconcile.find_changes(
+        {table: store.table(table) for table, *_ in reconcile.RULES}, today=AS_OF
+    )
+    assignments, certifications = changes['training_assignments'], changes['certifications']
+
+    assert assignments['assignment_id'].tolist() == [2]
+    assert assignments['old_status'].tolist() == ['In Progress']
+    assert (assignments['new_status'] == 'Overdue').all()
+    assert certifications['cert_id'].tolist() == [1, 6]
+    assert (certifications['new_status'] == 'Expired').all()
+
+
+def test_reconcile_updates_only_lapsed_rows(store):
+    assignments = statuses(store.storage, 'training_assignments', 'assignment_id')
+    certifications = statuses(store.storage, 'certifications', 'cert_id')
+    reconcile.reconcile(store, today=AS_OF)
+
+    assert statuses(store.storage, 'training_assignments', 'assignment_id') == {**assignments, 2: 'Overdue'}
+    assert statuses(store.storage, 'certifications', 'cert_id') == {**certifications, 1: 'Expired', 6: 'Expired'}
+    assert all(rows.empty for rows in reconcile.reconcile(store, today=AS_OF).values())
+
+
+def test_cli_applies_changes(store, capsys):
+    assert reconcile.main(['--db', store.storage.path, '--date', AS_OF]) == 0
+    assert capsys.readouterr().out.splitlines() == [
+        'training_assignments: changed 1 statuses',
+        'certifications: changed 2 statuses',
+    ]
+    assert sorted(store.refresh()) == ['certifications', 'training_assignments']
+    assert store.value('certifications', 6, 'status') == 'Expired'
+
+
+def test_cli_dry_run_writes_nothing(store, capsys):
+    path = store.storage.path
+    versions = store.storage.table_versions()
+    before = {table: store.storage.read_table(table) for table, *_ in reconcile.RULES}
+
+    assert reconcile.main(['--db', path, '--date', AS_OF, '--dry-run', '--verbose']) == 0
+    out = capsys.readouterr().out
+    assert 'training_assignments: would change 1 statuses' in out
+    assert 'certifications: would change 2 statuses' in out
+
+    assert store.storage.table_versions() == versions
+    for table, rows in before.items():
+        pd.testing.assert_frame_equal(store.storage.read_table(table), rows)
+
+
+def test_cli_missing_db_is_an_error(tmp_path, capsys):
+    path = tmp_path / 'missing.db'
+    with pytest.raises(SystemExit) as exit_info:
+        reconcile.main(['--db', str(path)])
+    assert exit_info.value.code == 2
+    assert f"database not found: {path}" in capsys.readouterr().err
+    assert not path.exists()
@@ -0,0 +1,25 @@
+"""Server-side binning behind the per-employee distribution charts"""
+import pytest
+
+from tracker import binned_counts
+
+
+def test_percent_bins_close_the_last_edge():
+    bins = binned_counts([0, 9.9, 10, 55, 99.5, 100], upper=100, suffix='%')
+    assert bins['Range'].tolist() == [f"{low}-{low + 10}%" for low in range(0, 100, 10)]
+    assert bins['Employees'].tolist() == [2, 1, 0, 0, 0, 1, 0, 0, 0, 2]
+
+
+def test_upper_defaults_to_largest_value_and_rounds_width_up():
+    bins = binned_counts([1, 4, 25], bins=4)
+    # ceil(25 / 4) = 7 wide, so the top bin reaches 28 rather than stopping short of 25
+    assert bins['Range'].tolist() == ['0-7', '7-14', '14-21', '21-28']
+    assert bins['Employees'].tolist() == [2, 0, 0, 1]
+
+
+@pytest.mark.parametrize('upper', [None, 0])
+def test_empty_and_all_zero_input(upper):
+    for values in ([], [0, 0]):
+        bins = binned_counts(values, bins=5, upper=upper)
+        assert bins['Range'].tolist() == ['0-1', '1-2', '2-3', '3-4', '4-5']
+        assert bins['Employees'].tolist() == [len(values), 0, 0, 0, 0]
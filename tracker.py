@@ -0,0 +1,456 @@
+"""Process-wide tracker state and the helpers shared by every page"""
+import functools
+import math
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime, timedelta
+
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+import reconcile
+import schema
+import transcript_pdf
+from data_store import DataStore
+from instrumentation import Timings
+from result_cache import ResultCache
+from storage import DEFAULT_DB_PATH, Storage
+
+# Storage
+@st.cache_resource
+def get_storage():
+    """Open the tracker database once per process"""
+    return Storage(DEFAULT_DB_PATH)
+
+@st.cache_resource
+def get_store():
+    """Load the tables shared by all sessions once per process"""
+    return DataStore(get_storage())
+
+@st.cache_resource
+def get_export_pool():
+    """Worker threads that build large export files, shared by all sessions"""
+    return ThreadPoolExecutor(max_workers=EXPORT_WORKERS, thread_name_prefix='export')
+
+@st.cache_resource
+def get_pdf_pool():
+    """Worker processes that render PDF transcripts in batches, shared by all sessions.
+
+    Workers are spawned rather than forked: the server is multi-threaded by
+    the time the pool starts, and a forked child can inherit a lock held by
+    another thread. Spawning also works the same on every platform.
+    """
+    return ProcessPoolExecutor(max_workers=PDF_WORKERS, mp_context=multiprocessing.get_context('spawn'))
+
+# Derived results kept by the shared result cache
+RESULT_CACHE_SIZE = 256
+
+@st.cache_resource
+def get_result_cache():
+    """Derived tables and aggregates shared by all sessions, keyed by the table versions they read"""
+    return ResultCache(
+        lambda tables: tuple(st.session_state.table_versions[table] for table in tables),
+        maxsize=RESULT_CACHE_SIZE
+    )
+
+@st.cache_resource
+def get_timings():
+    """Section and helper timings shared by all sessions, off unless TRACKER_TIMINGS=1"""
+    return Timings(enabled=os.environ.get('TRACKER_TIMINGS') == '1', log_path=os.environ.get('TRACKER_TIMINGS_LOG'))
+
+storage = get_storage()
+store = get_store()
+results = get_result_cache()
+timings = get_timings()
+
+def run_with_progress(task, text):
+    """Run task(progress) on the export pool while an st.progress bar follows it"""
+    state = {'fraction': 0.0}
+    future = get_export_pool().submit(task, lambda fraction: state.update(fraction=fraction))
+    bar = st.progress(0.0, text=text)
+    while not future.done():
+        wait([future], timeout=0.2)
+        bar.progress(state['fraction'], text=text)
+    bar.empty()
+    return future.result()
+
+def sync_session():
+    """Point this session at the shared store's latest table snapshots"""
+    version, versions, tables = store.snapshot()
+    if st.session_state.get('data_version') != version:
+        for table, df in tables.items():
+            st.session_state[table] = df
+        st.session_state.table_versions = versions
+        st.session_state.data_version = version
+
+@st.cache_resource(max_entries=1)
+def reconcile_statuses(day):
+    """Mark lapsed assignments Overdue and lapsed certifications Expired, once per day per process"""
+    return reconcile.reconcile(store, today=day)
+
+def start_session():
+    """Reconcile statuses if not done today yet and point this session at the latest data"""
+    reconcile_statuses(datetime.now().date())
+    sync_session()
+
+# Helper Functions
+def append_records(table, records):
+    """Persist new rows in the shared store and refresh this session"""
+    store.append(table, records)
+    sync_session()
+
+def upsert_records(table, records):
+    """Persist rows keyed on the table's primary key, adding new ones and overwriting the rest; returns (added, updated)"""
+    added, updated = store.upsert(table, records)
+    sync_session()
+    return added, updated
+
+def append_new_records(table, records):
+    """Persist new rows under freshly reserved primary keys and refresh this session; returns the rows with their keys"""
+    records = store.append_new(table, records)
+    sync_session()
+    return records
+
+def update_record(table, keys, values):
+    """Persist an edit to one row in the shared store and refresh this session"""
+    store.update(table, keys, values)
+    sync_session()
+
+def get_employee(employee_id):
+    """Get an employee row through the shared primary-key index"""
+    return store.row('employees', employee_id)
+
+def employee_name(employee_id):
+    """Get an employee's name from the shared per-version id -> name dict"""
+    return store.lookup('employees', 'name')[employee_id]
+
+def training_name(training_id):
+    """Get a training's name from the shared per-version id -> name dict"""
+    return store.lookup('trainings', 'training_name')[training_id]
+
+def skill_name(skill_id):
+    """Get a skill's name from the shared per-version id -> name dict"""
+    return store.lookup('skills_matrix', 'skill_name')[skill_id]
+
+def assignment_labels(assignments):
+    """{assignment_id: 'Employee - Training'} for assignment rows that carry name and training_name"""
+    labels = assignments['name'].astype(str) + ' - ' + assignments['training_name'].astype(str)
+    return dict(zip(assignments['assignment_id'].tolist(), labels.tolist()))
+
+def assign_trainings(pairs, due_date):
+    """Assign trainings to employees in bulk, skipping pairs that are already assigned"""
+    added, skipped = store.assign_trainings(pairs, datetime.now().date(), due_date)
+    sync_session()
+    return added, skipped
+
+def generate_employee_id():
+    """Reserve a new unique employee ID"""
+    return int(store.reserve_ids('employees')[0])
+
+# Export files built at the same time across all sessions
+EXPORT_WORKERS = 2
+
+def available_cpus():
+    """CPU cores this process may run on, honouring affinity masks where the platform reports them"""
+    if hasattr(os, 'sched_getaffinity'):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+# Processes rendering PDF transcripts: TRACKER_PDF_WORKERS, else one per available core
+PDF_WORKERS = int(os.environ.get('TRACKER_PDF_WORKERS') or 0) or available_cpus()
+
+def render_transcripts_zip(records, total, progress=None):
+    """ZIP of PDF transcripts for the records, rendered on the shared PDF pool.
+
+    A pool whose worker died is unusable for good, so it is shut down and
+    dropped from the resource cache; the next batch starts a fresh one.
+    """
+    pool = get_pdf_pool()
+    try:
+        return transcript_pdf.transcripts_zip(records, pool, total, PDF_WORKERS, progress=progress)
+    except BrokenProcessPool:
+        pool.shutdown(wait=False, cancel_futures=True)
+        get_pdf_pool.clear()
+        raise
+
+# Per-employee charts are drawn from this many equal-width bins, so their size does not grow with headcount
+DISTRIBUTION_BINS = 10
+
+def binned_counts(values, bins=DISTRIBUTION_BINS, upper=None, suffix=''):
+    """Count values in equal-width integer bins from 0 to `upper` (default: the largest value)"""
+    values = np.asarray(values, dtype=float)
+    if upper is None:
+        upper = values.max() if len(values) else 0
+    width = max(1, math.ceil(upper / bins))
+    edges = np.arange(0, width * bins + 1, width)
+    counts, _ = np.histogram(values, bins=edges)
+    return pd.DataFrame({
+        'Range': [f"{low}-{high}{suffix}" for low, high in zip(edges[:-1], edges[1:])],
+        'Employees': counts
+    })
+
+EXPIRY_SOON_DAYS = 30
+EXPIRY_WARNING_DAYS = 90
+
+def days_until_expiry(expiry_dates, now=None):
+    """Calculate days until expiry for a whole series of dates against a single 'now'"""
+    now = pd.Timestamp(now) if now is not None else pd.Timestamp.now()
+    return (expiry_dates - now).dt.days.astype('Int64')
+
+def expiry_bucket_masks(now=None):
+    """Boolean masks for expired, 30-day and 90-day certification buckets"""
+    days = days_until_expiry(st.session_state.certifications['expiry_date'], now)
+    expired = (days < 0).fillna(False).to_numpy(dtype=bool)
+    expiring_soon = ((days >= 0) & (days <= EXPIRY_SOON_DAYS)).fillna(False).to_numpy(dtype=bool)
+    expiring_warning = ((days > EXPIRY_SOON_DAYS) & (days <= EXPIRY_WARNING_DAYS)).fillna(False).to_numpy(dtype=bool)
+    return days, expired, expiring_soon, expiring_warning
+
+@timings.timed
+def get_expiration_counts(now=None):
+    """Count expired, expiring soon and expiring warning certifications without slicing frames"""
+    _, expired, expiring_soon, expiring_warning = expiry_bucket_masks(now)
+    return int(expired.sum()), int(expiring_soon.sum()), int(expiring_warning.sum())
+
+@timings.timed
+def get_expiration_alerts(now=None):
+    """Get certifications expiring soon"""
+    days, expired, expiring_soon, expiring_warning = expiry_bucket_masks(now)
+    df = st.session_state.certifications.assign(days_until_expiry=days.to_numpy())
+    
+    return df[expired], df[expiring_soon], df[expiring_warning]
+
+@timings.timed
+def assign_training_by_role(role):
+    """Mandatory trainings for a role, from the exact role index"""
+    trainings = st.session_state.trainings
+    return trainings[trainings['training_id'].isin(store.mandatory('trainings', role))]
+
+@timings.timed
+@results.cached('training_assignments')
+def calculate_compliance_scores():
+    """Calculate compliance scores for all employees in a single groupby pass"""
+    assignments = st.session_state.training_assignments
+    completed = assignments['status'].eq('Completed')
+    return (completed.groupby(assignments['employee_id'], sort=False).mean() * 100).round(1)
+
+@timings.timed
+@results.cached('employees')
+def employee_count():
+    """Number of employees"""
+    return storage.scalar("SELECT COUNT(*) FROM employees")
+
+@timings.timed
+@results.cached('training_assignments')
+def active_training_count():
+    """Assignments not started or in progress"""
+    return storage.count_assignments(['Not Started', 'In Progress'])
+
+@timings.timed
+@results.cached('training_assignments')
+def assignment_status_counts():
+    """Number of assignments per status"""
+    return storage.assignment_status_counts()
+
+@timings.timed
+@results.cached('employees', 'assignment_facts')
+def department_compliance():
+    """Completed share of assignments per department, 0 for departments without assignments"""
+    facts = st.session_state.assignment_facts
+    departments = st.session_state.employees['department'].drop_duplicates().astype(object)
+    rates = facts['status'].eq('Completed').groupby(facts['department'].astype(object), dropna=False).mean() * 100
+    return pd.DataFrame({
+        'Department': departments.to_numpy(),
+        'Compliance %': rates.reindex(departments).fillna(0).to_numpy()
+    })
+
+@timings.timed
+@results.cached('assignment_facts')
+def recent_completions(limit):
+    """Latest completed assignments"""
+    facts = st.session_state.assignment_facts
+    completed = facts[facts['status'].eq('Completed').to_numpy()]
+    return completed.nlargest(limit, 'completion_date')[['name', 'training_name', 'completion_date', 'score']]
+
+@timings.timed
+@results.cached('assignment_facts')
+def overdue_assignments(limit):
+    """Overdue assignments, oldest due date first"""
+    facts = st.session_state.assignment_facts
+    overdue = facts[facts['status'].eq('Overdue').to_numpy()]
+    return overdue.nsmallest(limit, 'due_date')[['name', 'training_name', 'due_date']]
+
+@timings.timed
+@results.cached('assignment_facts')
+def assignment_progress(statuses, departments, search=None):
+    """Assignments with employee and training names in the given statuses and departments.
+
+    `search` matches employee names case-insensitively. Pass statuses and
+    departments as tuples so the result can be cached.
+    """
+    facts = st.session_state.assignment_facts
+    mask = facts['status'].isin(statuses) & facts['department'].isin(departments)
+    if search:
+        mask &= facts['name'].str.contains(search, case=False, regex=False, na=False)
+    return facts[mask.to_numpy()]
+
+@timings.timed
+@results.cached('assignment_facts')
+def compliance_by_type():
+    """Assignments, completions and completion rate per compliance type"""
+    facts = st.session_state.assignment_facts
+    completed = facts['status'].eq('Completed')
+    by_type = completed.groupby(facts['compliance_type'], observed=True, sort=False).agg(['size', 'sum'])
+    return pd.DataFrame({
+        'Type': by_type.index.astype(str),
+        'Total': by_type['size'].to_numpy(),
+        'Completed': by_type['sum'].to_numpy(),
+        'Compliance Rate': (by_type['sum'] / by_type['size'] * 100).to_numpy()
+    })
+
+@timings.timed
+@results.cached('training_assignments')
+def monthly_completions():
+    """Completed assignments per completion month"""
+    assignments = st.session_state.training_assignments
+    completed = assignments[assignments['status'].eq('Completed') & assignments['completion_date'].notna()]
+    months = completed['completion_date'].dt.to_period('M').astype(str)
+    return months.groupby(months).size().rename_axis('month').reset_index(name='Completions')
+
+@timings.timed
+@results.cached('assignment_facts')
+def department_average_scores():
+    """Average assignment score per department"""
+    facts = st.session_state.assignment_facts
+    scored = facts[facts['score'].notna()]
+    return scored.groupby('department', observed=True)['score'].mean().reset_index()
+
+@timings.timed
+@results.cached('assignment_facts')
+def training_hours_by_employee():
+    """Total hours of completed training per employee"""
+    facts = st.session_state.assignment_facts
+    completed = facts[facts['status'] == 'Completed']
+    return completed.groupby(['employee_id', 'name'], sort=False)['duration_hours'].sum().reset_index()
+
+@timings.timed
+@results.cached('assignment_facts')
+def training_hours_distribution():
+    """Employees per band of completed training hours"""
+    return binned_counts(training_hours_by_employee()['duration_hours'], suffix='h')
+
+@timings.timed
+@results.cached('employees', 'training_assignments')
+def employee_compliance_scores():
+    """Compliance score of every employee, 0 for employees without assignments"""
+    employees = st.session_state.employees
+    return pd.DataFrame({
+        'employee_id': employees['employee_id'].to_numpy(),
+        'name': employees['name'].to_numpy(),
+        'score': employees['employee_id'].map(calculate_compliance_scores()).fillna(0).to_numpy()
+    })
+
+@timings.timed
+@results.cached('employees', 'training_assignments')
+def compliance_score_distribution():
+    """Employees per 10-point compliance score band"""
+    return binned_counts(employee_compliance_scores()['score'], upper=100, suffix='%')
+
+@timings.timed
+def calculate_compliance_score(employee_id, scores=None):
+    """Calculate compliance score for an employee"""
+    if scores is None:
+        scores = calculate_compliance_scores()
+    
+    if employee_id not in scores.index:
+        return 0
+    
+    return float(scores[employee_id])
+
+@timings.timed
+def generate_transcript(employee_id):
+    """Generate training transcript for an employee"""
+    employee = get_employee(employee_id)
+    assignments = st.session_state.training_assignments[
+        st.session_state.training_assignments['employee_id'] == employee_id
+    ]
+    
+    # Merge with training details
+    trainings = st.session_state.trainings
+    transcript = assignments.merge(trainings, on='training_id', how='left')
+    transcript = transcript[transcript['status'] == 'Completed']
+    
+    return employee, transcript
+
+def transcript_records(employee_ids):
+    """Function yielding PDF transcript records for the given employees, built in one pass per table.
+
+    The session's tables are captured now but only scanned when the
+    function is called, so the work can be deferred past the script run,
+    e.g. into a download button's callable, and repeated on every call.
+    """
+    return functools.partial(
+        _transcript_records,
+        employee_ids, st.session_state.employees, st.session_state.assignment_facts,
+        st.session_state.trainings, st.session_state.certifications, calculate_compliance_scores()
+    )
+
+def _transcript_records(employee_ids, employees, facts, trainings, certs, scores):
+    employees = employees[employees['employee_id'].isin(employee_ids)]
+    completed = facts[(facts['status'] == 'Completed').to_numpy() & facts['employee_id'].isin(employee_ids).to_numpy()]
+    completed = completed.merge(trainings[['training_id', 'description']], on='training_id', how='left')
+    certs = certs[certs['employee_id'].isin(employee_ids)]
+    certs = certs.assign(days_until_expiry=days_until_expiry(certs['expiry_date']))
+    yield from transcript_pdf.transcript_records(employees, completed, certs, scores)
+
+@timings.timed
+def analyze_skills_gap(employee_id):
+    """Analyze skills gap for an employee"""
+    employee_skills = st.session_state.employee_skills[
+        st.session_state.employee_skills['employee_id'] == employee_id
+    ]
+    
+    skills = st.session_state.skills_matrix
+    gap_analysis = employee_skills.merge(skills, on='skill_id', how='left')
+    
+    gap_analysis['current_level_num'] = schema.proficiency_number(gap_analysis['current_level'])
+    gap_analysis['required_level_num'] = schema.proficiency_number(gap_analysis['required_level'])
+    gap_analysis['gap'] = gap_analysis['required_level_num'] - gap_analysis['current_level_num']
+    
+    return gap_analysis
+
+@timings.timed
+def team_skill_gaps(employee_ids):
+    """Per-skill average levels and gap-status counts of a team, from the shared skill level matrices"""
+    return store.skill_gaps(employee_ids)
+
+@timings.timed
+def auto_assign_mandatory_trainings(employee_id):
+    """Automatically assign all mandatory trainings for new employee"""
+    employee = get_employee(employee_id)
+    mandatory_trainings = assign_training_by_role(employee['role'])
+    
+    added, _ = assign_trainings(
+        pd.DataFrame({'employee_id': employee_id, 'training_id': mandatory_trainings['training_id'].to_numpy()}),
+        datetime.now() + timedelta(days=30)
+    )
+    
+    return added
+
+# Page sections
+def page_section(name):
+    """Decorator making a page section an st.fragment: a widget change inside it reruns only that section.
+    
+    Each run first picks up data other sessions wrote since the last full
+    run, and is timed under `name` when timings are enabled.
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def run(*args, **kwargs):
+            sync_session()
+            with timings.section(name):
+                return func(*args, **kwargs)
+        return st.fragment(run)
+    return decorator
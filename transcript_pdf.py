@@ -0,0 +1,224 @@
+"""PDF training transcripts, one at a time or in batches on a process pool streamed into a ZIP.
+
+Records are plain Python dicts and lists, so pool workers only unpickle
+and lay out text; all table lookups happen once, up front, in the app.
+"""
+import io
+import re
+import zipfile
+from concurrent.futures import FIRST_COMPLETED, wait
+from datetime import datetime
+
+import pandas as pd
+
+import schema
+from pdf import PDFDocument, fit_text
+
+# Employees rendered per pool task: enough to amortize pickling, few enough for steady progress
+BATCH_EMPLOYEES = 200
+
+# Pool tasks in flight per worker, which bounds the records held in memory
+TASKS_PER_WORKER = 2
+
+# Page layout in points
+MARGIN = 50
+ROW_HEIGHT = 16
+FONT_SIZE = 9
+
+EMPLOYEE_FIELDS = ['employee_id', 'name', 'role', 'department', 'email', 'phone', 'hire_date']
+
+# (heading, column, width in points) of the two transcript tables
+TRAINING_COLUMNS = [
+    ('Training', 'training_name', 130),
+    ('Description', 'description', 150),
+    ('Completed', 'completion_date', 62),
+    ('Score', 'score', 40),
+    ('Hours', 'duration_hours', 35),
+    ('Compliance Type', 'compliance_type', 95),
+]
+CERT_COLUMNS = [
+    ('Certification', 'cert_name', 130),
+    ('Issuing Organization', 'issuing_organization', 130),
+    ('Issued', 'issue_date', 62),
+    ('Expires', 'expiry_date', 62),
+    ('Status', 'status', 60),
+    ('Days Left', 'days_until_expiry', 68),
+]
+
+
+def _rows_by_employee(df, columns):
+    """Display-ready rows of a frame as lists of plain values, grouped by employee_id"""
+    if df.empty:
+        return {}
+    values = schema.for_display(df[columns])
+    rows = values.astype(object).where(values.notna(), None).to_numpy().tolist()
+    positions = pd.Series(range(len(df))).groupby(df['employee_id'].to_numpy()).indices
+    return {employee_id: [rows[i] for i in index] for employee_id, index in positions.items()}
+
+
+def transcript_records(employees, trainings, certifications, scores, generated=None):
+    """One transcript record per employee row, built with a single pass over each table.
+
+    `trainings` are completed assignments with the TRAINING_COLUMNS and
+    employee_id, `certifications` the certification rows with a
+    days_until_expiry column, and `scores` compliance scores indexed by
+    employee_id.
+    """
+    generated = generated or datetime.now().strftime(schema.DATE_FORMAT)
+    completed = _rows_by_employee(trainings.sort_values('completion_date', kind='stable'),
+                                  [column for _, column, _ in TRAINING_COLUMNS])
+    certs = _rows_by_employee(certifications.sort_values('expiry_date', kind='stable'),
+                              [column for _, column, _ in CERT_COLUMNS])
+    people = schema.for_display(employees[EMPLOYEE_FIELDS]).to_dict('records')
+    for employee_id, person in zip(employees['employee_id'].tolist(), people):
+        yield {
+            'employee': person,
+            'score': float(scores.get(employee_id, 0)),
+            'trainings': completed.get(employee_id, []),
+            'certifications': certs.get(employee_id, []),
+            'generated': generated,
+        }
+
+
+class _Layout:
+    """Top-to-bottom flow over a PDFDocument, starting new pages as rows run out of room"""
+
+    def __init__(self, doc):
+        self.doc = doc
+        self.y = doc.height
+        self.header = None
+
+    def ensure(self, height):
+        if self.y + height > self.doc.height - MARGIN:
+            self.doc.add_page()
+            self.y = MARGIN
+            if self.header is not None:
+                self.table_header(self.header)
+
+    def text(self, text, size=FONT_SIZE, bold=False, gap=4):
+        self.ensure(size + gap)
+        self.y += size + gap
+        self.doc.text(MARGIN, self.y, text, size, bold)
+
+    def heading(self, text):
+        self.header = None
+        self.ensure(3 * ROW_HEIGHT)
+        self.y += 12
+        self.text(text, size=12, bold=True)
+        self.doc.line(MARGIN, self.y + 4, self.doc.width - MARGIN, self.y + 4)
+        self.y += 6
+
+    def table_header(self, columns):
+        self.doc.rect(MARGIN, self.y + 2, sum(width for _, _, width in columns), ROW_HEIGHT, gray=0.88)
+        self._cells([heading for heading, _, _ in columns], columns, bold=True)
+
+    def _cells(self, values, columns, bold=False):
+        self.y += ROW_HEIGHT
+        x = MARGIN
+        for value, (_, _, width) in zip(values, columns):
+            text = '' if value is None else (f"{value:g}" if isinstance(value, float) else str(value))
+            self.doc.text(x + 3, self.y - 3, fit_text(text, width - 6, FONT_SIZE, bold), FONT_SIZE, bold)
+            x += width
+
+    def table(self, columns, rows, empty):
+        if not rows:
+            self.text(empty)
+            return
+        self.ensure(2 * ROW_HEIGHT)
+        self.table_header(columns)
+        self.header = columns
+        for row in rows:
+            self.ensure(ROW_HEIGHT)
+            self._cells(row, columns)
+        self.header = None
+
+
+def render_transcript(record):
+    """PDF bytes of one employee's training transcript"""
+    employee = record['employee']
+    trainings = record['trainings']
+    doc = PDFDocument(title=f"Training Transcript - {employee['name']}")
+    layout = _Layout(doc)
+
+    layout.text("Training Transcript", size=20, bold=True)
+    layout.text(f"Generated {record['generated']}", size=9, gap=6)
+    layout.heading("Employee")
+    for label, value in [
+        ("Name", employee['name']), ("Employee ID", employee['employee_id']),
+        ("Role", employee['role']), ("Department", employee['department']),
+        ("Email", employee['email']), ("Phone", employee['phone']),
+        ("Hire Date", employee['hire_date']), ("Compliance Score", f"{record['score']:g}%"),
+    ]:
+        layout.text(f"{label}: {value}")
+
+    layout.heading("Completed Training History")
+    if trainings:
+        scores = [row[3] for row in trainings if row[3] is not None]
+        average = f"{sum(scores) / len(scores):.1f}" if scores else "N/A"
+        hours = sum(row[4] or 0 for row in trainings)
+        latest = max((row[2] for row in trainings if row[2]), default="N/A")
+        layout.text(f"Total Trainings: {len(trainings)}    Average Score: {average}    "
+                    f"Total Hours: {hours:g}h    Latest Completion: {latest}", bold=True, gap=8)
+    layout.table(TRAINING_COLUMNS, trainings, "No completed trainings")
+
+    layout.heading("Certifications")
+    layout.table(CERT_COLUMNS, record['certifications'], "No certifications on record")
+
+    for page in range(doc.page_count):
+        doc.text(MARGIN, doc.height - MARGIN / 2, f"{employee['name']} - {employee['employee_id']}", 8, page=page)
+        doc.text(doc.width - MARGIN - 50, doc.height - MARGIN / 2, f"Page {page + 1} of {doc.page_count}", 8, page=page)
+    return doc.to_bytes()
+
+
+def transcript_file_name(employee):
+    """File name for an employee's transcript, from its display ID ('E001') and name"""
+    name = re.sub(r'[^A-Za-z0-9]+', '_', str(employee['name'])).strip('_')
+    return f"Training_Transcript_{employee['employee_id']}_{name}.pdf"
+
+
+def render_batch(records):
+    """(file name, PDF bytes) for each record; runs in a pool worker"""
+    return [(transcript_file_name(record['employee']), render_transcript(record)) for record in records]
+
+
+def _batches(records, size):
+    batch = []
+    for record in records:
+        batch.append(record)
+        if len(batch) == size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def transcripts_zip(records, pool, total, workers, progress=None, batch_size=BATCH_EMPLOYEES):
+    """ZIP bytes holding one PDF transcript per record, rendered in batches across a process pool.
+
+    At most TASKS_PER_WORKER batches per worker are in flight, and finished
+    ones are written to the archive as they arrive, so memory holds the
+    archive plus the batches in flight; Streamlit serves the download from
+    one bytes object anyway. PDF pages are already deflated, so entries are
+    stored uncompressed. When `progress` is given it is called with the
+    fraction of `total` transcripts written.
+    """
+    batches = _batches(records, batch_size)
+    pending, written = set(), 0
+    output = io.BytesIO()
+    with zipfile.ZipFile(output, 'w', zipfile.ZIP_STORED) as archive:
+        while True:
+            while len(pending) < workers * TASKS_PER_WORKER:
+                batch = next(batches, None)
+                if batch is None:
+                    break
+                pending.add(pool.submit(render_batch, batch))
+            if not pending:
+                break
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                for name, data in future.result():
+                    archive.writestr(name, data)
+                    written += 1
+            if progress is not None and total:
+                progress(min(written / total, 1.0))
+    return output.getvalue()
@@ -0,0 +1,24 @@
+"""Tracker pages, each in its own module imported the first time the page is opened"""
+import importlib
+import os
+
+# Sidebar label -> module rendering the page
+PAGES = {
+    "🏠 Dashboard": 'views.dashboard',
+    "👥 Employee Management": 'views.employees',
+    "🚨 Certification Alerts": 'views.certifications',
+    "📚 Training Management": 'views.trainings',
+    "📈 Compliance Reporting": 'views.reporting',
+    "📜 Training Transcripts": 'views.transcripts',
+    "🎯 Skills Gap Analysis": 'views.skills',
+}
+
+# The diagnostics page switches timing and its disk log on and off for every
+# session of the server, so it is only listed when the operator opts in
+if os.environ.get('TRACKER_DIAGNOSTICS') == '1':
+    PAGES["🛠️ Diagnostics"] = 'views.diagnostics'
+
+
+def render(page):
+    """Render a page, importing its module on first use"""
+    importlib.import_module(PAGES[page]).render()
@@ -0,0 +1,184 @@
+"""Certification Alerts page: expiry alerts, new certifications and renewal reminders"""
+from datetime import datetime, timedelta
+
+import pandas as pd
+import streamlit as st
+
+import notifications
+import schema
+from tracker import (
+    append_new_records, employee_name, get_employee, get_expiration_alerts, page_section,
+    run_with_progress, storage
+)
+
+@page_section("Certification Alerts / Alerts")
+def certification_alerts():
+    expired, expiring_soon, expiring_warning = get_expiration_alerts()
+    
+    # Summary metrics
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.markdown(f"""
+        <div class="alert-card">
+            <h3>{len(expired)}</h3>
+            <p>Expired Certifications</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col2:
+        st.markdown(f"""
+        <div class="warning-card">
+            <h3>{len(expiring_soon)}</h3>
+            <p>Expiring Within 30 Days</p>
+        </div>
+        """, unsafe_allow_html=True)
+    with col3:
+        st.markdown(f"""
+        <div class="info-card">
+            <h3>{len(expiring_warning)}</h3>
+            <p>Expiring Within 90 Days</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+    
+    # Expired Certifications
+    if not expired.empty:
+        st.markdown("### ⛔ Expired Certifications")
+        for _, cert in expired.iterrows():
+            employee = get_employee(cert['employee_id'])
+            st.markdown(f"""
+            <div class="alert-card">
+                <strong>{employee['name']}</strong> - {cert['cert_name']}<br>
+                Expired: {schema.format_date(cert['expiry_date'])} ({abs(cert['days_until_expiry'])} days ago)<br>
+                Issuing Org: {cert['issuing_organization']}<br>
+                📧 {employee['email']} | 📞 {employee['phone']}
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Expiring Soon (30 days)
+    if not expiring_soon.empty:
+        st.markdown("### ⚠️ Expiring Within 30 Days")
+        for _, cert in expiring_soon.iterrows():
+            employee = get_employee(cert['employee_id'])
+            st.markdown(f"""
+            <div class="warning-card">
+                <strong>{employee['name']}</strong> - {cert['cert_name']}<br>
+                Expires: {schema.format_date(cert['expiry_date'])} ({cert['days_until_expiry']} days)<br>
+                Issuing Org: {cert['issuing_organization']}<br>
+                📧 {employee['email']} | 📞 {employee['phone']}
+            </div>
+            """, unsafe_allow_html=True)
+    
+    # Expiring Warning (30-90 days)
+    if not expiring_warning.empty:
+        st.markdown("### 📅 Expiring Within 90 Days")
+        expiring_warning_display = expiring_warning.merge(
+            st.session_state.employees[['employee_id', 'name', 'email']], on='employee_id', how='left'
+        )
+        st.dataframe(
+            schema.for_display(expiring_warning_display[[
+                'name', 'cert_name', 'expiry_date', 'days_until_expiry', 'issuing_organization', 'email'
+            ]]),
+            use_container_width=True,
+            hide_index=True
+        )
+    
+    st.markdown("---")
+
+@page_section("Certification Alerts / Add Certification")
+def add_certification():
+    # Add new certification
+    st.subheader("➕ Add New Certification")
+    
+    with st.form("add_certification_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            cert_employee = st.selectbox(
+                "Select Employee",
+                st.session_state.employees['employee_id'].tolist(),
+                format_func=employee_name
+            )
+            cert_name = st.text_input("Certification Name")
+            cert_org = st.text_input("Issuing Organization")
+        
+        with col2:
+            cert_issue_date = st.date_input("Issue Date", datetime.now())
+            cert_expiry_date = st.date_input("Expiry Date", datetime.now() + timedelta(days=365))
+            cert_status = st.selectbox("Status", schema.CERT_STATUSES)
+        
+        submit_cert = st.form_submit_button("💾 Add Certification", type="primary")
+        
+        if submit_cert:
+            if cert_name and cert_org:
+                new_cert = pd.DataFrame({
+                    'employee_id': [cert_employee],
+                    'cert_name': [cert_name],
+                    'issue_date': [cert_issue_date.strftime('%Y-%m-%d')],
+                    'expiry_date': [cert_expiry_date.strftime('%Y-%m-%d')],
+                    'status': [cert_status],
+                    'issuing_organization': [cert_org]
+                })
+                
+                append_new_records('certifications', new_cert)
+                
+                st.success("✅ Certification added successfully!")
+                st.rerun()
+            else:
+                st.error("Please fill in all fields")
+    
+    st.markdown("---")
+
+@page_section("Certification Alerts / Renewal Reminders")
+def renewal_reminders():
+    expired, expiring_soon, expiring_warning = get_expiration_alerts()
+    
+    # Bulk Email Alert
+    st.subheader("📧 Send Renewal Reminders")
+    alert_buckets = {
+        "Expired Certifications": ('expired', expired),
+        "Expiring Within 30 Days": ('expiring_30', expiring_soon),
+        "Expiring Within 90 Days": ('expiring_90', expiring_warning)
+    }
+    col1, col2 = st.columns([3, 1])
+    with col1:
+        alert_types = st.multiselect(
+            "Include Alert Types",
+            list(alert_buckets),
+            default=list(alert_buckets)
+        )
+        st.caption(
+            "Each employee gets one digest covering the selected alerts; "
+            "alerts already reminded are skipped."
+        )
+    with col2:
+        if st.button("Send Alerts", type="primary", disabled=not alert_types):
+            # The worker thread cannot read session state, so hand it the frames
+            selected_alerts = dict(alert_buckets[alert_type] for alert_type in alert_types)
+            employees = st.session_state.employees
+            try:
+                result = run_with_progress(
+                    lambda progress: notifications.send_renewal_reminders(
+                        storage, selected_alerts, employees, progress=progress
+                    ),
+                    "Sending renewal reminders..."
+                )
+            except notifications.DeliveryError as e:
+                st.error(f"❌ {e}")
+            else:
+                if result['sent']:
+                    st.success(
+                        f"✅ Renewal reminders sent to {result['sent']} employees "
+                        f"({result['alerts']} certifications)!"
+                    )
+                elif not result['failed']:
+                    st.info("All selected alerts have already been reminded")
+                if result['failed']:
+                    st.warning(f"⚠️ {len(result['failed'])} reminders could not be delivered")
+
+def render():
+    st.header("🚨 Certification Expiration Alerts")
+    
+    certification_alerts()
+    add_certification()
+    renewal_reminders()
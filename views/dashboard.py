@@ -0,0 +1,120 @@
+"""Dashboard page: headline metrics, status and department charts, recent activity"""
+import streamlit as st
+
+import schema
+from tracker import (
+    assignment_status_counts, department_compliance, employee_count, get_expiration_counts,
+    overdue_assignments, page_section, recent_completions
+)
+
+@page_section("Dashboard / Key Metrics")
+def dashboard_metrics():
+    # Key Metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    expired_count, expiring_soon_count, _ = get_expiration_counts()
+    total_employees = employee_count()
+    status_counts = assignment_status_counts()
+    completed_count = int(status_counts.get('Completed', 0))
+    total_assignments = int(status_counts.sum())
+    avg_compliance = (completed_count / total_assignments * 100) if total_assignments > 0 else 0
+    
+    with col1:
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>{total_employees}</h3>
+            <p>Total Employees</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>{expired_count}</h3>
+            <p>Expired Certs</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col3:
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>{expiring_soon_count}</h3>
+            <p>Expiring Soon (30d)</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    with col4:
+        st.markdown(f"""
+        <div class="metric-card">
+            <h3>{avg_compliance:.1f}%</h3>
+            <p>Avg Compliance</p>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("---")
+
+@page_section("Dashboard / Charts")
+def dashboard_charts():
+    import plotly.express as px
+    
+    status_counts = assignment_status_counts()
+    
+    # Charts
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Training Status Distribution")
+        fig = px.pie(
+            values=status_counts.values,
+            names=status_counts.index,
+            color_discrete_sequence=px.colors.qualitative.Set3,
+            hole=0.4
+        )
+        fig.update_traces(textposition='inside', textinfo='percent+label')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        st.subheader("Compliance by Department")
+        dept_df = department_compliance()
+        fig = px.bar(dept_df, x='Department', y='Compliance %', color='Compliance %',
+                    color_continuous_scale='RdYlGn', text='Compliance %')
+        fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
+        st.plotly_chart(fig, use_container_width=True)
+
+@page_section("Dashboard / Recent Activity")
+def dashboard_activity():
+    # Recent Activity
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("📋 Recent Completions")
+        display_recent = recent_completions(5)
+        
+        if not display_recent.empty:
+            st.dataframe(
+                schema.for_display(display_recent[['name', 'training_name', 'completion_date', 'score']]),
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.info("No recent completions")
+    
+    with col2:
+        st.subheader("⚠️ Overdue Trainings")
+        display_overdue = overdue_assignments(5)
+        
+        if not display_overdue.empty:
+            st.dataframe(
+                schema.for_display(display_overdue[['name', 'training_name', 'due_date']]),
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.success("✅ No overdue trainings!")
+
+def render():
+    st.header("📊 Compliance Dashboard")
+    
+    dashboard_metrics()
+    dashboard_charts()
+    dashboard_activity()
@@ -0,0 +1,64 @@
+"""Diagnostics page: section and helper timings, result cache and table sizes"""
+import pandas as pd
+import streamlit as st
+
+from tracker import page_section, results, timings
+
+@page_section("Diagnostics")
+def diagnostics():
+    timings.enabled = st.toggle(
+        "Record section and helper timings",
+        value=timings.enabled,
+        help="Applies to every session of this server. Start with TRACKER_TIMINGS=1 to record from launch."
+    )
+    if timings.log_path:
+        st.caption(f"Timings are also appended to {timings.log_path}")
+    
+    st.subheader("⏱️ Timings")
+    summary = timings.summary()
+    if not summary.empty:
+        st.dataframe(
+            summary.round({'p50_ms': 1, 'p95_ms': 1, 'p99_ms': 1, 'max_ms': 1}),
+            use_container_width=True,
+            hide_index=True
+        )
+        
+        with st.expander("Recent calls"):
+            st.dataframe(timings.recent(), use_container_width=True, hide_index=True)
+        
+        if st.button("🗑️ Reset Timings"):
+            timings.clear()
+            st.rerun()
+    else:
+        st.info("No timings recorded yet. Enable recording above, then use the other pages.")
+    
+    st.subheader("🗄️ Result Cache")
+    cache_stats = results.stats()
+    lookups = cache_stats['hits'] + cache_stats['misses']
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Hits", cache_stats['hits'])
+    with col2:
+        st.metric("Misses", cache_stats['misses'])
+    with col3:
+        st.metric("Hit Rate", f"{cache_stats['hits'] / lookups * 100:.1f}%" if lookups else "N/A")
+    with col4:
+        st.metric("Entries", f"{cache_stats['size']} / {cache_stats['maxsize']}")
+    
+    st.subheader("📦 Tables")
+    table_sizes = pd.DataFrame([
+        {
+            'Table': table,
+            'Rows': len(st.session_state[table]),
+            'Columns': len(st.session_state[table].columns),
+            'Memory (MB)': round(st.session_state[table].memory_usage(deep=True).sum() / 2**20, 2),
+            'Version': version
+        }
+        for table, version in st.session_state.table_versions.items()
+    ])
+    st.dataframe(table_sizes, use_container_width=True, hide_index=True)
+
+def render():
+    st.header("🛠️ Diagnostics")
+    
+    diagnostics()
@@ -0,0 +1,401 @@
+"""Employee Management page: directory, add, edit/deactivate and bulk import"""
+from datetime import datetime, timedelta
+
+import pandas as pd
+import streamlit as st
+
+import importer
+import schema
+from tracker import (
+    append_records, assign_trainings, auto_assign_mandatory_trainings, calculate_compliance_score,
+    employee_name, generate_employee_id, get_employee, page_section, storage, store, sync_session,
+    update_record
+)
+
+# Employee directory sort choices mapped to storage columns
+EMPLOYEE_SORT_OPTIONS = {
+    'Name': 'name',
+    'Employee ID': 'employee_id',
+    'Department': 'department',
+    'Role': 'role',
+    'Hire Date': 'hire_date',
+    'Status': 'status',
+}
+
+@page_section("Employee Management / Employee Directory")
+def employee_directory():
+    st.subheader("Employee Directory")
+    
+    # Filters
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        dept_filter = st.multiselect(
+            "Filter by Department",
+            ['All'] + st.session_state.employees['department'].unique().tolist(),
+            default=['All']
+        )
+    with col2:
+        role_filter = st.multiselect(
+            "Filter by Role",
+            ['All'] + st.session_state.employees['role'].unique().tolist(),
+            default=['All']
+        )
+    with col3:
+        status_filter = st.selectbox(
+            "Filter by Status",
+            ['All', 'Active', 'Inactive']
+        )
+    
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        sort_label = st.selectbox("Sort by", list(EMPLOYEE_SORT_OPTIONS))
+    with col2:
+        sort_descending = st.selectbox("Order", ['Ascending', 'Descending']) == 'Descending'
+    with col3:
+        page_size = st.selectbox("Per page", [10, 25, 50, 100], index=1)
+    with col4:
+        compact_view = st.toggle("Compact table", value=False)
+    
+    # Apply filters
+    directory_filters = dict(
+        departments=dept_filter if 'All' not in dept_filter else None,
+        roles=role_filter if 'All' not in role_filter else None,
+        status=status_filter if status_filter != 'All' else None
+    )
+    total_employees = storage.count_employees(**directory_filters)
+    page_count = max(1, -(-total_employees // page_size))
+    page = st.number_input("Page", min_value=1, max_value=page_count, value=1, step=1)
+    offset = (page - 1) * page_size
+    
+    # Load only the visible page and its metrics
+    page_employees = storage.employee_page(
+        **directory_filters,
+        sort_by=EMPLOYEE_SORT_OPTIONS[sort_label],
+        descending=sort_descending,
+        limit=page_size,
+        offset=offset
+    )
+    page_metrics = storage.employee_metrics(page_employees['employee_id'])
+    
+    if total_employees:
+        st.markdown(
+            f"### Showing {offset + 1}-{offset + len(page_employees)} "
+            f"of {total_employees} employees (page {page} of {page_count})"
+        )
+    else:
+        st.markdown("### Showing 0 employees")
+    
+    if compact_view:
+        page_table = page_employees[['employee_id', 'name', 'role', 'department', 'status', 'hire_date']].join(
+            page_metrics[['compliance_score', 'active_certs']], on='employee_id'
+        )
+        st.dataframe(
+            schema.for_display(page_table),
+            use_container_width=True,
+            hide_index=True,
+            column_config={
+                "compliance_score": st.column_config.ProgressColumn(
+                    "Compliance Score", format="%.1f%%", min_value=0, max_value=100
+                ),
+                "active_certs": st.column_config.NumberColumn("Active Certs")
+            }
+        )
+    else:
+        for emp in page_employees.itertuples(index=False):
+            metrics = page_metrics.loc[emp.employee_id]
+            
+            col1, col2, col3, col4 = st.columns([3, 2, 2, 2])
+            
+            with col1:
+                st.markdown(f"""
+                <div class="employee-card">
+                    <h4>👤 {emp.name}</h4>
+                    <p><strong>ID:</strong> {schema.format_id('employee_id', emp.employee_id)} | <strong>Status:</strong> {emp.status}</p>
+                    <p><strong>Role:</strong> {emp.role}</p>
+                    <p><strong>Department:</strong> {emp.department}</p>
+                    <p>📧 {emp.email} | 📞 {emp.phone}</p>
+                </div>
+                """, unsafe_allow_html=True)
+            
+            with col2:
+                st.metric("Compliance Score", f"{metrics['compliance_score']}%")
+            with col3:
+                st.metric("Active Certs", int(metrics['active_certs']))
+            with col4:
+                st.metric("Hire Date", schema.format_date(emp.hire_date))
+    
+    # Export employee list; the full filtered list is only built when downloaded
+    st.markdown("---")
+    col1, col2 = st.columns([4, 1])
+    with col2:
+        st.download_button(
+            label="📥 Export to CSV",
+            data=lambda: schema.for_display(storage.filter_employees(**directory_filters)).to_csv(index=False),
+            file_name=f"employees_{datetime.now().strftime('%Y%m%d')}.csv",
+            mime="text/csv"
+        )
+
+@page_section("Employee Management / Add Employee")
+def add_employee():
+    st.subheader("➕ Add New Employee")
+    
+    with st.form("add_employee_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            new_name = st.text_input("Full Name *", placeholder="John Doe")
+            new_email = st.text_input("Email *", placeholder="john.doe@company.com")
+            new_phone = st.text_input("Phone", placeholder="555-0123")
+            new_role = st.selectbox(
+                "Role *",
+                schema.ROLES
+            )
+        
+        with col2:
+            new_department = st.selectbox(
+                "Department *",
+                schema.DEPARTMENTS
+            )
+            new_hire_date = st.date_input("Hire Date *", datetime.now())
+            new_status = st.selectbox("Status", schema.EMPLOYEE_STATUSES)
+            auto_assign = st.checkbox("Auto-assign mandatory trainings", value=True)
+        
+        st.markdown("---")
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col2:
+            submit_button = st.form_submit_button("➕ Add Employee", type="primary")
+        with col3:
+            clear_button = st.form_submit_button("🔄 Clear")
+        
+        if submit_button:
+            # Validation
+            if not new_name or not new_email:
+                st.error("❌ Please fill in all required fields (marked with *)")
+            elif new_email in st.session_state.employees['email'].values:
+                st.error("❌ An employee with this email already exists!")
+            else:
+                # Generate new employee ID
+                new_emp_id = generate_employee_id()
+                
+                # Add new employee
+                new_employee = pd.DataFrame({
+                    'employee_id': [new_emp_id],
+                    'name': [new_name],
+                    'role': [new_role],
+                    'department': [new_department],
+                    'email': [new_email],
+                    'hire_date': [new_hire_date.strftime('%Y-%m-%d')],
+                    'status': [new_status],
+                    'phone': [new_phone if new_phone else 'N/A']
+                })
+                
+                append_records('employees', new_employee)
+                
+                # Auto-assign trainings if selected
+                assigned_count = 0
+                if auto_assign:
+                    assigned_count = auto_assign_mandatory_trainings(new_emp_id)
+                
+                st.success(f"""
+                ✅ Employee added successfully!
+                
+                **Employee ID:** {schema.format_id('employee_id', new_emp_id)}
+                **Name:** {new_name}
+                **Role:** {new_role}
+                **Department:** {new_department}
+                
+                {f'🎓 {assigned_count} mandatory trainings auto-assigned!' if auto_assign else ''}
+                """)
+                
+                st.balloons()
+                st.rerun()
+    
+    # Quick stats
+    st.markdown("---")
+    st.subheader("📊 Employee Statistics")
+    col1, col2, col3, col4 = st.columns(4)
+    employee_stats = storage.employee_stats()
+    
+    with col1:
+        st.metric("Total Employees", employee_stats['total'])
+    with col2:
+        st.metric("Active", employee_stats['active'])
+    with col3:
+        st.metric("Departments", employee_stats['departments'])
+    with col4:
+        st.metric("Roles", employee_stats['roles'])
+
+@page_section("Employee Management / Edit Employee")
+def edit_employee():
+    st.subheader("✏️ Edit or Deactivate Employee")
+    
+    # Select employee to edit
+    edit_employee = st.selectbox(
+        "Select Employee",
+        st.session_state.employees['employee_id'].tolist(),
+        format_func=lambda x: f"{employee_name(x)} ({schema.format_id('employee_id', x)})"
+    )
+    
+    if edit_employee:
+        employee = get_employee(edit_employee)
+        
+        st.markdown("---")
+        
+        with st.form("edit_employee_form"):
+            st.markdown(f"### Editing: {employee['name']}")
+            
+            col1, col2 = st.columns(2)
+            
+            with col1:
+                edit_name = st.text_input("Full Name", value=employee['name'])
+                edit_email = st.text_input("Email", value=employee['email'])
+                edit_phone = st.text_input("Phone", value=employee['phone'])
+                edit_role = st.selectbox(
+                    "Role",
+                    schema.ROLES,
+                    index=schema.ROLES.index(employee['role']) if employee['role'] in schema.ROLES else 0
+                )
+            
+            with col2:
+                edit_department = st.selectbox(
+                    "Department",
+                    schema.DEPARTMENTS,
+                    index=schema.DEPARTMENTS.index(employee['department'])
+                    if employee['department'] in schema.DEPARTMENTS else 0
+                )
+                edit_hire_date = st.date_input(
+                    "Hire Date",
+                    value=employee['hire_date']
+                )
+                edit_status = st.selectbox(
+                    "Status",
+                    schema.EMPLOYEE_STATUSES,
+                    index=schema.EMPLOYEE_STATUSES.index(employee['status'])
+                )
+            
+            st.markdown("---")
+            col1, col2, col3 = st.columns([2, 1, 1])
+            
+            with col2:
+                update_button = st.form_submit_button("💾 Update", type="primary")
+            with col3:
+                deactivate_button = st.form_submit_button("🔒 Deactivate", type="secondary")
+            
+            if update_button:
+                # Update employee
+                update_record('employees', {'employee_id': edit_employee}, {
+                    'name': edit_name,
+                    'email': edit_email,
+                    'phone': edit_phone,
+                    'role': edit_role,
+                    'department': edit_department,
+                    'hire_date': edit_hire_date.strftime('%Y-%m-%d'),
+                    'status': edit_status
+                })
+                
+                st.success("✅ Employee updated successfully!")
+                st.rerun()
+            
+            if deactivate_button:
+                update_record('employees', {'employee_id': edit_employee}, {'status': 'Inactive'})
+                st.warning(f"⚠️ {employee['name']} has been deactivated")
+                st.rerun()
+        
+        # Show employee details
+        st.markdown("---")
+        st.subheader("📊 Employee Overview")
+        
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            compliance = calculate_compliance_score(edit_employee)
+            st.metric("Compliance Score", f"{compliance}%")
+        
+        with col2:
+            assignments = len(st.session_state.training_assignments[
+                st.session_state.training_assignments['employee_id'] == edit_employee
+            ])
+            st.metric("Total Trainings", assignments)
+        
+        with col3:
+            certs = len(st.session_state.certifications[
+                st.session_state.certifications['employee_id'] == edit_employee
+            ])
+            st.metric("Certifications", certs)
+
+@page_section("Employee Management / Bulk Import")
+def bulk_import():
+    st.subheader("📥 Bulk Import")
+    
+    import_labels = {
+        'Employees': 'employees',
+        'Certifications': 'certifications',
+        'Training Assignments': 'training_assignments'
+    }
+    import_table = import_labels[st.selectbox("Import Into", list(import_labels))]
+    spec = importer.IMPORT_SPECS[import_table]
+    st.info(
+        f"**Required columns:** {', '.join(spec['required'])}  \n"
+        f"**Optional columns:** {', '.join(spec['optional'])}  \n"
+        "Dates use YYYY-MM-DD; employee and training IDs may be written as E001/T001 or 1."
+    )
+    
+    uploaded_file = st.file_uploader("CSV or Excel file", type=['csv', 'xlsx'])
+    col1, col2 = st.columns(2)
+    with col1:
+        allow_partial = st.checkbox("Import valid rows even if some rows have errors")
+    with col2:
+        import_auto_assign = st.checkbox(
+            "Auto-assign mandatory trainings", value=True, disabled=import_table != 'employees'
+        )
+    
+    if uploaded_file is not None and st.button("📥 Import", type="primary"):
+        try:
+            with st.spinner("Validating and importing..."):
+                imported, import_errors = importer.import_file(
+                    store, import_table, uploaded_file, uploaded_file.name, allow_partial=allow_partial
+                )
+        except ImportError:
+            st.error("Excel import requires 'openpyxl'. Install with: pip install openpyxl")
+        except ValueError as e:
+            st.error(f"❌ {e}")
+        else:
+            sync_session()
+            assigned_count = 0
+            if import_table == 'employees' and import_auto_assign and not imported.empty:
+                assigned_count, _ = assign_trainings(
+                    store.missing_mandatory_trainings(imported), datetime.now() + timedelta(days=30)
+                )
+            
+            if not imported.empty:
+                st.success(
+                    f"✅ Imported {len(imported)} records"
+                    + (f" and auto-assigned {assigned_count} mandatory trainings" if assigned_count else "")
+                )
+            if not import_errors.empty:
+                st.error(
+                    f"❌ {import_errors['row'].nunique()} rows have errors"
+                    + ("" if allow_partial else "; nothing was imported")
+                )
+                st.dataframe(import_errors, use_container_width=True, hide_index=True)
+                st.download_button(
+                    label="📥 Download Error Report",
+                    data=import_errors.to_csv(index=False),
+                    file_name=f"import_errors_{datetime.now().strftime('%Y%m%d')}.csv",
+                    mime="text/csv",
+                    on_click="ignore"
+                )
+
+def render():
+    st.header("👥 Employee Management")
+    
+    tab1, tab2, tab3, tab4 = st.tabs(["📋 View Employees", "➕ Add New Employee", "✏️ Edit/Deactivate", "📥 Bulk Import"])
+    
+    with tab1:
+        employee_directory()
+    with tab2:
+        add_employee()
+    with tab3:
+        edit_employee()
+    with tab4:
+        bulk_import()
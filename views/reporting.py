@@ -0,0 +1,286 @@
+"""Compliance Reporting page: overview, analytics and report exports"""
+from datetime import datetime, timedelta
+
+import pandas as pd
+import streamlit as st
+
+import exports
+import schema
+from tracker import (
+    assignment_status_counts, compliance_by_type, compliance_score_distribution, days_until_expiry,
+    department_average_scores, employee_compliance_scores, monthly_completions, page_section,
+    run_with_progress, timings, training_hours_by_employee, training_hours_distribution
+)
+
+# Rows shown in the export report preview
+PREVIEW_ROWS = 1000
+
+# Employees listed at each end of the per-employee rankings
+RANKING_SIZE = 10
+
+REPORT_TYPES = [
+    "Full Compliance Report",
+    "Employee Training Summary",
+    "Certification Status Report",
+    "Department Compliance Report",
+    "Overdue Trainings Report"
+]
+
+@timings.timed
+def report_source(report_type):
+    """Fact table, lookup joins and derived columns that make up an export report"""
+    facts = st.session_state.assignment_facts
+    assignment_columns = list(st.session_state.training_assignments.columns)
+    
+    def fact_columns(*columns):
+        return lambda chunk: chunk[assignment_columns + list(columns)]
+    
+    if report_type == "Full Compliance Report":
+        # Every employee and training column, so this one still joins the full lookup tables
+        return st.session_state.training_assignments, [
+            (st.session_state.employees, 'employee_id'),
+            (st.session_state.trainings, 'training_id')
+        ], None
+    
+    elif report_type == "Employee Training Summary":
+        return facts, [], fact_columns('name', 'department', 'training_name')
+    
+    elif report_type == "Certification Status Report":
+        now = pd.Timestamp.now()
+        return st.session_state.certifications, [
+            (st.session_state.employees[['employee_id', 'name', 'department']], 'employee_id')
+        ], lambda chunk: chunk.assign(days_until_expiry=days_until_expiry(chunk['expiry_date'], now))
+    
+    elif report_type == "Department Compliance Report":
+        return facts, [], fact_columns('name', 'department')
+    
+    elif report_type == "Overdue Trainings Report":
+        return facts[facts['status'] == 'Overdue'], [], fact_columns('name', 'email', 'department', 'training_name')
+    
+    raise ValueError(f"Unknown report type: {report_type}")
+
+def ranked_employees(df, column, label, key):
+    """Lowest and highest employees by `column`, with the full list rendered only on request"""
+    ranking = df[['employee_id', 'name', column]].rename(columns={'name': 'Employee', column: label})
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        st.markdown(f"**Lowest {RANKING_SIZE}**")
+        st.dataframe(schema.for_display(ranking.nsmallest(RANKING_SIZE, label)), use_container_width=True, hide_index=True)
+    with col2:
+        st.markdown(f"**Highest {RANKING_SIZE}**")
+        st.dataframe(schema.for_display(ranking.nlargest(RANKING_SIZE, label)), use_container_width=True, hide_index=True)
+    
+    if st.toggle(f"Show all {len(ranking):,} employees", key=key):
+        st.dataframe(schema.for_display(ranking.sort_values(label)), use_container_width=True, hide_index=True)
+
+@page_section("Compliance Reporting / Overview Report")
+def compliance_overview():
+    import plotly.express as px
+    
+    st.subheader("Compliance Overview")
+    
+    # Overall compliance metrics
+    col1, col2, col3, col4 = st.columns(4)
+    
+    status_counts = assignment_status_counts()
+    total_assignments = int(status_counts.sum())
+    completed = int(status_counts.get('Completed', 0))
+    overdue = int(status_counts.get('Overdue', 0))
+    in_progress = int(status_counts.get('In Progress', 0))
+    
+    with col1:
+        st.metric("Total Assignments", total_assignments)
+    with col2:
+        st.metric("Completed", completed, f"{completed/total_assignments*100:.1f}%" if total_assignments > 0 else "0%")
+    with col3:
+        st.metric("Overdue", overdue, f"{overdue/total_assignments*100:.1f}%" if total_assignments > 0 else "0%")
+    with col4:
+        st.metric("In Progress", in_progress, f"{in_progress/total_assignments*100:.1f}%" if total_assignments > 0 else "0%")
+    
+    st.markdown("---")
+    
+    # Compliance by type
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.subheader("Compliance by Type")
+        type_df = compliance_by_type()
+        fig = px.bar(
+            type_df,
+            x='Type',
+            y='Compliance Rate',
+            color='Compliance Rate',
+            color_continuous_scale='RdYlGn',
+            text='Compliance Rate'
+        )
+        fig.update_traces(texttemplate='%{text:.1f}%', textposition='outside')
+        st.plotly_chart(fig, use_container_width=True)
+    
+    with col2:
+        st.subheader("Employee Compliance Scores")
+        fig = px.bar(
+            compliance_score_distribution(),
+            x='Range',
+            y='Employees',
+            color='Range',
+            color_discrete_sequence=px.colors.diverging.RdYlGn,
+            labels={'Range': 'Compliance Score'}
+        )
+        fig.update_layout(showlegend=False)
+        st.plotly_chart(fig, use_container_width=True)
+        
+        ranked_employees(employee_compliance_scores(), 'score', 'Compliance Score', key='compliance_scores')
+    
+    # Detailed table
+    st.markdown("---")
+    st.subheader("Detailed Compliance Status")
+    
+    detailed_report = st.session_state.assignment_facts
+    
+    st.dataframe(
+        schema.for_display(detailed_report[[
+            'name', 'role', 'department', 'training_name', 'compliance_type',
+            'assigned_date', 'due_date', 'status', 'score'
+        ]]),
+        use_container_width=True,
+        hide_index=True
+    )
+
+@page_section("Compliance Reporting / Detailed Analytics")
+def compliance_analytics():
+    import plotly.express as px
+    
+    st.subheader("Detailed Analytics")
+    
+    # Time series analysis
+    st.markdown("#### Training Completion Trend")
+    
+    completions_by_month = monthly_completions()
+    
+    if not completions_by_month.empty:
+        fig = px.line(
+            completions_by_month,
+            x='month',
+            y='Completions',
+            markers=True,
+            title="Monthly Training Completions"
+        )
+        st.plotly_chart(fig, use_container_width=True)
+    else:
+        st.info("No completed trainings to display")
+    
+    # Department comparison
+    col1, col2 = st.columns(2)
+    
+    with col1:
+        st.markdown("#### Average Scores by Department")
+        dept_scores = department_average_scores()
+        
+        if not dept_scores.empty:
+            fig = px.bar(dept_scores, x='department', y='score', color='score',
+                       color_continuous_scale='Viridis',
+                       title="Average Training Scores by Department")
+            st.plotly_chart(fig, use_container_width=True)
+        else:
+            st.info("No score data available")
+    
+    with col2:
+        st.markdown("#### Training Hours by Employee")
+        training_hours_summary = training_hours_by_employee()
+        
+        if not training_hours_summary.empty:
+            fig = px.bar(training_hours_distribution(), x='Range', y='Employees',
+                       labels={'Range': 'Total Hours'},
+                       title="Total Training Hours Completed")
+            st.plotly_chart(fig, use_container_width=True)
+            
+            ranked_employees(training_hours_summary, 'duration_hours', 'Total Hours', key='training_hours')
+        else:
+            st.info("No completed training hours to display")
+
+@page_section("Compliance Reporting / Export Reports")
+def report_export():
+    st.subheader("Export Compliance Reports")
+    
+    report_type = st.selectbox(
+        "Select Report Type",
+        REPORT_TYPES
+    )
+    
+    date_range = st.date_input(
+        "Report Date Range",
+        [datetime.now() - timedelta(days=90), datetime.now()]
+    )
+    
+    compress_csv = st.checkbox("Compress CSV download (gzip)")
+    build_excel = st.checkbox(
+        "Build Excel workbook",
+        help="Written on a worker thread while a progress bar follows it; large reports take a while"
+    )
+    
+    if st.button("Generate Report", type="primary"):
+        facts, joins, derive = report_source(report_type)
+        
+        # Display preview
+        st.markdown(f"### Report Preview (first {PREVIEW_ROWS:,} rows)")
+        st.dataframe(
+            exports.preview(exports.iter_report_chunks(facts, joins, derive, chunk_rows=PREVIEW_ROWS)),
+            use_container_width=True
+        )
+        
+        # Download options; the CSV is built chunk by chunk when its button is clicked,
+        # the workbook up front when asked for, with progress shown
+        st.markdown("---")
+        col1, col2 = st.columns(2)
+        file_stem = f"{report_type.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}"
+        
+        with col1:
+            # CSV export
+            st.download_button(
+                label="📥 Download as CSV",
+                data=lambda: exports.csv_export(
+                    exports.iter_report_chunks(facts, joins, derive), compress=compress_csv
+                ),
+                file_name=f"{file_stem}.csv.gz" if compress_csv else f"{file_stem}.csv",
+                mime="application/gzip" if compress_csv else "text/csv",
+                on_click="ignore",
+                type="primary"
+            )
+        
+        with col2:
+            # Excel export
+            if not build_excel:
+                st.caption("Tick 'Build Excel workbook' before generating to download the report as Excel")
+            elif exports.excel_available():
+                output = run_with_progress(
+                    lambda progress: exports.excel_export(
+                        [('Report', exports.iter_report_chunks(facts, joins, derive))],
+                        total_rows=len(facts),
+                        progress=progress
+                    ),
+                    "Building Excel workbook..."
+                )
+                
+                st.download_button(
+                    label="📥 Download as Excel",
+                    data=output,
+                    file_name=f"{file_stem}.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    on_click="ignore",
+                    type="primary"
+                )
+            else:
+                st.warning("Excel export requires 'xlsxwriter'. Install with: pip install xlsxwriter")
+
+def render():
+    st.header("📈 Regulatory Compliance Reporting")
+    
+    tab1, tab2, tab3 = st.tabs(["Overview Report", "Detailed Analytics", "Export Reports"])
+    
+    with tab1:
+        compliance_overview()
+    with tab2:
+        compliance_analytics()
+    with tab3:
+        report_export()
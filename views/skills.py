@@ -0,0 +1,476 @@
+"""Skills Gap Analysis page: individual and team gaps and the skills matrix"""
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+import schema
+from tracker import (
+    analyze_skills_gap, append_new_records, append_records, employee_name, get_employee, page_section,
+    skill_name, team_skill_gaps, upsert_records
+)
+
+@page_section("Skills Gap Analysis / Individual Analysis")
+def individual_skills_gap():
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    st.subheader("Individual Skills Gap Analysis")
+    
+    selected_employee = st.selectbox(
+        "Select Employee",
+        st.session_state.employees['employee_id'].tolist(),
+        format_func=employee_name,
+        key="gap_employee"
+    )
+    
+    employee = get_employee(selected_employee)
+    
+    st.markdown(f"**Name:** {employee['name']} | **Role:** {employee['role']} | **Department:** {employee['department']}")
+    
+    gap_analysis = analyze_skills_gap(selected_employee)
+    
+    if not gap_analysis.empty:
+        # Visualization
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### Skills Overview")
+            fig = go.Figure()
+            
+            fig.add_trace(go.Bar(
+                name='Current Level',
+                x=gap_analysis['skill_name'],
+                y=gap_analysis['current_level_num'],
+                marker_color='lightblue'
+            ))
+            
+            fig.add_trace(go.Bar(
+                name='Required Level',
+                x=gap_analysis['skill_name'],
+                y=gap_analysis['required_level_num'],
+                marker_color='darkblue'
+            ))
+            
+            fig.update_layout(barmode='group', yaxis_title='Proficiency Level (1-4)')
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            st.markdown("#### Gap Magnitude")
+            gap_data = gap_analysis[['skill_name', 'gap']].copy()
+            gap_data['gap_status'] = gap_data['gap'].apply(
+                lambda x: 'Exceeds' if x < 0 else ('Meets' if x == 0 else 'Gap')
+            )
+            
+            fig = px.bar(
+                gap_data,
+                x='skill_name',
+                y='gap',
+                color='gap_status',
+                color_discrete_map={
+                    'Exceeds': '#51cf66',
+                    'Meets': '#ffd43b',
+                    'Gap': '#ff6b6b'
+                }
+            )
+            fig.update_layout(yaxis_title='Gap Level')
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Detaile
+        # Detailed table
+        st.markdown("---")
+        st.subheader("Detailed Skills Assessment")
+        
+        display_gap = schema.for_display(gap_analysis[[
+            'skill_name', 'current_level', 'required_level', 'last_assessed', 'gap'
+        ]])
+        display_gap['status'] = display_gap['gap'].apply(
+            lambda x: '✅ Exceeds' if x < 0 else ('✅ Meets' if x == 0 else '⚠️ Needs Improvement')
+        )
+        
+        st.dataframe(display_gap, use_container_width=True, hide_index=True)
+        
+        # Recommendations
+        gaps = gap_analysis[gap_analysis['gap'] > 0]
+        if not gaps.empty:
+            st.markdown("---")
+            st.subheader("📋 Development Recommendations")
+            
+            for _, skill in gaps.iterrows():
+                priority = '🔴 High' if skill['gap'] > 1 else '🟡 Medium'
+                st.markdown(f"""
+                <div class="warning-card">
+                    <strong>{skill['skill_name']}</strong> - Priority: {priority}<br>
+                    Current: {skill['current_level']} → Target: {skill['required_level']}<br>
+                    Gap: {skill['gap']} level(s)<br>
+                    Last Assessed: {schema.format_date(skill['last_assessed'])}<br>
+                    <em>Recommended Action: Assign relevant training programs and schedule reassessment</em>
+                </div>
+                """, unsafe_allow_html=True)
+        else:
+            st.success("✅ All skills meet or exceed requirements!")
+    else:
+        st.info("No skills data available for this employee")
+        st.markdown("---")
+        st.subheader("Add Initial Skills Assessment")
+        
+        with st.form("add_initial_skills"):
+            available_skills = st.session_state.skills_matrix['skill_id'].tolist()
+            selected_skill = st.selectbox(
+                "Select Skill",
+                available_skills,
+                format_func=skill_name
+            )
+            
+            col1, col2 = st.columns(2)
+            with col1:
+                current = st.selectbox("Current Level", schema.PROFICIENCY_LEVELS)
+            with col2:
+                required = st.selectbox("Required Level", schema.PROFICIENCY_LEVELS)
+            
+            if st.form_submit_button("Add Skill Assessment", type="primary"):
+                new_skill = pd.DataFrame({
+                    'employee_id': [selected_employee],
+                    'skill_id': [selected_skill],
+                    'current_level': [current],
+                    'required_level': [required],
+                    'last_assessed': [datetime.now().strftime('%Y-%m-%d')]
+                })
+                
+                append_records('employee_skills', new_skill)
+                st.success("✅ Skill assessment added!")
+                st.rerun()
+
+@page_section("Skills Gap Analysis / Team Analysis")
+def team_skills_gap():
+    import plotly.express as px
+    import plotly.graph_objects as go
+    
+    st.subheader("Team Skills Gap Analysis")
+    
+    # Select department or role
+    col1, col2 = st.columns(2)
+    with col1:
+        analysis_type = st.radio("Analyze by:", ["Department", "Role"])
+    
+    employees = st.session_state.employees
+    with col2:
+        column = 'department' if analysis_type == "Department" else 'role'
+        selected_group = st.selectbox(f"Select {analysis_type}", employees[column].unique())
+        team_employees = employees['employee_id'].to_numpy()[(employees[column] == selected_group).to_numpy()]
+    
+    # Aggregate team skills over the team's rows of the skill level matrices
+    skill_summary, gap_statuses = team_skill_gaps(team_employees)
+    
+    if not skill_summary.empty:
+        skill_summary = skill_summary[['skill_name', 'avg_gap', 'avg_current', 'avg_required', 'employee_count']]
+        
+        # Visualization
+        st.markdown(f"#### Skills Gap Summary - {selected_group}")
+        st.markdown(f"*Analysis of {len(team_employees)} employees | {len(skill_summary)} skills assessed*")
+        
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            fig = go.Figure()
+            
+            fig.add_trace(go.Bar(
+                name='Average Current Level',
+                x=skill_summary['skill_name'],
+                y=skill_summary['avg_current'],
+                marker_color='lightblue'
+            ))
+            
+            fig.add_trace(go.Bar(
+                name='Required Level',
+                x=skill_summary['skill_name'],
+                y=skill_summary['avg_required'],
+                marker_color='darkblue'
+            ))
+            
+            fig.update_layout(
+                barmode='group', 
+                yaxis_title='Average Proficiency Level',
+                title="Current vs Required Skills"
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            fig = px.bar(
+                skill_summary,
+                x='skill_name',
+                y='avg_gap',
+                color='avg_gap',
+                color_continuous_scale='RdYlGn_r',
+                title="Average Skills Gap"
+            )
+            fig.update_layout(yaxis_title='Gap Level')
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Gap distribution
+        st.markdown("---")
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            st.markdown("#### Gap Distribution by Status")
+            status_summary = gap_statuses[gap_statuses > 0].rename_axis('Status').reset_index(name='Count')
+            
+            fig = px.pie(
+                status_summary,
+                values='Count',
+                names='Status',
+                color='Status',
+                color_discrete_map={
+                    'Exceeds': '#51cf66',
+                    'Meets': '#ffd43b',
+                    'Needs Development': '#ff6b6b'
+                }
+            )
+            st.plotly_chart(fig, use_container_width=True)
+        
+        with col2:
+            st.markdown("#### Skills Assessment Coverage")
+            total_possible = len(team_employees) * len(st.session_state.skills_matrix)
+            total_assessed = skill_summary['employee_count'].sum()
+            coverage = (total_assessed / total_possible * 100) if total_possible > 0 else 0
+            
+            fig = go.Figure(go.Indicator(
+                mode="gauge+number+delta",
+                value=coverage,
+                domain={'x': [0, 1], 'y': [0, 1]},
+                title={'text': "Assessment Coverage"},
+                delta={'reference': 100},
+                gauge={
+                    'axis': {'range': [None, 100]},
+                    'bar': {'color': "darkblue"},
+                    'steps': [
+                        {'range': [0, 50], 'color': "lightgray"},
+                        {'range': [50, 80], 'color': "gray"}
+                    ],
+                    'threshold': {
+                        'line': {'color': "red", 'width': 4},
+                        'thickness': 0.75,
+                        'value': 90
+                    }
+                }
+            ))
+            st.plotly_chart(fig, use_container_width=True)
+        
+        # Detailed table
+        st.markdown("---")
+        st.subheader("Detailed Skills Summary")
+        st.dataframe(skill_summary, use_container_width=True, hide_index=True)
+        
+        # Recommendations
+        st.markdown("---")
+        st.subheader("🎯 Team Development Priorities")
+        
+        priority_skills = skill_summary[skill_summary['avg_gap'] > 0.5].sort_values('avg_gap', ascending=False)
+        
+        if not priority_skills.empty:
+            for _, skill in priority_skills.iterrows():
+                priority = '🔴 High' if skill['avg_gap'] > 1.5 else ('🟡 Medium' if skill['avg_gap'] > 1 else '🟢 Low')
+                st.markdown(f"""
+                <div class="warning-card">
+                    <strong>{skill['skill_name']}</strong> - Priority: {priority}<br>
+                    Average Gap: {skill['avg_gap']:.2f} levels<br>
+                    Current Avg: {skill['avg_current']:.1f} | Target: {skill['avg_required']:.1f}<br>
+                    Employees Assessed: {skill['employee_count']}<br>
+                    <em>Recommended Action: Develop training program for {selected_group}</em>
+                </div>
+                """, unsafe_allow_html=True)
+        else:
+            st.success("✅ Team meets all required skill levels!")
+        
+        # Export team analysis
+        st.markdown("---")
+        csv = skill_summary.to_csv(index=False)
+        st.download_button(
+            label="📥 Export Team Analysis",
+            data=csv,
+            file_name=f"Skills_Gap_Analysis_{selected_group.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.csv",
+            mime="text/csv"
+        )
+    else:
+        st.info("No skills data available for this team")
+        st.warning("Please add skill assessments for employees in this group")
+
+@page_section("Skills Gap Analysis / Skills Matrix")
+def skills_matrix_overview():
+    st.subheader("Skills Matrix Management")
+    
+    # Display current skills matrix
+    st.markdown("#### Defined Skills")
+    st.dataframe(
+        schema.for_display(st.session_state.skills_matrix),
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    # Statistics
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.metric("Total Skills", len(st.session_state.skills_matrix))
+    with col2:
+        assessments = len(st.session_state.employee_skills)
+        st.metric("Total Assessments", assessments)
+    with col3:
+        avg_assessments = assessments / len(st.session_state.employees) if len(st.session_state.employees) > 0 else 0
+        st.metric("Avg per Employee", f"{avg_assessments:.1f}")
+    with col4:
+        if not st.session_state.employee_skills.empty:
+            avg_level = schema.proficiency_number(st.session_state.employee_skills['current_level']).mean()
+            st.metric("Avg Skill Level", f"{avg_level:.1f}/4")
+        else:
+            st.metric("Avg Skill Level", "N/A")
+
+@page_section("Skills Gap Analysis / Add Skill")
+def add_skill():
+    # Add new skill
+    st.markdown("---")
+    st.subheader("Add New Skill")
+    
+    with st.form("add_skill_form"):
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            new_skill_name = st.text_input("Skill Name *")
+            new_skill_roles = st.multiselect(
+                "Required for Roles *",
+                ['All'] + st.session_state.employees['role'].unique().tolist(),
+                key="new_skill_roles"
+            )
+        
+        with col2:
+            st.markdown("**Default Proficiency Levels:**")
+            st.info("• Beginner\n• Intermediate\n• Advanced\n• Expert")
+        
+        if st.form_submit_button("Add Skill", type="primary"):
+            if new_skill_name and new_skill_roles:
+                new_skill = pd.DataFrame({
+                    'skill_name': [new_skill_name],
+                    'required_for_roles': [','.join(new_skill_roles)],
+                    'proficiency_levels': ['Beginner,Intermediate,Advanced,Expert']
+                })
+                append_new_records('skills_matrix', new_skill)
+                st.success(f"✅ Skill '{new_skill_name}' added successfully!")
+                st.rerun()
+            else:
+                st.error("Please fill in all required fields")
+
+@page_section("Skills Gap Analysis / Assess Skills")
+def assess_skills():
+    # Assess employee skills
+    st.markdown("---")
+    st.subheader("Assess Employee Skills")
+    
+    with st.form("assess_skills_form"):
+        col1, col2, col3 = st.columns(3)
+        
+        with col1:
+            assess_employee = st.selectbox(
+                "Select Employee",
+                st.session_state.employees['employee_id'].tolist(),
+                format_func=employee_name,
+                key="assess_employee"
+            )
+        
+        with col2:
+            assess_skill = st.selectbox(
+                "Select Skill",
+                st.session_state.skills_matrix['skill_id'].tolist(),
+                format_func=skill_name
+            )
+        
+        with col3:
+            col_a, col_b = st.columns(2)
+            with col_a:
+                current_level = st.selectbox(
+                    "Current Level",
+                    schema.PROFICIENCY_LEVELS
+                )
+            with col_b:
+                required_level = st.selectbox(
+                    "Required Level",
+                    schema.PROFICIENCY_LEVELS,
+                    index=2  # Default to Advanced
+                )
+        
+        if st.form_submit_button("Save Assessment", type="primary"):
+            # Update the existing assessment or add a new one
+            assessment = pd.DataFrame({
+                'employee_id': [assess_employee],
+                'skill_id': [assess_skill],
+                'current_level': [current_level],
+                'required_level': [required_level],
+                'last_assessed': [datetime.now().strftime('%Y-%m-%d')]
+            })
+            added, _ = upsert_records('employee_skills', assessment)
+            st.success("✅ Assessment saved!" if added else "✅ Assessment updated!")
+            st.rerun()
+
+@page_section("Skills Gap Analysis / Bulk Assessment")
+def bulk_skills_assessment():
+    # Bulk assessment
+    st.markdown("---")
+    st.subheader("Bulk Skills Assessment")
+    
+    with st.expander("📊 Assess Multiple Employees"):
+        bulk_skill = st.selectbox(
+            "Select Skill for Bulk Assessment",
+            st.session_state.skills_matrix['skill_id'].tolist(),
+            format_func=skill_name,
+            key="bulk_skill"
+        )
+        
+        bulk_employees = st.multiselect(
+            "Select Employees",
+            st.session_state.employees['employee_id'].tolist(),
+            format_func=employee_name
+        )
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            bulk_current = st.selectbox(
+                "Current Level (same for all)",
+                schema.PROFICIENCY_LEVELS,
+                key="bulk_current"
+            )
+        with col2:
+            bulk_required = st.selectbox(
+                "Required Level (same for all)",
+                schema.PROFICIENCY_LEVELS,
+                index=2,
+                key="bulk_required"
+            )
+        
+        if st.button("Apply Bulk Assessment", type="primary"):
+            if bulk_employees:
+                assessments = pd.DataFrame({
+                    'employee_id': bulk_employees,
+                    'skill_id': bulk_skill,
+                    'current_level': bulk_current,
+                    'required_level': bulk_required,
+                    'last_assessed': datetime.now().strftime('%Y-%m-%d')
+                })
+                added, updated = upsert_records('employee_skills', assessments)
+                
+                st.success(f"✅ Bulk assessment complete!\nAdded: {added} | Updated: {updated}")
+                st.rerun()
+            else:
+                st.warning("Please select at least one employee")
+
+def render():
+    st.header("🎯 Skills Gap Analysis")
+    
+    tab1, tab2, tab3 = st.tabs(["Individual Analysis", "Team Analysis", "Skills Matrix"])
+    
+    with tab1:
+        individual_skills_gap()
+    with tab2:
+        team_skills_gap()
+    with tab3:
+        skills_matrix_overview()
+        add_skill()
+        assess_skills()
+        bulk_skills_assessment()
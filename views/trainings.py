@@ -0,0 +1,245 @@
+"""Training Management page: assignment, progress tracking and the training catalog"""
+from datetime import datetime, timedelta
+
+import pandas as pd
+import streamlit as st
+
+import schema
+from tracker import (
+    append_new_records, assign_training_by_role, assign_trainings, assignment_labels, assignment_progress,
+    employee_name, page_section, store, training_name, update_record
+)
+
+@page_section("Training Management / Individual Assignment")
+def individual_assignment():
+    st.markdown("#### Individual Assignment")
+    selected_employee = st.selectbox(
+        "Select Employee",
+        st.session_state.employees['employee_id'].tolist(),
+        format_func=employee_name
+    )
+    
+    employee_role = store.value('employees', selected_employee, 'role')
+    
+    # Show mandatory trainings for role
+    mandatory = assign_training_by_role(employee_role)
+    
+    st.info(f"**Role:** {employee_role}")
+    st.write("**Mandatory Trainings:**")
+    for _, training in mandatory.iterrows():
+        st.write(f"• {training['training_name']}")
+    
+    selected_training = st.selectbox(
+        "Select Training",
+        st.session_state.trainings['training_id'].tolist(),
+        format_func=training_name
+    )
+    
+    due_date = st.date_input("Due Date", datetime.now() + timedelta(days=30))
+    
+    if st.button("Assign Training", type="primary"):
+        added, _ = assign_trainings(
+            pd.DataFrame({'employee_id': [selected_employee], 'training_id': [selected_training]}),
+            due_date
+        )
+        
+        if not added:
+            st.warning("⚠️ This training is already assigned to this employee")
+        else:
+            st.success("✅ Training assigned successfully!")
+            st.rerun()
+
+@page_section("Training Management / Role-Based Assignment")
+def role_assignment():
+    st.markdown("#### Role-Based Bulk Assignment")
+    selected_role = st.selectbox(
+        "Select Role",
+        st.session_state.employees['role'].unique()
+    )
+    
+    role_employees = st.session_state.employees[
+        st.session_state.employees['role'] == selected_role
+    ]
+    st.info(f"**{len(role_employees)} employees** in this role")
+    
+    bulk_training = st.selectbox(
+        "Select Training for Bulk Assignment",
+        st.session_state.trainings['training_id'].tolist(),
+        format_func=training_name,
+        key="bulk_training"
+    )
+    
+    bulk_due_date = st.date_input(
+        "Due Date for All",
+        datetime.now() + timedelta(days=30),
+        key="bulk_due"
+    )
+    
+    if st.button("Assign to All in Role", type="primary"):
+        added, skipped = assign_trainings(
+            pd.DataFrame({'employee_id': role_employees['employee_id'].to_numpy(), 'training_id': bulk_training}),
+            bulk_due_date
+        )
+        
+        if added:
+            st.success(f"✅ Training assigned to {added} employees!" + 
+                     (f"\n⚠️ {skipped} already had this training" if skipped > 0 else ""))
+            st.rerun()
+        else:
+            st.warning("⚠️ All employees in this role already have this training assigned")
+
+@page_section("Training Management / Mandatory Coverage")
+def mandatory_coverage():
+    st.markdown("#### Mandatory Training Coverage")
+    active_employees = st.session_state.employees[
+        st.session_state.employees['status'] == 'Active'
+    ]
+    missing_mandatory = store.missing_mandatory_trainings(active_employees)
+    st.info(
+        f"**{len(missing_mandatory)} mandatory trainings** not yet assigned across "
+        f"{missing_mandatory['employee_id'].nunique()} active employees"
+    )
+    
+    if st.button("Assign All Missing Mandatory Trainings", disabled=missing_mandatory.empty):
+        added, _ = assign_trainings(missing_mandatory, datetime.now() + timedelta(days=30))
+        st.success(f"✅ Assigned {added} mandatory trainings!")
+        st.rerun()
+
+@page_section("Training Management / Track Progress")
+def training_progress():
+    st.subheader("Training Progress Tracking")
+    
+    # Filters
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        status_filter = st.multiselect(
+            "Filter by Status",
+            st.session_state.training_assignments['status'].unique(),
+            default=st.session_state.training_assignments['status'].unique()
+        )
+    with col2:
+        dept_filter = st.multiselect(
+            "Filter by Department",
+            st.session_state.employees['department'].unique(),
+            default=st.session_state.employees['department'].unique()
+        )
+    with col3:
+        search = st.text_input("Search Employee")
+    
+    # Display assignments
+    # Filtered from the assignment view, which already carries employee and training columns
+    assignments_display = assignment_progress(tuple(status_filter), tuple(dept_filter), search)
+    
+    st.dataframe(
+        schema.for_display(assignments_display[[
+            'assignment_id', 'name', 'department', 'training_name', 'assigned_date',
+            'due_date', 'completion_date', 'status', 'score'
+        ]]),
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    # Update status section
+    st.markdown("---")
+    st.subheader("Update Training Status")
+    
+    if not assignments_display.empty:
+        col1, col2, col3 = st.columns(3)
+        with col1:
+            update_assignment = st.selectbox(
+                "Select Assignment to Update",
+                assignments_display['assignment_id'].tolist(),
+                format_func=assignment_labels(assignments_display).get
+            )
+        
+        with col2:
+            new_status = st.selectbox(
+                "New Status",
+                schema.ASSIGNMENT_STATUSES
+            )
+        
+        with col3:
+            score = st.number_input("Score (if completed)", 0, 100, 0)
+        
+        if st.button("Update Status", type="primary"):
+            status_update = {'status': new_status}
+            if new_status == 'Completed':
+                status_update['completion_date'] = datetime.now().strftime('%Y-%m-%d')
+                status_update['score'] = float(score)
+            
+            update_record('training_assignments', {'assignment_id': update_assignment}, status_update)
+            
+            st.success("✅ Status updated successfully!")
+            st.rerun()
+    else:
+        st.info("No assignments match the current filters")
+
+@page_section("Training Management / Manage Trainings")
+def training_catalog():
+    st.subheader("Manage Training Catalog")
+    
+    # Display existing trainings
+    st.dataframe(
+        schema.for_display(st.session_state.trainings),
+        use_container_width=True,
+        hide_index=True
+    )
+    
+    # Add new training
+    st.markdown("---")
+    st.subheader("Add New Training")
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        new_training_name = st.text_input("Training Name")
+        new_description = st.text_area("Description")
+        new_duration = st.number_input("Duration (hours)", 1, 40, 4)
+    
+    with col2:
+        new_required_roles = st.multiselect(
+            "Required for Roles",
+            ['All'] + st.session_state.employees['role'].unique().tolist()
+        )
+        new_frequency = st.selectbox(
+            "Frequency",
+            schema.FREQUENCIES
+        )
+        new_compliance_type = st.selectbox(
+            "Compliance Type",
+            schema.COMPLIANCE_TYPES
+        )
+    
+    if st.button("Add Training", type="primary"):
+        if new_training_name:
+            new_training = pd.DataFrame({
+                'training_name': [new_training_name],
+                'description': [new_description],
+                'duration_hours': [new_duration],
+                'required_for_roles': [','.join(new_required_roles)],
+                'frequency': [new_frequency],
+                'compliance_type': [new_compliance_type]
+            })
+            append_new_records('trainings', new_training)
+            st.success("✅ Training added successfully!")
+            st.rerun()
+        else:
+            st.error("Please enter a training name")
+
+def render():
+    st.header("📚 Training Management")
+    
+    tab1, tab2, tab3 = st.tabs(["Assign Training", "Track Progress", "Manage Trainings"])
+    
+    with tab1:
+        st.subheader("Assign Training to Employees")
+        
+        col1, col2 = st.columns(2)
+        with col1:
+            individual_assignment()
+        with col2:
+            role_assignment()
+            mandatory_coverage()
+    with tab2:
+        training_progress()
+    with tab3:
+        training_catalog()
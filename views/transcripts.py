@@ -0,0 +1,208 @@
+"""Training Transcripts page: per-employee training history, transcript downloads and batch PDF export"""
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+import pandas as pd
+import streamlit as st
+
+import exports
+import schema
+import transcript_pdf
+from tracker import (
+    PDF_WORKERS, calculate_compliance_score, days_until_expiry, employee_name, generate_transcript,
+    page_section, render_transcripts_zip, run_with_progress, transcript_records
+)
+
+@page_section("Training Transcripts / Transcript")
+def training_transcript():
+    # Select employee
+    selected_employee = st.selectbox(
+        "Select Employee",
+        st.session_state.employees['employee_id'].tolist(),
+        format_func=employee_name
+    )
+    
+    employee, transcript = generate_transcript(selected_employee)
+    
+    # Employee Information Header
+    st.markdown("---")
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        st.markdown(f"**Name:** {employee['name']}")
+        st.markdown(f"**Employee ID:** {schema.format_id('employee_id', employee['employee_id'])}")
+    with col2:
+        st.markdown(f"**Role:** {employee['role']}")
+        st.markdown(f"**Department:** {employee['department']}")
+    with col3:
+        compliance_score = calculate_compliance_score(selected_employee)
+        st.markdown(f"**Compliance Score:** {compliance_score}%")
+        st.markdown(f"**Hire Date:** {schema.format_date(employee['hire_date'])}")
+    with col4:
+        st.markdown(f"**Email:** {employee['email']}")
+        st.markdown(f"**Phone:** {employee['phone']}")
+    
+    st.markdown("---")
+    
+    
+    # Training History
+    st.subheader("Completed Training History")
+    
+    if not transcript.empty:
+        # Summary metrics
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Total Trainings", len(transcript))
+        with col2:
+            avg_score = transcript['score'].mean()
+            st.metric("Average Score", f"{avg_score:.1f}" if pd.notna(avg_score) else "N/A")
+        with col3:
+            total_hours = transcript['duration_hours'].sum()
+            st.metric("Total Hours", f"{total_hours}h")
+        with col4:
+            latest = transcript['completion_date'].max()
+            st.metric("Latest Completion", schema.format_date(latest))
+        
+        st.markdown("---")
+        
+        # Detailed transcript
+        display_transcript = schema.for_display(transcript[[
+            'training_name', 'description', 'completion_date', 'score',
+            'duration_hours', 'compliance_type'
+        ]])
+        display_transcript.columns = [
+            'Training', 'Description', 'Completion Date', 'Score',
+            'Hours', 'Compliance Type'
+        ]
+        
+        st.dataframe(display_transcript, use_container_width=True, hide_index=True)
+        
+        # Certifications
+        st.markdown("---")
+        st.subheader("Certifications")
+        
+        employee_certs = st.session_state.certifications[
+            st.session_state.certifications['employee_id'] == selected_employee
+        ].copy()
+        
+        if not employee_certs.empty:
+            employee_certs['days_until_expiry'] = days_until_expiry(employee_certs['expiry_date'])
+            employee_certs = schema.for_display(employee_certs)
+            st.dataframe(
+                employee_certs[['cert_name', 'issue_date', 'expiry_date', 'status', 'issuing_organization', 'days_until_expiry']],
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.info("No certifications on record")
+        
+        # Export transcript
+        st.markdown("---")
+        col1, col2, col3 = st.columns([2, 1, 1])
+        with col2:
+            # The transcript record is only built and rendered when the button is clicked
+            records = transcript_records([selected_employee])
+            st.download_button(
+                label="📥 Download as PDF",
+                data=lambda: transcript_pdf.render_transcript(next(records())),
+                file_name=transcript_pdf.transcript_file_name({
+                    'employee_id': schema.format_id('employee_id', employee['employee_id']),
+                    'name': employee['name']
+                }),
+                mime="application/pdf",
+                on_click="ignore",
+                type="primary"
+            )
+        with col3:
+            # The workbook is only built when the button is clicked
+            if exports.excel_available():
+                # Employee info sheet
+                emp_info = pd.DataFrame([{
+                    'Name': employee['name'],
+                    'Employee ID': schema.format_id('employee_id', employee['employee_id']),
+                    'Role': employee['role'],
+                    'Department': employee['department'],
+                    'Compliance Score': f"{compliance_score}%",
+                    'Generated Date': datetime.now().strftime('%Y-%m-%d')
+                }])
+                sheets = [('Employee Info', [emp_info]), ('Training History', [display_transcript])]
+                
+                # Certifications
+                if not employee_certs.empty:
+                    sheets.append(('Certifications', [employee_certs]))
+                
+                st.download_button(
+                    label="📄 Download Excel",
+                    data=lambda: exports.excel_export(sheets),
+                    file_name=f"Training_Transcript_{employee['name'].replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.xlsx",
+                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                    on_click="ignore",
+                    type="primary"
+                )
+            else:
+                st.download_button(
+                    label="📄 Download CSV",
+                    data=lambda: display_transcript.to_csv(index=False),
+                    file_name=f"Training_Transcript_{employee['name'].replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.csv",
+                    mime="text/csv",
+                    on_click="ignore",
+                    type="primary"
+                )
+    else:
+        st.info("No completed trainings for this employee")
+        
+        # Show pending trainings
+        st.markdown("---")
+        st.subheader("Pending Trainings")
+        pending = st.session_state.assignment_facts[
+            (st.session_state.assignment_facts['employee_id'] == selected_employee) &
+            (st.session_state.assignment_facts['status'] != 'Completed')
+        ]
+        
+        if not pending.empty:
+            st.dataframe(
+                schema.for_display(pending[['training_name', 'assigned_date', 'due_date', 'status']]),
+                use_container_width=True,
+                hide_index=True
+            )
+        else:
+            st.info("No pending trainings")
+
+@page_section("Training Transcripts / Batch PDF Export")
+def batch_transcripts():
+    st.markdown("---")
+    st.subheader("Batch PDF Transcripts")
+    
+    employees = st.session_state.employees
+    scope = st.selectbox(
+        "Employees",
+        ["All Employees"] + sorted(employees['department'].dropna().unique().tolist()),
+        key="batch_transcript_scope"
+    )
+    if scope != "All Employees":
+        employees = employees[employees['department'] == scope]
+    st.caption(f"{len(employees):,} transcripts, rendered across {PDF_WORKERS} worker processes into one ZIP")
+    
+    if st.button("Generate Transcripts ZIP", type="primary", disabled=employees.empty):
+        records = transcript_records(employees['employee_id'])
+        try:
+            output = run_with_progress(
+                lambda progress: render_transcripts_zip(records(), len(employees), progress=progress),
+                "Rendering transcripts..."
+            )
+        except BrokenProcessPool:
+            st.error("A PDF worker process stopped unexpectedly. Please generate the ZIP again.")
+            return
+        st.download_button(
+            label="📦 Download Transcripts ZIP",
+            data=output,
+            file_name=f"Training_Transcripts_{scope.replace(' ', '_')}_{datetime.now().strftime('%Y%m%d')}.zip",
+            mime="application/zip",
+            on_click="ignore",
+            type="primary"
+        )
+
+def render():
+    st.header("📜 Training Transcripts")
+    
+    training_transcript()
+    batch_transcripts()